@@ -0,0 +1,13 @@
+"""
+URL configuration of the async-only mode (`ASYNC_ONLY=1`), which serves the async views of `quiz.async_views` at the
+same paths as their DRF counterparts, e.g. for ASGI workers dedicated to quizzees taking exams.
+"""
+
+from django.urls import include, path
+
+from quiz import metrics
+
+urlpatterns = [
+    path("metrics", metrics.view, name="metrics"),
+    path("quizzes/", include("quiz.async_urls")),
+]
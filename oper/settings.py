@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/4.0/ref/settings/
 import os
 from pathlib import Path
 
+from .databases import parse_database_url
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -44,6 +46,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "quiz.metrics.MetricsMiddleware",
+    "quiz.timing.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -53,7 +57,10 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
-ROOT_URLCONF = "oper.urls"
+# Only serve the async views (see quiz.async_views), e.g. from ASGI workers dedicated to quizzees taking exams.
+ASYNC_ONLY = os.getenv("ASYNC_ONLY") == "1"
+
+ROOT_URLCONF = "oper.async_urls" if ASYNC_ONLY else "oper.urls"
 
 TEMPLATES = [
     {
@@ -77,13 +84,37 @@ WSGI_APPLICATION = "oper.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.0/ref/settings/#databases
 
+# Seconds during which connections are reused across requests (0 closes them at the end of each request). Django
+# advises against persistent connections under ASGI, so ASYNC_ONLY workers close them by default (use
+# DATABASE_POOL_SIZE instead).
+DATABASE_CONN_MAX_AGE = int(
+    os.getenv("DATABASE_CONN_MAX_AGE", "0" if ASYNC_ONLY else "60")
+)
+
+# Maximum size of the connection pool of each process (PostgreSQL only, 0 disables pooling).
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "0"))
+
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": parse_database_url(
+        os.getenv("DATABASE_URL", "sqlite:///db.sqlite3"),
+        base_dir=BASE_DIR,
+        conn_max_age=DATABASE_CONN_MAX_AGE,
+        pool_size=DATABASE_POOL_SIZE,
+    )
 }
 
+# Read-only requests are served from the replica, if any (see quiz.db_routers).
+if os.getenv("DATABASE_REPLICA_URL"):
+    DATABASES["replica"] = parse_database_url(
+        os.environ["DATABASE_REPLICA_URL"],
+        base_dir=BASE_DIR,
+        conn_max_age=DATABASE_CONN_MAX_AGE,
+        pool_size=DATABASE_POOL_SIZE,
+    )
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+
+DATABASE_ROUTERS = ["quiz.db_routers.ReplicaRouter"]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
@@ -129,20 +160,46 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
-print(os.getenv("DATABASE_URL"))
-
-
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.BasicAuthentication",
+        "quiz.authentication.CachedBasicAuthentication",
+        "quiz.authentication.SignedTokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
-    ]
+    ],
+    "PAGE_SIZE": int(os.getenv("PAGE_SIZE", "100")),
 }
 
+# Seconds during which verified credentials/tokens are trusted without hitting the database (see quiz.authentication).
+AUTH_CACHE_TIMEOUT = int(os.getenv("AUTH_CACHE_TIMEOUT", "60"))
+
+AUTH_TOKEN_MAX_AGE = int(os.getenv("AUTH_TOKEN_MAX_AGE", str(24 * 60 * 60)))
+
+# Write-behind buffering of answers (see quiz.answer_buffer): answers are inserted in batches of up to
+# ANSWER_BUFFER_SIZE answers, at least every ANSWER_BUFFER_INTERVAL seconds.
+ANSWER_BUFFER = os.getenv("ANSWER_BUFFER") == "1"
+
+ANSWER_BUFFER_SIZE = int(os.getenv("ANSWER_BUFFER_SIZE", "500"))
+
+ANSWER_BUFFER_INTERVAL = float(os.getenv("ANSWER_BUFFER_INTERVAL", "0.5"))
+
+# Locked by the process which buffers answers: the buffer refuses to run in more than one process.
+ANSWER_BUFFER_LOCK = os.getenv(
+    "ANSWER_BUFFER_LOCK", os.path.join(BASE_DIR, "answer-buffer.lock")
+)
+
+# Per-request timing breakdown, sent as a Server-Timing header and logged by the quiz.timing logger. Off by default:
+# the header discloses the server's internals (phases, query counts) to every client.
+SERVER_TIMING = os.getenv("SERVER_TIMING", "0") == "1"
+
+# Directory of the files where every process records its request metrics, served by /metrics (see quiz.metrics).
+# Metrics are disabled unless it is set.
+METRICS_DIR = os.getenv("METRICS_DIR")
+
 
 SWAGGER_SETTINGS = {
     "SECURITY_DEFINITIONS": {
         "Basic": {"type": "basic"},
+        "Token": {"type": "apiKey", "name": "Authorization", "in": "header"},
     },
     "VALIDATOR_URL": None,
     "USE_SESSION_AUTH": False,
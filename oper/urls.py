@@ -5,6 +5,8 @@ from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 
+from quiz import metrics
+
 SchemaView = get_schema_view(
     openapi.Info(
         title="Snippets API",
@@ -29,6 +31,8 @@ urlpatterns = [
         name="schema-swagger-ui",
     ),
     path("redoc/", SchemaView.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
+    path("metrics", metrics.view, name="metrics"),
+    path("quizzes/async/", include("quiz.async_urls")),
     path("quizzes/", include("quiz.urls")),
     path(r"", RedirectView.as_view(url="/swagger")),
 ]
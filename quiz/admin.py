@@ -44,4 +44,5 @@ admin.site.register(models.Question)
 admin.site.register(models.Choice)
 admin.site.register(models.Assignment)
 admin.site.register(models.Answer)
+admin.site.register(models.AssignmentResult)
 admin.site.register(models.User, UserAdmin)
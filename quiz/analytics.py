@@ -0,0 +1,167 @@
+"""
+Answer analytics of quizzes, computed over the submitted assignments.
+
+The distribution of the answers is computed by the database (grouped aggregates over `Answer`), so that the cost in
+Python depends on the number of questions and choices rather than on the number of assignments. Results are cached
+per quiz version and submission state, i.e. until the quiz changes or another assignment is submitted (answers of
+submitted assignments can't change). Correct choices are read from the quiz's answer key (see `answer_keys`).
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict
+
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Count, F, Max, Q
+
+from . import answer_keys, models
+
+CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def choice_distribution(quiz: models.Quiz) -> Dict[str, Any]:
+    """
+    Returns, for each question of the quiz, how many submitted assignments selected each choice and how many got the
+    question fully right (see `scoring.grade_assignments`).
+    """
+    return cached(quiz, "analytics", _build)
+
+
+def cached(
+    quiz: models.Quiz, name: str, build: Callable[[models.Quiz, int], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Returns the analytics built by `build(quiz, submitted)` from the cache, unless the quiz or its submitted
+    assignments have changed since they were built.
+    """
+    submissions = models.Assignment.objects.filter(
+        quiz=quiz, submited_at__isnull=False
+    ).aggregate(count=Count("id"), last_submited_at=Max("submited_at"))
+    last_submited_at = submissions["last_submited_at"]
+    version = models.Quiz.cache_version(quiz.version, quiz.updated_at)
+    key = (
+        f"quiz:{name}:{quiz.id}:{version}:{submissions['count']}:"
+        f"{last_submited_at.timestamp() if last_submited_at else 0}"
+    )
+    result = cache.get(key)
+    if result is None:
+        result = build(quiz, submissions["count"])
+        cache.set(key, result, CACHE_TIMEOUT)
+    return result
+
+
+def _build(quiz: models.Quiz, submitted: int) -> Dict[str, Any]:
+    answer_key = answer_keys.get_answer_key(quiz.id)
+    questions: Dict[int, Dict[str, Any]] = {}
+    rows = (
+        models.Quiz.questions.through.objects.filter(quiz_id=quiz.id)
+        .values_list(
+            "question_id",
+            "question__text",
+            "question__choices",
+            "question__choices__text",
+        )
+        .order_by("question_id", "question__choices")
+    )
+    for question_id, text, choice_id, choice_text in rows:
+        question = questions.setdefault(
+            question_id, {"id": question_id, "text": text, "choices": {}}
+        )
+        if choice_id is not None:
+            question["choices"][choice_id] = {
+                "id": choice_id,
+                "text": choice_text,
+                "is_correct": choice_id in answer_key.get(question_id, ()),
+                "count": 0,
+            }
+
+    answers = models.Answer.objects.filter(
+        assignment__quiz_id=quiz.id, assignment__submited_at__isnull=False
+    )
+    for choice_id, question_id, count in (
+        answers.values("choice_id")
+        .annotate(question_id=F("choice__question_id"), count=Count("id"))
+        .values_list("choice_id", "question_id", "count")
+    ):
+        if question_id in questions:
+            questions[question_id]["choices"][choice_id]["count"] = count
+
+    correct_counts = _correct_counts(answers, questions, answer_key, submitted)
+    return {
+        "id": quiz.id,
+        "submitted": submitted,
+        "questions": [
+            {
+                "id": question["id"],
+                "text": question["text"],
+                "correct_count": correct_counts[question["id"]],
+                "correct_rate": (
+                    correct_counts[question["id"]] / submitted if submitted else 0.0
+                ),
+                "choices": list(question["choices"].values()),
+            }
+            for question in questions.values()
+        ],
+    }
+
+
+def _correct_counts(
+    answers,
+    questions: Dict[int, Dict[str, Any]],
+    answer_key: answer_keys.AnswerKey,
+    submitted: int,
+):
+    """
+    Counts the assignments which got each question fully right.
+    """
+    correct_choice_counts = {
+        question_id: len(answer_key.get(question_id, ())) for question_id in questions
+    }
+    correct_counts: Dict[int, int] = defaultdict(int)
+    answered_counts: Dict[int, int] = defaultdict(int)
+    for question_id, selected, selected_correct, count in _selection_groups(
+        answers, answer_key
+    ):
+        answered_counts[question_id] += count
+        if selected == selected_correct == correct_choice_counts.get(question_id):
+            correct_counts[question_id] += count
+
+    for question_id, correct_choice_count in correct_choice_counts.items():
+        # Questions without correct choices are right when left unanswered.
+        if not correct_choice_count:
+            correct_counts[question_id] = submitted - answered_counts[question_id]
+    return correct_counts
+
+
+def _selection_groups(answers, answer_key: answer_keys.AnswerKey):
+    """
+    Rows of `(question ID, selected, selected correct, number of assignments)`. The selections are first grouped per
+    assignment and question, and these groups are then grouped again per question and (selected, selected correct)
+    pair, so that only a handful of rows per question leave the database.
+    """
+    graded = (
+        answers.values("assignment_id")
+        .annotate(
+            question_id=F("choice__question_id"),
+            selected=Count("id"),
+            selected_correct=Count(
+                "id",
+                filter=Q(
+                    choice_id__in=[
+                        choice_id
+                        for choice_ids in answer_key.values()
+                        for choice_id in choice_ids
+                    ]
+                ),
+            ),
+        )
+        .values("assignment_id", "question_id", "selected", "selected_correct")
+    )
+    sql, params = graded.query.get_compiler(using=graded.db).as_sql()
+    with connections[graded.db].cursor() as cursor:
+        cursor.execute(
+            "SELECT question_id, selected, selected_correct, COUNT(*) "
+            f"FROM ({sql}) graded GROUP BY question_id, selected, selected_correct",
+            params,
+        )
+        return cursor.fetchall()
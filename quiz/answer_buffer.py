@@ -0,0 +1,271 @@
+"""
+Write-behind buffer of answers (enabled with `ANSWER_BUFFER`).
+
+During exam surges most writes are single answer inserts, each of them in its own transaction. With the buffer
+enabled, validated answers are appended to an in-process queue instead, and inserted with `bulk_create` (and graded)
+in batches, whenever `ANSWER_BUFFER_SIZE` answers are pending or every `ANSWER_BUFFER_INTERVAL` seconds (by a
+background thread).
+
+Pending answers of a user are flushed before the other requests of the user (but the creation of answers) are handled
+(see `BaseViewSet.initial`), so that users read their own writes, and pending answers of an assignment are flushed
+before it is submitted. Answers taken by a flush stay pending until they are inserted: flushes of their users or
+assignments wait for them (so that the answers are written when a flush returns, even if another thread took them).
+Both only hold if every request is handled by the process which buffered the answers, which is
+why the first process to buffer an answer locks `ANSWER_BUFFER_LOCK` and the buffer refuses to run in any other process.
+Everything is flushed when the process exits. Answers buffered by a process which is killed (rather than shut down) are
+lost.
+"""
+
+import atexit
+import fcntl
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import close_old_connections, transaction
+
+from . import models, results
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerBuffer:
+
+    def __init__(self):
+        # Pending answers (and the ID of the user who gave them) by assignment ID, and assignment ID's by user ID.
+        self._pending: Dict[int, Tuple[int, List[models.Answer]]] = {}
+        self._users: Dict[int, Set[int]] = defaultdict(set)
+        self._size = 0
+        self._lock = threading.Lock()
+        # Assignment ID's of the answers being flushed by user ID, and the condition notified whenever they are written.
+        self._in_flight: Dict[int, Set[int]] = defaultdict(set)
+        self._flushed = threading.Condition(self._lock)
+        self._flusher: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        # The locked file and the ID of the process which locked it.
+        self._lock_file = None
+        self._lock_pid: Optional[int] = None
+        # Number of answers dropped because their assignment was submitted or deleted before they were flushed.
+        self.dropped = 0
+
+    def append(self, user_id: int, answer: models.Answer) -> None:
+        self._lock_process()
+        with self._lock:
+            self._add(user_id, [answer])
+            full = self._size >= settings.ANSWER_BUFFER_SIZE
+        self._start_flusher()
+        if full:
+            self.flush()
+
+    def has_pending(self, user_id: int) -> bool:
+        return user_id in self._users or user_id in self._in_flight
+
+    def flush(
+        self,
+        user_ids: Optional[Iterable[int]] = None,
+        assignment_ids: Optional[Iterable[int]] = None,
+    ) -> int:
+        """
+        Inserts the pending answers (all of them, or only those of the given users/assignments) and refreshes the
+        results of their assignments. Returns the number of inserted answers.
+        """
+        taken = self._take(user_ids, assignment_ids)
+        answers = [
+            answer for _, assignment_answers in taken for answer in assignment_answers
+        ]
+        if not answers:
+            return 0
+        try:
+            with transaction.atomic():
+                # Assignments may have been submitted (by another process) or deleted since the answers were buffered.
+                open_assignments = set(
+                    models.Assignment.objects.filter(
+                        pk__in={answer.assignment_id for answer in answers},
+                        submited_at__isnull=True,
+                    ).values_list("id", flat=True)
+                )
+                written = [
+                    answer
+                    for answer in answers
+                    if answer.assignment_id in open_assignments
+                ]
+                models.Answer.objects.bulk_create(written, ignore_conflicts=True)
+                results.refresh_results(open_assignments)
+        except Exception:
+            logger.exception("Failed to flush %s buffered answers.", len(answers))
+            with self._lock:
+                for user_id, assignment_answers in taken:
+                    self._add(user_id, assignment_answers)
+            raise
+        finally:
+            self._release(taken)
+        dropped = len(answers) - len(written)
+        if dropped:
+            with self._lock:
+                self.dropped += dropped
+            logger.warning(
+                "Dropped %s buffered answers of submitted or deleted assignments.",
+                dropped,
+            )
+        return len(written)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._users.clear()
+            self._size = 0
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.flush()
+
+    def _add(self, user_id: int, answers: List[models.Answer]) -> None:
+        for answer in answers:
+            self._pending.setdefault(answer.assignment_id, (user_id, []))[1].append(
+                answer
+            )
+            self._users[user_id].add(answer.assignment_id)
+        self._size += len(answers)
+
+    def _take(self, user_ids, assignment_ids) -> List[Tuple[int, List[models.Answer]]]:
+        """
+        Removes the selected pending answers and marks them as in flight, once the selected answers taken by other
+        flushes have been written.
+        """
+        user_ids = None if user_ids is None else set(user_ids)
+        assignment_ids = None if assignment_ids is None else set(assignment_ids)
+        with self._lock:
+            self._flushed.wait_for(
+                lambda: not self._selected(self._in_flight, user_ids, assignment_ids)
+            )
+            selected = self._selected(self._users, user_ids, assignment_ids)
+
+            taken = [
+                self._pending.pop(assignment_id)
+                for assignment_id in selected
+                if assignment_id in self._pending
+            ]
+            for user_id, answers in taken:
+                self._users[user_id].discard(answers[0].assignment_id)
+                if not self._users[user_id]:
+                    del self._users[user_id]
+                self._in_flight[user_id].add(answers[0].assignment_id)
+                self._size -= len(answers)
+            return taken
+
+    def _release(self, taken: List[Tuple[int, List[models.Answer]]]) -> None:
+        with self._lock:
+            for user_id, answers in taken:
+                self._in_flight[user_id].discard(answers[0].assignment_id)
+                if not self._in_flight[user_id]:
+                    del self._in_flight[user_id]
+            self._flushed.notify_all()
+
+    @staticmethod
+    def _selected(
+        assignments: Dict[int, Set[int]],
+        user_ids: Optional[Set[int]],
+        assignment_ids: Optional[Set[int]],
+    ) -> Set[int]:
+        """
+        Returns the ID's of the given assignments (by user ID) of the given users or with the given ID's (all of them if
+        neither are given).
+        """
+        if user_ids is None and assignment_ids is None:
+            return {
+                assignment_id for ids in assignments.values() for assignment_id in ids
+            }
+        selected = {
+            assignment_id
+            for ids in assignments.values()
+            for assignment_id in ids
+            if assignment_id in (assignment_ids or ())
+        }
+        for user_id in user_ids or ():
+            selected |= assignments.get(user_id, set())
+        return selected
+
+    def _lock_process(self) -> None:
+        """
+        Locks `ANSWER_BUFFER_LOCK` for the current process (forked processes lock it again), raising
+        `ImproperlyConfigured` if another process holds it.
+        """
+        if self._lock_pid == os.getpid():
+            return
+        with self._lock:
+            if self._lock_pid == os.getpid():
+                return
+            # pylint: disable=consider-using-with
+            lock_file = open(settings.ANSWER_BUFFER_LOCK, "a", encoding="utf-8")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError as error:
+                lock_file.close()
+                raise ImproperlyConfigured(
+                    "ANSWER_BUFFER requires a single worker process, but "
+                    f"{settings.ANSWER_BUFFER_LOCK} is locked by another process."
+                ) from error
+            self._lock_file, self._lock_pid = lock_file, os.getpid()
+
+    def _start_flusher(self) -> None:
+        if self._flusher is not None or not settings.ANSWER_BUFFER_INTERVAL:
+            return
+        with self._lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically, name="answer-buffer", daemon=True
+                )
+                self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(settings.ANSWER_BUFFER_INTERVAL):
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass  # Logged by `flush`, the answers are retried on the next tick.
+            finally:
+                close_old_connections()
+
+
+_buffer = AnswerBuffer()
+
+atexit.register(_buffer.stop)
+
+
+def enabled() -> bool:
+    return settings.ANSWER_BUFFER
+
+
+def append(user_id: int, answer: models.Answer) -> None:
+    _buffer.append(user_id, answer)
+
+
+def flush(
+    user_ids: Optional[Iterable[int]] = None,
+    assignment_ids: Optional[Iterable[int]] = None,
+) -> int:
+    return _buffer.flush(user_ids, assignment_ids)
+
+
+def flush_user(user_id: int) -> int:
+    """
+    Flushes the pending answers of the user, if any (which is a dictionary lookup otherwise).
+    """
+    if not _buffer.has_pending(user_id):
+        return 0
+    return _buffer.flush(user_ids=[user_id])
+
+
+def has_pending(user_id: int) -> bool:
+    return _buffer.has_pending(user_id)
+
+
+def clear() -> None:
+    """
+    Drops the pending answers without inserting them.
+    """
+    _buffer.clear()
@@ -0,0 +1,126 @@
+"""
+Answer keys map each question of a quiz to the (frozen) set of its correct choices.
+
+Keys are looked up in an in-process LRU first, then in the shared Django cache, and only built from the database when
+both miss. They are keyed by quiz ID and `Quiz.cache_version`, so bumping the version (see
+`QuizQuerySet.bump_version`) invalidates them everywhere without having to reach every process.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+from django.core.cache import cache
+
+from . import models
+
+AnswerKey = Dict[int, FrozenSet[int]]
+
+LRU_SIZE = 1024
+
+CACHE_TIMEOUT = 24 * 60 * 60
+
+
+class LRUCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: "OrderedDict[Tuple[int, str], AnswerKey]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[int, str]):
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def set(self, key: Tuple[int, str], value: AnswerKey) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_lru = LRUCache(LRU_SIZE)
+
+
+def get_answer_keys(quiz_ids: Iterable[int]) -> Dict[int, AnswerKey]:
+    """
+    Returns the answer keys of the given quizzes, which costs a single query (for the quiz versions) when every key is
+    cached.
+    """
+    versions = {
+        quiz_id: models.Quiz.cache_version(version, updated_at)
+        for quiz_id, version, updated_at in models.Quiz.objects.filter(
+            pk__in=set(quiz_ids)
+        ).values_list("id", "version", "updated_at")
+    }
+
+    keys = {}
+    for quiz_id, version in versions.items():
+        key = _lru.get((quiz_id, version))
+        if key is not None:
+            keys[quiz_id] = key
+
+    missing = {
+        _cache_key(quiz_id, version): (quiz_id, version)
+        for quiz_id, version in versions.items()
+        if quiz_id not in keys
+    }
+    if missing:
+        for cache_key, key in cache.get_many(list(missing)).items():
+            keys[missing[cache_key][0]] = key
+            _lru.set(missing.pop(cache_key), key)
+
+    if missing:
+        built = _build([quiz_id for quiz_id, _ in missing.values()])
+        for cache_key, (quiz_id, version) in missing.items():
+            keys[quiz_id] = built[quiz_id]
+            _lru.set((quiz_id, version), built[quiz_id])
+        cache.set_many(
+            {cache_key: built[quiz_id] for cache_key, (quiz_id, _) in missing.items()},
+            CACHE_TIMEOUT,
+        )
+
+    return keys
+
+
+def get_answer_key(quiz_id: int) -> AnswerKey:
+    return get_answer_keys([quiz_id]).get(quiz_id, {})
+
+
+def clear() -> None:
+    """
+    Clears the in-process LRU (the shared cache entries expire by themselves once versions are bumped).
+    """
+    _lru.clear()
+
+
+def _build(quiz_ids: Iterable[int]) -> Dict[int, AnswerKey]:
+    correct_choices: Dict[int, Dict[int, set]] = {quiz_id: {} for quiz_id in quiz_ids}
+    rows = models.Quiz.questions.through.objects.filter(
+        quiz_id__in=list(correct_choices)
+    ).values_list(
+        "quiz_id", "question_id", "question__choices", "question__choices__is_correct"
+    )
+    for quiz_id, question_id, choice_id, is_correct in rows:
+        choices = correct_choices[quiz_id].setdefault(question_id, set())
+        if is_correct:
+            choices.add(choice_id)
+
+    return {
+        quiz_id: {
+            question_id: frozenset(choices)
+            for question_id, choices in questions.items()
+        }
+        for quiz_id, questions in correct_choices.items()
+    }
+
+
+def _cache_key(quiz_id: int, version: str) -> str:
+    return f"quiz:answer-key:{quiz_id}:{version}"
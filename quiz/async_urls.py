@@ -0,0 +1,17 @@
+from django.urls import path
+
+from . import async_views
+
+urlpatterns = [
+    path("answers/", async_views.create_answer, name="async-answers-list"),
+    path(
+        "assignments/<int:pk>/",
+        async_views.retrieve_assignment,
+        name="async-assignments-detail",
+    ),
+    path(
+        "assignments/<int:pk>/submit/",
+        async_views.submit_assignment,
+        name="async-assignments-submit",
+    ),
+]
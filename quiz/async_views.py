@@ -0,0 +1,200 @@
+"""
+Native async versions of the exam-taking hot path (creating answers, retrieving and submitting assignments).
+
+DRF views are synchronous, so under ASGI each request to them holds a thread. These views use Django's async ORM
+instead and respond exactly like their DRF counterparts, which lets a single ASGI worker serve many concurrent
+quizzees. They are served by `oper.async_urls` (see `ASYNC_ONLY` in the settings) and mounted under `/quizzes/async/`
+by the default URL configuration. Grading (`results.refresh_results`) is still synchronous and runs in a thread.
+"""
+
+from functools import wraps
+from typing import Tuple
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, JsonResponse
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+from rest_framework import exceptions, status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from . import (
+    answer_buffer,
+    authentication,
+    models,
+    payloads,
+    results,
+    serializers,
+    timing,
+)
+
+
+def authenticated(view):
+    """
+    Authenticates the request (see `authentication.aauthenticate`) and passes the user to the view. CSRF is only
+    enforced for session-authenticated requests, as DRF does.
+    """
+
+    @csrf_exempt
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        try:
+            with timing.measure("auth"):
+                user = await authentication.aauthenticate(request)
+        except exceptions.APIException as error:
+            return _error(error.detail, error.status_code)
+        if user is None:
+            response = _error(
+                "Authentication credentials were not provided.",
+                status.HTTP_401_UNAUTHORIZED,
+            )
+            response["WWW-Authenticate"] = 'Basic realm="api"'
+            return response
+        return await view(request, user, *args, **kwargs)
+
+    return wrapper
+
+
+@require_POST
+@authenticated
+async def create_answer(request, user):
+    if user.is_quizzer:
+        return _permission_denied()
+    try:
+        assignment_id, choice_id = _answer_ids(request)
+    except exceptions.APIException as error:
+        return _error(error.detail, error.status_code)
+
+    assignment = (
+        await models.Assignment.objects.filter(pk=assignment_id, user=user)
+        .only("id", "quiz_id", "submited_at")
+        .afirst()
+    )
+    if assignment is None:
+        return _error(
+            {"assignment": ["The assignment does not exist."]},
+            status.HTTP_400_BAD_REQUEST,
+        )
+    if assignment.submited_at is not None:
+        return _error(
+            {"assignment": ["The assigment has already been submitted."]},
+            status.HTTP_400_BAD_REQUEST,
+        )
+    if not await models.Choice.objects.filter(
+        pk=choice_id, question__quizzes=assignment.quiz_id
+    ).aexists():
+        return _error(
+            {"choice": ["The choice is not an valid answer to the assignment's quiz."]},
+            status.HTTP_400_BAD_REQUEST,
+        )
+
+    answer = models.Answer(assignment_id=assignment.id, choice_id=choice_id)
+    if answer_buffer.enabled():
+        await sync_to_async(answer_buffer.append)(user.id, answer)
+    else:
+        await models.Answer.objects.abulk_create([answer], ignore_conflicts=True)
+        await sync_to_async(results.refresh_results)([assignment.id])
+    return JsonResponse(
+        {"assignment": assignment.id, "choice": choice_id},
+        status=status.HTTP_201_CREATED,
+    )
+
+
+@require_GET
+@authenticated
+async def retrieve_assignment(request, user, pk):
+    # pylint: disable=unused-argument
+    await _flush_buffered_answers(user)
+    if user.is_quizzer:
+        assignment = await _quizzer_assignment_data(user, pk)
+        if assignment is None:
+            return _not_found()
+        return HttpResponse(
+            JSONRenderer().render(assignment), content_type="application/json"
+        )
+
+    assignment = (
+        await models.Assignment.objects.select_related("quiz")
+        .filter(pk=pk, user=user)
+        .afirst()
+    )
+    if assignment is None:
+        return _not_found()
+    return await payloads.aassignment_response(assignment)
+
+
+@require_POST
+@authenticated
+async def submit_assignment(request, user, pk):
+    # pylint: disable=unused-argument
+    if user.is_quizzer:
+        return _permission_denied()
+    assignment = (
+        await models.Assignment.objects.select_related("quiz")
+        .filter(pk=pk, user=user)
+        .afirst()
+    )
+    if assignment is None:
+        return _not_found()
+
+    await _flush_buffered_answers(user)
+    assignment.submited_at = timezone.now()
+    await assignment.asave(update_fields=["submited_at"])
+    await sync_to_async(results.refresh_results)([assignment.id])
+    return await payloads.aassignment_response(assignment)
+
+
+async def _flush_buffered_answers(user) -> None:
+    # Checked first, so that the common case (nothing pending) doesn't need a thread.
+    if answer_buffer.enabled() and answer_buffer.has_pending(user.id):
+        await sync_to_async(answer_buffer.flush_user)(user.id)
+
+
+@sync_to_async
+def _quizzer_assignment_data(user, pk):
+    assignment = (
+        models.Assignment.objects.filter(pk=pk, quiz__user=user)
+        .select_related("user", "quiz")
+        .prefetch_related("quiz__questions__choices", "quiz__questions__quizzes")
+        .first()
+    )
+    if assignment is None:
+        return None
+    return serializers.AssignmentQuizzerDetailSerializer(assignment).data
+
+
+def _answer_ids(request) -> Tuple[int, int]:
+    """
+    Parses the assignment and choice ID's from the body of the request, with the parsers of the DRF views (JSON, form
+    and multipart by default), raising DRF's `ParseError`, `UnsupportedMediaType` or `ValidationError` like them.
+    """
+    parsers = [parser() for parser in api_settings.DEFAULT_PARSER_CLASSES]
+    data = Request(request, parsers=parsers).data
+    try:
+        return int(data["assignment"]), int(data["choice"])
+    except (ValueError, TypeError, KeyError) as error:
+        raise exceptions.ValidationError(
+            {
+                "assignment": ["A valid integer is required."],
+                "choice": ["A valid integer is required."],
+            }
+        ) from error
+
+
+def _error(detail, status_code: int) -> JsonResponse:
+    if not isinstance(detail, dict):
+        detail = {"detail": str(detail)}
+    return JsonResponse(detail, status=status_code)
+
+
+def _permission_denied() -> JsonResponse:
+    return _error(
+        "You do not have permission to perform this action.",
+        status.HTTP_403_FORBIDDEN,
+    )
+
+
+def _not_found() -> JsonResponse:
+    return _error("No Assignment matches the given query.", status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,214 @@
+"""
+Authentication classes which avoid hashing the password (PBKDF2) on every request.
+
+- `CachedBasicAuthentication` remembers, for a few seconds (`AUTH_CACHE_TIMEOUT`), the users whose Basic credentials
+  have been verified, keyed by a salted digest of the credentials (so that the passwords aren't kept in memory).
+- `SignedTokenAuthentication` accepts `Authorization: Token <token>` headers with the tokens issued by `issue_token`,
+  which are signed (and time-stamped) with the `SECRET_KEY` and are therefore verified without the database. Tokens
+  are invalidated whenever the user's password changes.
+
+In both cases, verified principals are kept in an in-process cache, so that an authenticated request costs a digest
+and a dictionary lookup. The caches of a process are cleared for a user when the user is saved (see `quiz.signals`),
+other processes pick the changes up once their entries expire.
+"""
+
+import base64
+import binascii
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.utils.crypto import salted_hmac
+from django.utils.translation import gettext_lazy as _
+from rest_framework import authentication, exceptions
+
+from . import models
+
+CACHE_SIZE = 10000
+
+TOKEN_KEYWORD = "Token"
+
+TOKEN_SALT = "quiz.authentication.token"
+
+
+class PrincipalCache:
+    """
+    Bounded in-process cache of verified users, whose entries expire after `timeout` seconds.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: "OrderedDict[str, Tuple[float, models.User]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[models.User]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            if item[0] < time.monotonic():
+                del self._items[key]
+                return None
+            # Each request gets its own copy, so that nothing set on `request.user` leaks to other requests.
+            return copy.copy(item[1])
+
+    def set(self, key: str, user: models.User, timeout: float) -> None:
+        with self._lock:
+            self._items[key] = (time.monotonic() + timeout, copy.copy(user))
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def forget(self, user_id: int) -> None:
+        with self._lock:
+            for key in [
+                key
+                for key, (_expires_at, user) in self._items.items()
+                if user.pk == user_id
+            ]:
+                del self._items[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_principals = PrincipalCache(CACHE_SIZE)
+
+
+class CachedBasicAuthentication(authentication.BasicAuthentication):
+
+    def authenticate_credentials(self, userid, password, request=None):
+        key = _basic_key(userid, password)
+        user = _principals.get(key)
+        if user is None:
+            user = super().authenticate_credentials(userid, password, request)[0]
+            _principals.set(key, user, settings.AUTH_CACHE_TIMEOUT)
+        return (user, None)
+
+
+class SignedTokenAuthentication(authentication.BaseAuthentication):
+
+    def authenticate(self, request):
+        auth = authentication.get_authorization_header(request).split()
+        if not auth or auth[0].lower() != TOKEN_KEYWORD.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed(_("Invalid token header."))
+        try:
+            token = auth[1].decode()
+        except UnicodeError as error:
+            raise exceptions.AuthenticationFailed(_("Invalid token header.")) from error
+
+        return (self.authenticate_credentials(token), token)
+
+    def authenticate_credentials(self, token: str) -> models.User:
+        try:
+            user_id, fingerprint = _unsign(token)
+        except (signing.BadSignature, ValueError) as error:
+            raise exceptions.AuthenticationFailed(_("Invalid token.")) from error
+
+        key = f"token:{token}"
+        user = _principals.get(key)
+        if user is None:
+            user = models.User.objects.filter(pk=user_id, is_active=True).first()
+            if user is None or fingerprint != _fingerprint(user):
+                raise exceptions.AuthenticationFailed(_("Invalid token."))
+            _principals.set(key, user, settings.AUTH_CACHE_TIMEOUT)
+        return user
+
+    def authenticate_header(self, request):
+        return TOKEN_KEYWORD
+
+
+async def aauthenticate(request) -> Optional[models.User]:
+    """
+    Async counterpart of `DEFAULT_AUTHENTICATION_CLASSES` (Basic auth, tokens and sessions) for the views of
+    `quiz.async_views`. Cached principals are looked up without leaving the event loop, only cache misses (i.e.
+    password checks) run in a thread. Returns `None` for anonymous requests and raises `AuthenticationFailed` for wrong
+    credentials (or `PermissionDenied` for session-authenticated requests failing the CSRF check).
+    """
+    user = _cached_principal(request)
+    if user is not None:
+        return user
+
+    user = await sync_to_async(_authenticate)(request)
+    if user is not None:
+        return user
+
+    user = await request.auser()
+    if not user.is_authenticated:
+        return None
+    authentication.SessionAuthentication().enforce_csrf(request)
+    return user
+
+
+def issue_token(user: models.User) -> str:
+    return signing.TimestampSigner(salt=TOKEN_SALT).sign(
+        f"{user.pk}:{_fingerprint(user)}"
+    )
+
+
+def forget(user_id: int) -> None:
+    """
+    Drops the verified credentials and tokens of the user from this process' cache.
+    """
+    _principals.forget(user_id)
+
+
+def clear() -> None:
+    _principals.clear()
+
+
+def _authenticate(request) -> Optional[models.User]:
+    for authenticator in [CachedBasicAuthentication(), SignedTokenAuthentication()]:
+        result = authenticator.authenticate(request)
+        if result is not None:
+            return result[0]
+    return None
+
+
+def _cached_principal(request) -> Optional[models.User]:
+    auth = authentication.get_authorization_header(request).split()
+    if len(auth) != 2:
+        return None
+    keyword, credentials = auth[0].lower(), auth[1]
+    try:
+        if keyword == b"basic":
+            userid, _separator, password = (
+                base64.b64decode(credentials).decode("utf-8").partition(":")
+            )
+            return _principals.get(_basic_key(userid, password))
+        if keyword == TOKEN_KEYWORD.lower().encode():
+            _unsign(credentials.decode())
+            return _principals.get(f"token:{credentials.decode()}")
+    except (binascii.Error, UnicodeError, signing.BadSignature, ValueError):
+        pass
+    return None
+
+
+def _basic_key(userid: str, password: str) -> str:
+    return (
+        "basic:"
+        + salted_hmac(
+            "quiz.authentication.basic", f"{userid}\0{password}", algorithm="sha256"
+        ).hexdigest()
+    )
+
+
+def _unsign(token: str) -> Tuple[str, str]:
+    user_id, fingerprint = (
+        signing.TimestampSigner(salt=TOKEN_SALT)
+        .unsign(token, max_age=settings.AUTH_TOKEN_MAX_AGE)
+        .split(":")
+    )
+    return user_id, fingerprint
+
+
+def _fingerprint(user: models.User) -> str:
+    return salted_hmac(TOKEN_SALT, user.password, algorithm="sha256").hexdigest()[:16]
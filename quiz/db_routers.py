@@ -0,0 +1,71 @@
+"""
+Routing of the queries of read-only requests to the replica database (the `replica` alias, see `DATABASE_REPLICA_URL`
+in the settings).
+
+Queries are only routed to the replica inside `read_only()` blocks, which `BaseViewSet` opens for its read-only
+actions (e.g. `list` and `retrieve`) once the request has been authenticated, and outside of transactions of the
+primary database (so that e.g. flushing the answer buffer reads what it writes). Everything else, writes included, goes
+to the primary database. Replicas lag behind the primary, so a read-only request may not see the writes made by the
+previous requests yet.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Iterator
+
+from django.conf import settings
+from django.db import transaction
+
+DEFAULT = "default"
+
+REPLICA = "replica"
+
+_read_only: ContextVar[bool] = ContextVar("read_only", default=False)
+
+
+def start_read_only() -> Token:
+    return _read_only.set(True)
+
+
+def end_read_only(token: Token) -> None:
+    _read_only.reset(token)
+
+
+@contextmanager
+def read_only() -> Iterator[None]:
+    token = start_read_only()
+    try:
+        yield
+    finally:
+        end_read_only(token)
+
+
+def replica_configured() -> bool:
+    return REPLICA in settings.DATABASES
+
+
+class ReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        # pylint: disable=unused-argument
+        if (
+            _read_only.get()
+            and replica_configured()
+            and not transaction.get_connection(DEFAULT).in_atomic_block
+        ):
+            return REPLICA
+        return DEFAULT
+
+    def db_for_write(self, model, **hints):
+        # pylint: disable=unused-argument
+        return DEFAULT
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # pylint: disable=unused-argument
+        # Both aliases hold the same data.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # pylint: disable=unused-argument
+        # Replicas get the schema from the primary database.
+        return db != REPLICA
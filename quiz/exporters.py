@@ -0,0 +1,129 @@
+"""
+Streaming export of the results of a quiz.
+
+Assignments are read with a server-side iterator and their answers are fetched one chunk of assignments at a time, so
+that memory usage depends on the chunk size rather than on the number of assignments or answers. The supported
+formats are:
+
+- `csv`: A header with the columns `assignment`, `user`, `submitted_at`, `score`, `progress` and one `question_<id>`
+  column per question of the quiz, with the ID's of the selected choices separated by `;`.
+- `ndjson`: One JSON object per assignment, e.g. `{"assignment": 1, "user": "bob_quizzee", "submitted_at": null,
+  "score": 50.0, "progress": 100.0, "answers": {"3": [7, 8]}}`.
+"""
+
+import csv
+import json
+from itertools import groupby
+from typing import Any, Dict, Iterator, List
+
+from . import models, results
+
+FORMATS = ["csv", "ndjson"]
+
+CONTENT_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+CHUNK_SIZE = 2000
+
+
+class Echo:
+    """
+    File-like object handing back what is written to it, so that `csv.writer` can be used to produce lines.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_results(
+    quiz: models.Quiz, file_format: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Yields the lines of the export of the quiz's results.
+    """
+    exporters = {"csv": export_csv, "ndjson": export_ndjson}
+    if file_format not in exporters:
+        raise ValueError(f"Unsupported format '{file_format}'.")
+    return exporters[file_format](quiz, chunk_size)
+
+
+def export_csv(quiz: models.Quiz, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    question_ids = _question_ids(quiz)
+    writer = csv.writer(Echo())
+    yield writer.writerow(
+        ["assignment", "user", "submitted_at", "score", "progress"]
+        + [f"question_{question_id}" for question_id in question_ids]
+    )
+    for row in rows(quiz, chunk_size):
+        yield writer.writerow(
+            [
+                row["assignment"],
+                row["user"],
+                row["submitted_at"] or "",
+                row["score"],
+                row["progress"],
+            ]
+            + [
+                ";".join(str(choice) for choice in row["answers"].get(question_id, []))
+                for question_id in question_ids
+            ]
+        )
+
+
+def export_ndjson(quiz: models.Quiz, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    for row in rows(quiz, chunk_size):
+        yield json.dumps(row) + "\n"
+
+
+def rows(quiz: models.Quiz, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Yields one row per assignment of the quiz (ordered by ID), with the selected choices per question.
+    """
+    chunk: List[models.Assignment] = []
+    for assignment in (
+        models.Assignment.objects.filter(quiz=quiz)
+        .select_related("user", "result")
+        .order_by("id")
+        .iterator(chunk_size=chunk_size)
+    ):
+        chunk.append(assignment)
+        if len(chunk) == chunk_size:
+            yield from _chunk_rows(chunk)
+            chunk = []
+    yield from _chunk_rows(chunk)
+
+
+def _chunk_rows(assignments: List[models.Assignment]) -> Iterator[Dict[str, Any]]:
+    if not assignments:
+        return
+    results.ensure_results(assignments)
+
+    answers = {
+        assignment_id: {
+            question_id: [choice_id for _, question_id, choice_id in selections]
+            for question_id, selections in groupby(
+                assignment_answers, key=lambda answer: answer[1]
+            )
+        }
+        for assignment_id, assignment_answers in groupby(
+            models.Answer.objects.filter(assignment__in=assignments)
+            .order_by("assignment_id", "choice__question_id", "choice_id")
+            .values_list("assignment_id", "choice__question_id", "choice_id"),
+            key=lambda answer: answer[0],
+        )
+    }
+
+    for assignment in assignments:
+        yield {
+            "assignment": assignment.id,
+            "user": assignment.user.username,
+            "submitted_at": (
+                assignment.submited_at.isoformat() if assignment.submited_at else None
+            ),
+            "score": assignment.result.score,
+            "progress": assignment.result.progress,
+            "answers": answers.get(assignment.id, {}),
+        }
+
+
+def _question_ids(quiz: models.Quiz) -> List[int]:
+    return list(quiz.questions.order_by("id").values_list("id", flat=True))
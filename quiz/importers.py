@@ -0,0 +1,278 @@
+"""
+Streaming import of question banks.
+
+Files are parsed line by line and questions are inserted in chunks, so that memory usage depends on the chunk size
+rather than on the size of the file. The supported formats are:
+
+- `ndjson`: One JSON object per line, e.g. `{"text": "Which is mammal?", "choices": [{"text": "Whale",
+  "is_correct": true}, {"text": "Crocodile", "is_correct": false}]}`. `is_correct` is a boolean, or a string as in
+  `csv` (e.g. `"true"` or `"0"`).
+- `csv`: A header with the columns `text`, `choice` and `is_correct`, followed by one row per choice. Consecutive rows
+  with the same `text` belong to the same question.
+- `gift`: Moodle's GIFT format, e.g. `::Q1:: Which is mammal? {=Whale ~Crocodile}`, with questions separated by blank
+  lines. Choices with a positive weight (`~%50%Belgium`) are considered correct.
+
+Files are read as UTF-8 (with or without a byte order mark) and lines which aren't valid UTF-8 are reported as errors.
+"""
+
+import csv
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from django.db import transaction
+from django.dispatch import Signal
+
+from . import models
+
+FORMATS = ["ndjson", "csv", "gift"]
+
+CHUNK_SIZE = 500
+
+MAX_REPORTED_ERRORS = 1000
+
+TRUE_VALUES = {"1", "true", "t", "yes", "y"}
+
+FALSE_VALUES = {"", "0", "false", "f", "no", "n"}
+
+GIFT_TITLE = re.compile(r"^::.*?::")
+GIFT_CHOICE = re.compile(
+    r"([=~])\s*(?:%(-?\d+(?:\.\d+)?)%)?((?:\\.|[^=~#\\])*)(?:#(?:\\.|[^=~\\])*)?"
+)
+GIFT_ESCAPE = re.compile(r"\\(.)")
+
+# Sent (with the `quiz`) once questions have been imported into a quiz, whose links to them bypass `m2m_changed`.
+questions_imported = Signal()
+
+
+class ParseError(ValueError):
+    def __init__(self, message: str, line: int):
+        super().__init__(message)
+        self.message = message
+        self.line = line
+
+
+class ParsedQuestion(NamedTuple):
+    line: int
+    text: str
+    choices: List[Dict[str, Any]]
+
+
+class ImportReport(NamedTuple):
+    created: int
+    error_count: int
+    errors: List[Dict[str, Any]]
+
+
+ParseResult = Union[ParsedQuestion, ParseError]
+
+
+def import_questions(
+    lines: Iterable[Union[bytes, str]],
+    file_format: str,
+    user: models.User,
+    quiz: Optional[models.Quiz] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> ImportReport:
+    """
+    Imports the questions (and their choices) parsed from the lines of a file (as bytes or decoded), optionally adding
+    them to a quiz. Lines that cannot be decoded or parsed are reported (up to `MAX_REPORTED_ERRORS`) rather than
+    aborting the import.
+    """
+    created = 0
+    errors: List[Dict[str, Any]] = []
+    error_count = 0
+    chunk: List[ParsedQuestion] = []
+
+    for result in _parse_decoded(lines, file_format):
+        if isinstance(result, ParseError):
+            error_count += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"line": result.line, "error": result.message})
+            continue
+        chunk.append(result)
+        if len(chunk) == chunk_size:
+            created += _insert(chunk, user, quiz)
+            chunk = []
+    created += _insert(chunk, user, quiz)
+
+    if quiz is not None and created:
+        questions_imported.send(sender=models.Quiz, quiz=quiz)
+
+    return ImportReport(created, error_count, errors)
+
+
+def decode(
+    lines: Iterable[Union[bytes, str]], errors: List[ParseError]
+) -> Iterator[str]:
+    """
+    Decodes the lines of a file from UTF-8, skipping the byte order mark written by some editors (e.g. Excel's CSV
+    export). Lines which can't be decoded are replaced with blank lines and appended to `errors`.
+    """
+    for number, line in enumerate(lines, start=1):
+        if isinstance(line, str):
+            yield line
+            continue
+        try:
+            yield line.decode("utf-8-sig" if number == 1 else "utf-8")
+        except UnicodeDecodeError as error:
+            errors.append(ParseError(f"Invalid UTF-8: {error.reason}.", number))
+            yield ""
+
+
+def parse(lines: Iterable[str], file_format: str) -> Iterator[ParseResult]:
+    parsers = {"ndjson": parse_ndjson, "csv": parse_csv, "gift": parse_gift}
+    if file_format not in parsers:
+        raise ValueError(f"Unsupported format '{file_format}'.")
+    return parsers[file_format](lines)
+
+
+def _parse_decoded(
+    lines: Iterable[Union[bytes, str]], file_format: str
+) -> Iterator[ParseResult]:
+    # The errors of the lines decoded before each result are yielded first, so that errors are reported in order.
+    errors: List[ParseError] = []
+    for result in parse(decode(lines, errors), file_format):
+        yield from errors
+        errors.clear()
+        yield result
+    yield from errors
+
+
+def parse_ndjson(lines: Iterable[str]) -> Iterator[ParseResult]:
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            question = json.loads(line)
+            if not isinstance(question, dict):
+                raise ParseError("Expected a JSON object.", number)
+            yield _question(
+                number,
+                question.get("text"),
+                [
+                    {
+                        "text": choice.get("text"),
+                        "is_correct": _ndjson_is_correct(
+                            choice.get("is_correct"), number
+                        ),
+                    }
+                    for choice in question.get("choices") or []
+                ],
+            )
+        except ParseError as error:
+            yield error
+        except (ValueError, AttributeError, TypeError) as error:
+            yield ParseError(f"Invalid question: {error}", number)
+
+
+def _ndjson_is_correct(value: Any, line: int) -> bool:
+    if value is None or isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in TRUE_VALUES | FALSE_VALUES:
+        return value.strip().lower() in TRUE_VALUES
+    raise ParseError(f"Invalid is_correct: {json.dumps(value)}.", line)
+
+
+def parse_csv(lines: Iterable[str]) -> Iterator[ParseResult]:
+    reader = csv.DictReader(lines)
+    missing = {"text", "choice", "is_correct"} - set(reader.fieldnames or [])
+    if missing:
+        yield ParseError(f"Missing columns: {', '.join(sorted(missing))}.", 1)
+        return
+
+    line, text, choices = 0, None, []
+    for row in reader:
+        if row["text"] != text:
+            if text is not None:
+                yield _parse_result(line, text, choices)
+            line, text, choices = reader.line_num, row["text"], []
+        choices.append(
+            {
+                "text": row["choice"],
+                "is_correct": (row["is_correct"] or "").strip().lower() in TRUE_VALUES,
+            }
+        )
+    if text is not None:
+        yield _parse_result(line, text, choices)
+
+
+def parse_gift(lines: Iterable[str]) -> Iterator[ParseResult]:
+    block: List[str] = []
+    line = 0
+    for number, raw in enumerate(lines, start=1):
+        stripped = raw.strip()
+        if stripped.startswith("//"):
+            continue
+        if stripped:
+            if not block:
+                line = number
+            block.append(stripped)
+        elif block and "}" in "".join(block):
+            yield _parse_gift_block(line, " ".join(block))
+            block = []
+    if block:
+        yield _parse_gift_block(line, " ".join(block))
+
+
+def _parse_gift_block(line: int, block: str) -> ParseResult:
+    opening, closing = block.find("{"), block.rfind("}")
+    if opening < 0 or closing < opening:
+        return ParseError("Expected the choices between '{' and '}'.", line)
+
+    text = GIFT_TITLE.sub("", block[:opening]).strip()
+    choices = [
+        {
+            "text": GIFT_ESCAPE.sub(r"\1", choice).strip(),
+            "is_correct": marker == "=" or (bool(weight) and float(weight) > 0),
+        }
+        for marker, weight, choice in GIFT_CHOICE.findall(block[opening + 1 : closing])
+    ]
+    return _parse_result(line, GIFT_ESCAPE.sub(r"\1", text), choices)
+
+
+def _parse_result(line: int, text, choices: List[Dict[str, Any]]) -> ParseResult:
+    try:
+        return _question(line, text, choices)
+    except ParseError as error:
+        return error
+
+
+def _question(line: int, text, choices: List[Dict[str, Any]]) -> ParsedQuestion:
+    if not isinstance(text, str) or not text.strip():
+        raise ParseError("The question has no text.", line)
+    if not choices:
+        raise ParseError("The question has no choices.", line)
+    if any(
+        not isinstance(choice["text"], str) or not choice["text"] for choice in choices
+    ):
+        raise ParseError("A choice has no text.", line)
+    return ParsedQuestion(line, text.strip(), choices)
+
+
+def _insert(
+    chunk: List[ParsedQuestion], user: models.User, quiz: Optional[models.Quiz]
+) -> int:
+    if not chunk:
+        return 0
+    with transaction.atomic():
+        questions = models.Question.objects.bulk_create(
+            [models.Question(text=parsed.text, user=user) for parsed in chunk]
+        )
+        models.Choice.objects.bulk_create(
+            [
+                models.Choice(question=question, **choice)
+                for question, parsed in zip(questions, chunk)
+                for choice in parsed.choices
+            ]
+        )
+        if quiz is not None:
+            models.Quiz.questions.through.objects.bulk_create(
+                [
+                    models.Quiz.questions.through(
+                        quiz_id=quiz.id, question_id=question.id
+                    )
+                    for question in questions
+                ]
+            )
+    return len(questions)
@@ -0,0 +1,149 @@
+"""
+Psychometric item analysis of quizzes, computed over the submitted assignments.
+
+The answers of a quiz are loaded into a boolean assignment × choice matrix, from which every statistic is computed
+with vectorized NumPy operations:
+
+- Difficulty index: the proportion of assignments which got the question fully right (higher means easier).
+- Discrimination: the point-biserial correlation between getting the question right and the total score (number of
+  questions right), or `None` when either doesn't vary.
+- Distractor analysis: for each choice, the proportion of all assignments, of the upper group and of the lower group
+  (the 27% best and worst total scores) which selected it. Correct choices should discriminate positively (upper rate
+  above the lower rate) and distractors negatively.
+
+Correct choices are read from the quiz's answer key (see `answer_keys`).
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from . import analytics, answer_keys, models
+
+GROUP_FRACTION = 0.27
+
+
+def item_analysis(quiz: models.Quiz) -> Dict[str, Any]:
+    """
+    Returns the item analysis of the quiz, cached until the quiz or its submitted assignments change.
+    """
+    return analytics.cached(quiz, "item-analysis", _build)
+
+
+def _build(quiz: models.Quiz, submitted: int) -> Dict[str, Any]:
+    # pylint: disable=too-many-locals
+    choices = np.array(
+        list(
+            models.Choice.objects.filter(question__quizzes=quiz)
+            .order_by("question_id", "id")
+            .values_list("question_id", "id")
+        ),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    question_ids, choice_ids = choices.T
+    correct_choice_ids = [
+        choice_id
+        for correct in answer_keys.get_answer_key(quiz.id).values()
+        for choice_id in correct
+    ]
+    is_correct = np.isin(choice_ids, np.array(correct_choice_ids, dtype=np.int64))
+
+    assignment_ids = np.array(
+        list(
+            models.Assignment.objects.filter(quiz=quiz, submited_at__isnull=False)
+            .order_by("id")
+            .values_list("id", flat=True)
+        ),
+        dtype=np.int64,
+    )
+    answers = np.array(
+        list(
+            models.Answer.objects.filter(
+                assignment__quiz=quiz,
+                assignment__submited_at__isnull=False,
+                choice__question__quizzes=quiz,
+            ).values_list("assignment_id", "choice_id")
+        ),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+
+    # The columns are sorted by question (so that the choices of a question are contiguous), answers are mapped to
+    # them with binary searches over the sorted ID's.
+    order = np.argsort(choice_ids)
+    selected = np.zeros((len(assignment_ids), len(choice_ids)), dtype=bool)
+    selected[
+        np.searchsorted(assignment_ids, answers[:, 0]),
+        order[np.searchsorted(choice_ids[order], answers[:, 1])],
+    ] = True
+
+    questions, starts = np.unique(question_ids, return_index=True)
+    # A question is right when the selected choices match the correct choices exactly, i.e. no choice differs.
+    right = (
+        ~np.logical_or.reduceat(selected != is_correct, starts, axis=1)
+        if len(questions) and len(assignment_ids)
+        else np.zeros((len(assignment_ids), len(questions)), dtype=bool)
+    )
+    scores = right.sum(axis=1)
+
+    group_size = max(1, round(len(assignment_ids) * GROUP_FRACTION))
+    ranking = np.argsort(scores, kind="stable")
+    lower, upper = ranking[:group_size], ranking[-group_size:]
+
+    difficulty = _mean(right)
+    discrimination = _point_biserial(right, scores)
+    selection_rate = _mean(selected)
+    upper_rate = _mean(selected[upper])
+    lower_rate = _mean(selected[lower])
+
+    return {
+        "id": quiz.id,
+        "submitted": submitted,
+        "questions": [
+            {
+                "id": int(question_id),
+                "difficulty": _float(difficulty[index]),
+                "discrimination": _float(discrimination[index]),
+                "choices": [
+                    {
+                        "id": int(choice_ids[column]),
+                        "is_correct": bool(is_correct[column]),
+                        "selection_rate": _float(selection_rate[column]),
+                        "upper_rate": _float(upper_rate[column]),
+                        "lower_rate": _float(lower_rate[column]),
+                        "discrimination": _float(
+                            upper_rate[column] - lower_rate[column]
+                        ),
+                    }
+                    for column in np.flatnonzero(question_ids == question_id)
+                ],
+            }
+            for index, question_id in enumerate(questions)
+        ],
+    }
+
+
+def _mean(matrix: np.ndarray) -> np.ndarray:
+    if matrix.size == 0:
+        return np.full(matrix.shape[1], np.nan)
+    return matrix.mean(axis=0)
+
+
+def _point_biserial(items: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation between each (dichotomous) column of `items` and `scores`, NaN where either is constant.
+    """
+    if items.size == 0:
+        return np.full(items.shape[1], np.nan)
+    items = items.astype(float)
+    scores = scores.astype(float)
+    deviations = items - items.mean(axis=0)
+    covariance = (deviations * (scores - scores.mean())[:, None]).mean(axis=0)
+    denominator = items.std(axis=0) * scores.std()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, covariance / denominator, np.nan)
+
+
+def _float(value) -> Optional[float]:
+    value = float(value)
+    return None if math.isnan(value) else value
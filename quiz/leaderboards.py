@@ -0,0 +1,193 @@
+"""
+Live leaderboards of the quizzes: their assignments ranked by score, where tied scores share a rank.
+
+Each process keeps the leaderboards it serves in memory, as lists of `(-score, assignment ID)` kept sorted with
+`bisect`, so that ranking an assignment costs O(log n) and the top N are the first N entries. Updating a score is O(n)
+(`insort` and `del` shift the entries after it), which is cheap for lists of a few thousand entries. The scores are the
+`AssignmentResult` rows, which `quiz.results` keeps up to date as answers and submissions change: a leaderboard is
+built from them once, then only catches up with the rows updated since its last read (found with the
+`(quiz, updated_at)` index). The rows are read from the primary database, and `quiz.results` stamps them again when
+their transaction commits, so that re-reading the last `SYNC_OVERLAP` catches the rows committed after the last read.
+Leaderboards are rebuilt every `REBUILD_INTERVAL` seconds, and as soon as their number of entries differs from the
+number of rows (e.g. once assignments are deleted).
+"""
+
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import db_routers, models
+
+LEADERBOARDS_SIZE = 256
+
+SYNC_OVERLAP = timedelta(seconds=10)
+
+REBUILD_INTERVAL = 5 * 60
+
+
+class Entry(NamedTuple):
+    rank: int
+    assignment_id: int
+    score: float
+
+
+class Standings(NamedTuple):
+    count: int
+    top: List[Entry]
+    # Entries of the requested assignments (see `Leaderboard.standings`).
+    entries: Dict[int, Entry]
+
+
+class Leaderboard:
+
+    def __init__(self, quiz_id: int):
+        self.quiz_id = quiz_id
+        self._entries: List[Tuple[float, int]] = []
+        self._scores: Dict[int, float] = {}
+        self._synced_at: Optional[datetime] = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def standings(self, top: int, assignment_ids: Iterable[int] = ()) -> Standings:
+        """
+        Syncs the leaderboard, then returns its `top` first entries and the entries of the given assignments (if they
+        are ranked).
+        """
+        with self._lock:
+            self._sync()
+            entries = {}
+            for assignment_id in assignment_ids:
+                score = self._scores.get(assignment_id)
+                if score is not None:
+                    entries[assignment_id] = Entry(
+                        self._rank(score), assignment_id, score
+                    )
+            return Standings(len(self._entries), self._top(top), entries)
+
+    def update(self, assignment_id: int, score: float) -> None:
+        previous = self._scores.get(assignment_id)
+        if previous == score:
+            return
+        if previous is not None:
+            del self._entries[bisect_left(self._entries, (-previous, assignment_id))]
+        insort(self._entries, (-score, assignment_id))
+        self._scores[assignment_id] = score
+
+    def _rank(self, score: float) -> int:
+        # `(-score,)` sorts before every entry of that score: the entries before it have higher scores.
+        return bisect_left(self._entries, (-score,)) + 1
+
+    def _top(self, count: int) -> List[Entry]:
+        top: List[Entry] = []
+        for index, (negated_score, assignment_id) in enumerate(self._entries[:count]):
+            score = -negated_score
+            rank = top[-1].rank if top and top[-1].score == score else index + 1
+            top.append(Entry(rank, assignment_id, score))
+        return top
+
+    def _sync(self) -> None:
+        # A replica may replay rows after the next read has moved past them.
+        results = models.AssignmentResult.objects.using(db_routers.DEFAULT).filter(
+            quiz_id=self.quiz_id
+        )
+        synced_at = self._synced_at
+        if (
+            synced_at is not None
+            and time.monotonic() - self._built_at < REBUILD_INTERVAL
+        ):
+            rows = list(
+                results.filter(updated_at__gte=synced_at - SYNC_OVERLAP).values_list(
+                    "assignment_id", "score", "updated_at"
+                )
+            )
+            for assignment_id, score, _ in rows:
+                self.update(assignment_id, score)
+            # Otherwise assignments were deleted (or rows were missed), and the leaderboard is rebuilt.
+            if results.count() == len(self._scores):
+                self._synced_at = max(
+                    [synced_at, *(updated_at for _, _, updated_at in rows)]
+                )
+                return
+
+        rows = list(results.values_list("assignment_id", "score", "updated_at"))
+        self._scores = {assignment_id: score for assignment_id, score, _ in rows}
+        self._entries = sorted(
+            (-score, assignment_id) for assignment_id, score in self._scores.items()
+        )
+        self._built_at = time.monotonic()
+        self._synced_at = max((updated_at for _, _, updated_at in rows), default=None)
+
+
+def leaderboard(
+    quiz: models.Quiz, top: int, user_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Returns the `top` first entries of the quiz's leaderboard and the best ranked assignment of the given user.
+    """
+    assignment_ids: List[int] = []
+    if user_id is not None:
+        assignment_ids = list(
+            models.Assignment.objects.filter(quiz=quiz, user_id=user_id).values_list(
+                "id", flat=True
+            )
+        )
+    standings = get_leaderboard(quiz.id).standings(top, assignment_ids)
+    # Entries compare by rank first.
+    user_entry = min(standings.entries.values(), default=None)
+
+    entries = standings.top + ([user_entry] if user_entry else [])
+    users = {
+        assignment_id: (user_id, username)
+        for assignment_id, user_id, username in models.Assignment.objects.filter(
+            id__in=[entry.assignment_id for entry in entries]
+        ).values_list("id", "user_id", "user__username")
+    }
+    return {
+        "id": quiz.id,
+        "count": standings.count,
+        "top": [
+            _entry(entry, users[entry.assignment_id])
+            for entry in standings.top
+            # Assignments deleted since the leaderboard was built.
+            if entry.assignment_id in users
+        ],
+        "user": (
+            _entry(user_entry, users[user_entry.assignment_id]) if user_entry else None
+        ),
+    }
+
+
+def _entry(entry: Entry, user: Tuple[int, str]) -> Dict[str, Any]:
+    return {
+        "rank": entry.rank,
+        "assignment": entry.assignment_id,
+        "user": user[0],
+        "username": user[1],
+        "score": entry.score,
+    }
+
+
+_lock = threading.Lock()
+_leaderboards: "OrderedDict[int, Leaderboard]" = OrderedDict()
+
+
+def get_leaderboard(quiz_id: int) -> Leaderboard:
+    """
+    The leaderboard of the quiz, kept in memory for the `LEADERBOARDS_SIZE` most recently read quizzes.
+    """
+    with _lock:
+        quiz_leaderboard = _leaderboards.get(quiz_id)
+        if quiz_leaderboard is None:
+            quiz_leaderboard = _leaderboards[quiz_id] = Leaderboard(quiz_id)
+        _leaderboards.move_to_end(quiz_id)
+        while len(_leaderboards) > LEADERBOARDS_SIZE:
+            _leaderboards.popitem(last=False)
+        return quiz_leaderboard
+
+
+def clear() -> None:
+    with _lock:
+        _leaderboards.clear()
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz import exporters, models
+
+
+class Command(BaseCommand):
+    help = "Exports the results of a quiz (one row per assignment) as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("quiz", type=int, help="ID of the quiz.")
+        parser.add_argument(
+            "--format",
+            choices=exporters.FORMATS,
+            default="csv",
+            help="Format of the export.",
+        )
+        parser.add_argument(
+            "--output", help="Path of the file to write (standard output by default)."
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=exporters.CHUNK_SIZE,
+            help="Number of assignments read per batch.",
+        )
+
+    def handle(self, *args, **options):
+        quiz = models.Quiz.objects.filter(pk=options["quiz"]).first()
+        if quiz is None:
+            raise CommandError(f"Quiz {options['quiz']} does not exist.")
+
+        lines = exporters.export_results(
+            quiz, options["format"], chunk_size=options["chunk_size"]
+        )
+        if options["output"] is None:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        with open(options["output"], "w", encoding="utf-8", newline="") as output:
+            output.writelines(lines)
+        self.stderr.write(self.style.SUCCESS(f"Exported to {options['output']}."))
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz import importers, models
+
+
+class Command(BaseCommand):
+    help = "Imports a question bank from a NDJSON, CSV or GIFT file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the file to import.")
+        parser.add_argument(
+            "--user",
+            required=True,
+            help="Username of the quizzer owning the questions.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=importers.FORMATS,
+            help="Format of the file (inferred from the extension by default).",
+        )
+        parser.add_argument("--quiz", type=int, help="Add the questions to this quiz.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=importers.CHUNK_SIZE,
+            help="Number of questions inserted per batch.",
+        )
+
+    def handle(self, *args, **options):
+        file_format = options["format"] or options["path"].rsplit(".", 1)[-1].lower()
+        if file_format not in importers.FORMATS:
+            raise CommandError("The format could not be inferred from the file name.")
+
+        user = models.User.objects.filter(username=options["user"]).first()
+        if user is None:
+            raise CommandError(f"User '{options['user']}' does not exist.")
+
+        quiz = None
+        if options["quiz"] is not None:
+            quiz = models.Quiz.objects.filter(pk=options["quiz"], user=user).first()
+            if quiz is None:
+                raise CommandError(f"Quiz {options['quiz']} does not exist.")
+
+        # Decoded by the importer, which reports the lines which aren't valid UTF-8.
+        with open(options["path"], "rb") as lines:
+            report = importers.import_questions(
+                lines, file_format, user, quiz=quiz, chunk_size=options["chunk_size"]
+            )
+
+        for error in report.errors:
+            self.stderr.write(f"Line {error['line']}: {error['error']}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report.created} questions ({report.error_count} errors)."
+            )
+        )
@@ -0,0 +1,46 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz import item_analysis, models
+
+
+class Command(BaseCommand):
+    help = "Prints the item analysis (difficulty, discrimination and distractors) of a quiz."
+
+    def add_arguments(self, parser):
+        parser.add_argument("quiz", type=int, help="ID of the quiz.")
+        parser.add_argument(
+            "--json", action="store_true", help="Print the analysis as JSON."
+        )
+
+    def handle(self, *args, **options):
+        quiz = models.Quiz.objects.filter(pk=options["quiz"]).first()
+        if quiz is None:
+            raise CommandError(f"Quiz {options['quiz']} does not exist.")
+
+        analysis = item_analysis.item_analysis(quiz)
+        if options["json"]:
+            self.stdout.write(json.dumps(analysis, indent=2))
+            return
+
+        self.stdout.write(
+            f"Quiz {quiz.id}: {analysis['submitted']} submitted assignments"
+        )
+        for question in analysis["questions"]:
+            self.stdout.write(
+                f"Question {question['id']}: difficulty={_format(question['difficulty'])} "
+                f"discrimination={_format(question['discrimination'])}"
+            )
+            for choice in question["choices"]:
+                self.stdout.write(
+                    f"  {'*' if choice['is_correct'] else ' '} Choice {choice['id']}: "
+                    f"selected={_format(choice['selection_rate'])} "
+                    f"upper={_format(choice['upper_rate'])} "
+                    f"lower={_format(choice['lower_rate'])} "
+                    f"discrimination={_format(choice['discrimination'])}"
+                )
+
+
+def _format(value):
+    return "n/a" if value is None else f"{value:.2f}"
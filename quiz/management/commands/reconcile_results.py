@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from quiz import results
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the assignment results (score and progress) from the answers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--quiz",
+            type=int,
+            action="append",
+            dest="quiz_ids",
+            help="Only rebuild the results of this quiz (may be repeated).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=results.CHUNK_SIZE,
+            help="Number of assignments graded per batch.",
+        )
+
+    def handle(self, *args, **options):
+        if options["quiz_ids"]:
+            count = results.refresh_quiz_results(
+                options["quiz_ids"], chunk_size=options["chunk_size"]
+            )
+        else:
+            count = results.reconcile(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Reconciled {count} assignment results."))
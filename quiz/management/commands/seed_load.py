@@ -0,0 +1,101 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz import seeding
+
+DEFAULTS = seeding.Options()
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a production-scale dataset (quizzers, quizzees, quizzes, assignments, answers and results), "
+        "deterministically from a seed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed", type=int, default=DEFAULTS.seed, help="Seed of the generator."
+        )
+        parser.add_argument(
+            "--quizzers",
+            type=int,
+            default=DEFAULTS.quizzers,
+            help="Number of quizzers.",
+        )
+        parser.add_argument(
+            "--quizzees",
+            type=int,
+            default=DEFAULTS.quizzees,
+            help="Number of quizzees.",
+        )
+        parser.add_argument(
+            "--quizzes", type=int, default=DEFAULTS.quizzes, help="Number of quizzes."
+        )
+        parser.add_argument(
+            "--questions",
+            type=int,
+            default=DEFAULTS.questions,
+            help="Number of questions per quiz.",
+        )
+        parser.add_argument(
+            "--choices",
+            type=int,
+            default=DEFAULTS.choices,
+            help="Number of choices per question.",
+        )
+        parser.add_argument(
+            "--assignments",
+            type=int,
+            default=DEFAULTS.assignments,
+            help="Number of assignments.",
+        )
+        parser.add_argument(
+            "--submitted",
+            type=float,
+            default=DEFAULTS.submitted,
+            help="Fraction of the assignments which are submitted.",
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=DEFAULTS.skew,
+            help="Exponent of the Zipf distribution of the popularity of the quizzes (0 for a uniform distribution).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULTS.batch_size,
+            help="Number of assignments (with their answers) inserted per transaction.",
+        )
+        parser.add_argument(
+            "--password",
+            default=DEFAULTS.password,
+            help="Password of every generated user.",
+        )
+
+    def handle(self, *args, **options):
+        if min(options["quizzers"], options["quizzees"], options["quizzes"]) < 1:
+            raise CommandError("At least one quizzer, quizzee and quiz are required.")
+        if options["questions"] < 1 or options["choices"] < 2:
+            raise CommandError(
+                "At least one question per quiz and two choices per question are required."
+            )
+        if not 0 <= options["submitted"] <= 1:
+            raise CommandError("--submitted must be between 0 and 1.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        started = time.perf_counter()
+        report = seeding.seed(
+            seeding.Options(
+                **{field: options[field] for field in seeding.Options._fields}
+            )
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {report.users} users, {report.quizzes} quizzes, {report.questions} questions, "
+                f"{report.choices} choices, {report.assignments} assignments and {report.answers} answers in "
+                f"{time.perf_counter() - started:.1f}s."
+            )
+        )
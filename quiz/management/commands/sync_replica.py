@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from quiz import db_routers
+
+
+class Command(BaseCommand):
+    help = (
+        "Copies the primary SQLite database into the replica SQLite database, standing in for replication in local "
+        "setups (see DATABASE_REPLICA_URL)."
+    )
+
+    def handle(self, *args, **options):
+        if not db_routers.replica_configured():
+            raise CommandError("No replica database is configured.")
+        primary, replica = (
+            connections[db_routers.DEFAULT],
+            connections[db_routers.REPLICA],
+        )
+        if primary.vendor != "sqlite" or replica.vendor != "sqlite":
+            raise CommandError("Only SQLite databases can be synchronized.")
+
+        primary.ensure_connection()
+        replica.ensure_connection()
+        primary.connection.backup(replica.connection)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synchronized {replica.settings_dict['NAME']} with {primary.settings_dict['NAME']}."
+            )
+        )
@@ -0,0 +1,356 @@
+"""
+Request metrics in the Prometheus text format, served by `/metrics` and aggregated across the worker processes.
+
+Every process records its samples in its own files of `METRICS_DIR` (metrics are disabled when it isn't set), mapped
+in memory so that recording a sample is a few writes to memory, and the endpoint sums the files of every process,
+whichever process serves it. Counters and histograms are summed over every file, including the ones of exited
+processes (e.g. restarted workers), so that they never go backwards. Gauges are only summed over the live processes.
+The directory should be emptied when the service is (re)deployed.
+
+The samples are labelled by the viewset and action which handled the request (by the view function's name, with an
+empty viewset, for the other views) and the histograms' buckets are stored as plain counts, only made cumulative when
+they are exposed.
+"""
+
+import glob
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, NamedTuple, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_GET
+
+from . import timing
+
+# Initial size of a process' file, doubled whenever it is full.
+INITIAL_SIZE = 64 * 1024
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Metric(NamedTuple):
+    name: str
+    type: str
+    help: str
+    buckets: Tuple[float, ...] = ()
+
+
+REQUESTS = Metric("quiz_requests_total", COUNTER, "Requests by response status.")
+IN_PROGRESS = Metric(
+    "quiz_requests_in_progress", GAUGE, "Requests being handled (live processes)."
+)
+DURATION = Metric(
+    "quiz_request_duration_seconds",
+    HISTOGRAM,
+    "Request latency.",
+    (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1, 2.5, 5, 7.5, 10),
+)
+QUERIES = Metric(
+    "quiz_request_queries",
+    HISTOGRAM,
+    "Database queries per request.",
+    (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+
+METRICS = [REQUESTS, IN_PROGRESS, DURATION, QUERIES]
+
+
+class MmapValues:
+    """
+    Float values keyed by strings, in a file mapped in memory. The file starts with the number of bytes used (as a
+    32 bits integer, padded to 8 bytes), followed by the entries: the length of the key (32 bits), the key (padded so
+    that the value is 8 bytes aligned) and the value (a double).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # pylint: disable=consider-using-with
+        self._file = open(path, "a+b")
+        size = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            self._file.truncate(INITIAL_SIZE)
+            size = INITIAL_SIZE
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self._used = struct.unpack_from("i", self._map, 0)[0] or 8
+        self._positions = {
+            key: position for key, _, position in _entries(self._map, self._used)
+        }
+
+    def increment(self, key: str, amount: float = 1) -> None:
+        position = self._position(key)
+        value = struct.unpack_from("d", self._map, position)[0]
+        struct.pack_into("d", self._map, position, value + amount)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def _position(self, key: str) -> int:
+        position = self._positions.get(key)
+        if position is None:
+            position = self._positions[key] = self._append(key)
+        return position
+
+    def _append(self, key: str) -> int:
+        encoded = key.encode()
+        padding = 8 - (4 + len(encoded)) % 8
+        entry = struct.pack(f"i{len(encoded)}s{padding}xd", len(encoded), encoded, 0.0)
+        while self._used + len(entry) > len(self._map):
+            self._grow()
+        self._map[self._used : self._used + len(entry)] = entry
+        self._used += len(entry)
+        # Written last, once the entry is complete, for the readers.
+        struct.pack_into("i", self._map, 0, self._used)
+        return self._used - 8
+
+    def _grow(self) -> None:
+        size = len(self._map) * 2
+        self._map.close()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+
+def read_values(path: str) -> Iterator[Tuple[str, float]]:
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) < 8:
+        return
+    used = struct.unpack_from("i", data, 0)[0]
+    for key, value, _ in _entries(data, min(used, len(data))):
+        yield key, value
+
+
+def _entries(data, used: int) -> Iterator[Tuple[str, float, int]]:
+    position = 8
+    while position < used:
+        length = struct.unpack_from("i", data, position)[0]
+        key = bytes(data[position + 4 : position + 4 + length]).decode()
+        position += 4 + length
+        position += 8 - position % 8
+        yield key, struct.unpack_from("d", data, position)[0], position
+        position += 8
+
+
+_lock = threading.Lock()
+# Keyed by process ID, kind and path.
+_values: Dict[Tuple[int, str, str], MmapValues] = {}
+
+
+def enabled() -> bool:
+    return bool(settings.METRICS_DIR)
+
+
+def increment(metric: Metric, labels: Labels, amount: float = 1) -> None:
+    kind = GAUGE if metric.type == GAUGE else COUNTER
+    with _lock:
+        _process_values(kind).increment(_key(metric, "", labels), amount)
+
+
+def observe(metric: Metric, labels: Labels, value: float) -> None:
+    bucket = bisect_left(metric.buckets, value)
+    le = str(metric.buckets[bucket]) if bucket < len(metric.buckets) else "+Inf"
+    with _lock:
+        values = _process_values(COUNTER)
+        values.increment(_key(metric, le, labels))
+        values.increment(_key(metric, "count", labels))
+        values.increment(_key(metric, "sum", labels), value)
+
+
+@lru_cache(maxsize=4096)
+def _key(metric: Metric, suffix: str, labels: Labels) -> str:
+    """
+    The key of a sample: a histogram's bucket (its upper bound), count or sum, or else the sample of the metric. The
+    labels only take a few values, whose keys are cached.
+    """
+    return json.dumps([metric.name, suffix, labels])
+
+
+def _process_values(kind: str) -> MmapValues:
+    """
+    The files of the current process, opened again by forked processes (e.g. the workers of a preforking server).
+    """
+    pid = os.getpid()
+    path = os.path.join(settings.METRICS_DIR, f"{kind}_{pid}.db")
+    values = _values.get((pid, kind, path))
+    if values is None:
+        os.makedirs(settings.METRICS_DIR, exist_ok=True)
+        values = _values[(pid, kind, path)] = MmapValues(path)
+    return values
+
+
+def clear() -> None:
+    """
+    Closes the files of the current process (e.g. when `METRICS_DIR` changes).
+    """
+    with _lock:
+        for (pid, _, _), values in _values.items():
+            if pid == os.getpid():
+                values.close()
+        _values.clear()
+
+
+def collect() -> Dict[str, float]:
+    """
+    Sums the values of every process (only the live ones for the gauges).
+    """
+    totals: Dict[str, float] = defaultdict(float)
+    for path in glob.glob(os.path.join(settings.METRICS_DIR, "*.db")):
+        kind, pid = os.path.basename(path)[: -len(".db")].rsplit("_", 1)
+        if kind == GAUGE and not _alive(int(pid)):
+            continue
+        for key, value in read_values(path):
+            totals[key] += value
+    return totals
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def exposition() -> str:
+    samples: Dict[str, Dict[Labels, Dict[str, float]]] = defaultdict(
+        lambda: defaultdict(dict)
+    )
+    for key, value in collect().items():
+        name, suffix, labels = json.loads(key)
+        samples[name][tuple(tuple(label) for label in labels)][suffix] = value
+
+    lines = []
+    for metric in METRICS:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        for labels, values in sorted(samples[metric.name].items()):
+            if metric.type == HISTOGRAM:
+                lines.extend(_histogram_lines(metric, labels, values))
+            else:
+                lines.append(_line(metric.name, labels, values[""]))
+    return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(
+    metric: Metric, labels: Labels, values: Dict[str, float]
+) -> Iterable[str]:
+    cumulative = 0.0
+    for le in [str(bucket) for bucket in metric.buckets] + ["+Inf"]:
+        cumulative += values.get(le, 0)
+        yield _line(f"{metric.name}_bucket", labels + (("le", le),), cumulative)
+    yield _line(f"{metric.name}_count", labels, values.get("count", 0))
+    yield _line(f"{metric.name}_sum", labels, values.get("sum", 0))
+
+
+def _line(name: str, labels: Labels, value: float) -> str:
+    formatted = ",".join(
+        f'{label}="{_escape(label_value)}"' for label, label_value in labels
+    )
+    return f"{name}{{{formatted}}} {_number(value)}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+@require_GET
+def view(request):
+    # pylint: disable=unused-argument
+    if not enabled():
+        raise Http404()
+    return HttpResponse(
+        exposition(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+class MetricsMiddleware:
+    """
+    Enabled with `METRICS_DIR`. Records the requests in progress once their view is resolved and, once they have
+    been handled, their status, latency and number of queries (as counted by `timing.ServerTimingMiddleware`, which
+    must come after it).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not enabled():
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+            # Spares the view middleware a thread when serving async views.
+            self.process_view = self._aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            self._end_request(request)
+        self._record(request, response, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            self._end_request(request)
+        self._record(request, response, time.perf_counter() - started)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # pylint: disable=unused-argument,method-hidden
+        self._start_request(request)
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        # pylint: disable=unused-argument
+        self._start_request(request)
+
+    @staticmethod
+    def _start_request(request) -> None:
+        request.metrics_labels = _labels(request)
+        increment(IN_PROGRESS, request.metrics_labels)
+
+    @staticmethod
+    def _end_request(request) -> None:
+        labels = getattr(request, "metrics_labels", None)
+        if labels is not None:
+            increment(IN_PROGRESS, labels, -1)
+
+    @staticmethod
+    def _record(request, response, duration: float) -> None:
+        labels = _labels(request)
+        increment(REQUESTS, labels + (("status", str(response.status_code)),))
+        observe(DURATION, labels, duration)
+        timings = getattr(request, "timings", None)
+        if timings is not None:
+            observe(QUERIES, labels, timings.query_counts["db"])
+
+
+def _labels(request) -> Labels:
+    tags = timing.view_tags(request)
+    return (("viewset", tags["viewset"] or ""), ("action", tags["action"] or ""))
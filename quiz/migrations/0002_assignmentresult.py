@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:31
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AssignmentResult",
+            fields=[
+                (
+                    "assignment",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="result",
+                        serialize=False,
+                        to="quiz.assignment",
+                    ),
+                ),
+                ("question_count", models.PositiveIntegerField(default=0)),
+                ("answered_count", models.PositiveIntegerField(default=0)),
+                ("correct_count", models.PositiveIntegerField(default=0)),
+                ("score", models.FloatField(default=0.0)),
+                ("progress", models.FloatField(default=0.0)),
+                ("updated_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "quiz",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="results",
+                        to="quiz.quiz",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0002_assignmentresult"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="quiz",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0003_quiz_version"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="choice",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name="question",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name="quiz",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
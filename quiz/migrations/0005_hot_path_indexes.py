@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0004_updated_at_auto_now"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="answer",
+            index=models.Index(
+                fields=["assignment", "choice"], name="answer_assignment_choice_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(fields=["quiz", "id"], name="assignment_quiz_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(fields=["user", "id"], name="assignment_user_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(
+                fields=["quiz", "user"], name="assignment_quiz_user_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(
+                condition=models.Q(("submited_at__isnull", True)),
+                fields=["user", "id"],
+                name="assignment_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(fields=["user", "id"], name="question_user_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="quiz",
+            index=models.Index(fields=["user", "id"], name="quiz_user_id_idx"),
+        ),
+    ]
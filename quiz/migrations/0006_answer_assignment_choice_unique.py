@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:43
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def delete_duplicated_answers(apps, schema_editor):
+    """
+    Keeps the first answer of every (assignment, choice) pair. Results of the affected assignments should be rebuilt
+    afterwards with `python manage.py reconcile_results`.
+    """
+    # pylint: disable=unused-argument
+    Answer = apps.get_model("quiz", "Answer")
+    first_ids = (
+        Answer.objects.values("assignment_id", "choice_id")
+        .annotate(first_id=Min("id"))
+        .values("first_id")
+    )
+    Answer.objects.exclude(pk__in=first_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0005_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicated_answers, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="answer",
+            name="answer_assignment_choice_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="answer",
+            constraint=models.UniqueConstraint(
+                fields=("assignment", "choice"), name="answer_assignment_choice_unique"
+            ),
+        ),
+    ]
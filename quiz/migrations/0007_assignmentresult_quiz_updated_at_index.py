@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0006_answer_assignment_choice_unique"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assignmentresult",
+            index=models.Index(
+                fields=["quiz", "updated_at"], name="result_quiz_updated_at_idx"
+            ),
+        ),
+    ]
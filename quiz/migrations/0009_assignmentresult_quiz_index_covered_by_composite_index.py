@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0008_fk_indexes_covered_by_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="assignmentresult",
+            name="quiz",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="results",
+                to="quiz.quiz",
+            ),
+        ),
+    ]
@@ -1,5 +1,6 @@
 import django.contrib.auth.models as auth_models
 from django.db import models
+from django.db.models import F
 from django.utils import timezone
 
 
@@ -9,7 +10,7 @@ class User(auth_models.AbstractUser):
 
 class BaseModel(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
-    updated_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         abstract = True
@@ -18,24 +19,52 @@ class BaseModel(models.Model):
 class Question(BaseModel):
 
     text = models.TextField()
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Indexed by `question_user_id_idx`.
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
+
+    class Meta:
+        indexes = [models.Index(fields=["user", "id"], name="question_user_id_idx")]
 
     def __str__(self):
         return f"text='{self.text}' | user={self.user.username}"
 
 
+class QuizQuerySet(models.QuerySet):
+
+    def bump_version(self):
+        """
+        Invalidates everything cached for the quizzes (e.g. their answer keys and quizzee payloads), which must be
+        done whenever the quizzes, their questions or the question's choices change.
+        """
+        return self.update(version=F("version") + 1, updated_at=timezone.now())
+
+
 class Quiz(BaseModel):
 
     description = models.TextField()
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Indexed by `quiz_user_id_idx`.
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
     questions = models.ManyToManyField(Question, related_name="quizzes")
+    version = models.PositiveIntegerField(default=1)
+
+    objects = QuizQuerySet.as_manager()
 
     class Meta:
         verbose_name_plural = "quizzes"
+        indexes = [models.Index(fields=["user", "id"], name="quiz_user_id_idx")]
 
     def __str__(self):
         return f"description='{self.description}' | user={self.user.username}"
 
+    @staticmethod
+    def cache_version(version: int, updated_at) -> str:
+        """
+        Identifies a state of a quiz in cache keys. The version alone isn't enough: when a transaction which bumped it
+        rolls back, the next bump reuses it, while entries may have been cached for it within the transaction. The time
+        of the bump, which `updated_at` records along with it, isn't reused.
+        """
+        return f"{version}.{updated_at:%Y%m%d%H%M%S%f}"
+
 
 class Choice(BaseModel):
 
@@ -51,10 +80,27 @@ class Choice(BaseModel):
 
 class Assignment(models.Model):
 
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
-    quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE, related_name="assignments")
+    # Indexed by `assignment_user_id_idx` and `assignment_quiz_id_idx`.
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
+    quiz = models.ForeignKey(
+        Quiz, on_delete=models.CASCADE, related_name="assignments", db_index=False
+    )
     submited_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        # Lists are filtered by quiz (quizzers, `?quiz_id=`), by user (quizzees, `?user_id=`) or by both, and
+        # paginated by ID.
+        indexes = [
+            models.Index(fields=["quiz", "id"], name="assignment_quiz_id_idx"),
+            models.Index(fields=["user", "id"], name="assignment_user_id_idx"),
+            models.Index(fields=["quiz", "user"], name="assignment_quiz_user_idx"),
+            models.Index(
+                fields=["user", "id"],
+                name="assignment_pending_idx",
+                condition=models.Q(submited_at__isnull=True),
+            ),
+        ]
+
     @property
     def score(self):
         """
@@ -93,6 +139,38 @@ class Assignment(models.Model):
         return f"{self.quiz.description} | {self.user} | {self.submited_at if self.submited_at else 'PENDING'}"
 
 
+class AssignmentResult(models.Model):
+    """
+    Denormalized grade of an assignment, kept up to date by `quiz.results` whenever answers, submissions or quizzes
+    change, so that reading a result is a single row fetch.
+    """
+
+    assignment = models.OneToOneField(
+        Assignment, on_delete=models.CASCADE, primary_key=True, related_name="result"
+    )
+    # Indexed by `result_quiz_updated_at_idx`.
+    quiz = models.ForeignKey(
+        Quiz, on_delete=models.CASCADE, related_name="results", db_index=False
+    )
+    question_count = models.PositiveIntegerField(default=0)
+    answered_count = models.PositiveIntegerField(default=0)
+    correct_count = models.PositiveIntegerField(default=0)
+    score = models.FloatField(default=0.0)
+    progress = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        # Leaderboards catch up with the results of a quiz updated since they were last read (see `quiz.leaderboards`).
+        indexes = [
+            models.Index(
+                fields=["quiz", "updated_at"], name="result_quiz_updated_at_idx"
+            )
+        ]
+
+    def __str__(self):
+        return f"assignment={self.assignment_id} | score={self.score} | progress={self.progress}"
+
+
 class Answer(models.Model):
 
     assignment = models.ForeignKey(
@@ -100,7 +178,13 @@ class Answer(models.Model):
     )
     choice = models.ForeignKey(Choice, on_delete=models.CASCADE)
 
-    unique_together = [["user", "assignment", "choice"]]
+    class Meta:
+        # The constraint's index also serves the lookups of the answers to an assignment.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["assignment", "choice"], name="answer_assignment_choice_unique"
+            )
+        ]
 
     def __str__(self):
         return f"question={self.choice} | user={self.assignment.user.username}"
@@ -0,0 +1,13 @@
+from rest_framework import pagination
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination ordered by primary key, so that every page (no matter how deep) is fetched with an indexed
+    range scan rather than an OFFSET. The page size defaults to `REST_FRAMEWORK["PAGE_SIZE"]` and may be overridden by
+    clients with `page_size`, up to `max_page_size`.
+    """
+
+    ordering = "id"
+    page_size_query_param = "page_size"
+    max_page_size = 1000
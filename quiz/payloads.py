@@ -0,0 +1,108 @@
+"""
+Pre-serialized quiz payloads for quizzees.
+
+The quizzee's view of a quiz (questions and choices, without the correct answers) is the same for every quizzee, so it
+is rendered once per quiz version (see `Quiz.cache_version`) and cached as JSON bytes (plus a gzipped variant) in the
+shared Django cache, as soon as the quiz's questions or choices change (see `signals.quiz_changed`) or else on the first
+request. Assignment responses splice the cached quiz body in rather than serializing the quiz again.
+"""
+
+import gzip
+import re
+from typing import Dict, Iterable, NamedTuple
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework.renderers import JSONRenderer
+
+from . import models, serializers
+
+CACHE_TIMEOUT = 24 * 60 * 60
+
+ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+
+
+class Payload(NamedTuple):
+    json: bytes
+    gzip: bytes
+
+
+def quizzee_quiz_payload(quiz: models.Quiz) -> Payload:
+    """
+    Returns the rendered `QuizQuizzeeDetailSerializer` payload of the quiz, which only hits the database on a cache
+    miss.
+    """
+    payload = cache.get(_cache_key(quiz))
+    if payload is None:
+        payload = _cache_payloads(models.Quiz.objects.filter(pk=quiz.pk))[quiz.pk]
+    return payload
+
+
+def refresh_quizzee_payloads(quiz_ids: Iterable[int]) -> None:
+    """
+    Renders and caches the payloads of the (changed) quizzes, so that their quizzees don't have to.
+    """
+    _cache_payloads(models.Quiz.objects.filter(pk__in=list(quiz_ids)))
+
+
+async def aquizzee_quiz_payload(quiz: models.Quiz) -> Payload:
+    """
+    Async counterpart of `quizzee_quiz_payload`, which only leaves the event loop (to render the payload) on a cache
+    miss.
+    """
+    payload = await cache.aget(_cache_key(quiz))
+    if payload is None:
+        payload = await sync_to_async(quizzee_quiz_payload)(quiz)
+    return payload
+
+
+def quiz_response(request, quiz: models.Quiz) -> HttpResponse:
+    payload = quizzee_quiz_payload(quiz)
+    if ACCEPTS_GZIP.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+        response = HttpResponse(payload.gzip, content_type="application/json")
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(payload.json, content_type="application/json")
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
+
+
+def assignment_response(assignment: models.Assignment) -> HttpResponse:
+    """
+    Renders the `AssignmentQuizzeeDetailSerializer` payload of the assignment by splicing the cached quiz payload into
+    the assignment's own fields.
+    """
+    return _assignment_response(assignment, quizzee_quiz_payload(assignment.quiz))
+
+
+async def aassignment_response(assignment: models.Assignment) -> HttpResponse:
+    return _assignment_response(
+        assignment, await aquizzee_quiz_payload(assignment.quiz)
+    )
+
+
+def _assignment_response(
+    assignment: models.Assignment, payload: Payload
+) -> HttpResponse:
+    head = JSONRenderer().render(serializers.AssignmentStateSerializer(assignment).data)
+    body = head[:-1] + b',"quiz":' + payload.json + b"}"
+    return HttpResponse(body, content_type="application/json")
+
+
+def _cache_payloads(quizzes) -> Dict[int, Payload]:
+    payloads = {}
+    cached = {}
+    for quiz in quizzes.prefetch_related("questions__choices"):
+        body = JSONRenderer().render(serializers.QuizQuizzeeDetailSerializer(quiz).data)
+        payloads[quiz.id] = cached[_cache_key(quiz)] = Payload(
+            body, gzip.compress(body, mtime=0)
+        )
+    cache.set_many(cached, CACHE_TIMEOUT)
+    return payloads
+
+
+def _cache_key(quiz: models.Quiz) -> str:
+    version = models.Quiz.cache_version(quiz.version, quiz.updated_at)
+    return f"quiz:quizzee-payload:{quiz.id}:{version}"
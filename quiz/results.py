@@ -0,0 +1,139 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, List, Optional, Set
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import models, scoring
+
+CHUNK_SIZE = 1000
+
+RESULT_FIELDS = [
+    "question_count",
+    "answered_count",
+    "correct_count",
+    "score",
+    "progress",
+    "updated_at",
+]
+
+_deferred: ContextVar[Optional[Set[int]]] = ContextVar("deferred", default=None)
+
+
+@contextmanager
+def deferred() -> Iterator[None]:
+    """
+    Collects the assignments refreshed inside the block (e.g. by the signals sent while answers are deleted one by
+    one) and refreshes each of them only once, when the block exits without errors.
+    """
+    pending: Set[int] = set()
+    token = _deferred.set(pending)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
+    refresh_results(pending)
+
+
+def refresh_results(assignment_ids: Iterable[int]) -> None:
+    """
+    Recomputes the `AssignmentResult` rows of the given assignments (e.g. after an answer has been created or an
+    assignment has been submitted).
+    """
+    pending = _deferred.get()
+    if pending is not None:
+        pending.update(assignment_ids)
+        return
+    _store(
+        models.Assignment.objects.filter(pk__in=list(assignment_ids)).only(
+            "id", "quiz_id"
+        )
+    )
+
+
+def refresh_quiz_results(quiz_ids: Iterable[int], chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Recomputes the `AssignmentResult` rows of every assignment of the given quizzes (e.g. after the quiz's questions
+    or the question's choices have changed), chunk by chunk.
+    """
+    assignments = models.Assignment.objects.filter(quiz_id__in=list(quiz_ids))
+    return _store_in_chunks(assignments, chunk_size)
+
+
+def reconcile(chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Rebuilds every `AssignmentResult` row from the `Answer` rows.
+    """
+    return _store_in_chunks(models.Assignment.objects.all(), chunk_size)
+
+
+def ensure_results(assignments: List[models.Assignment]) -> None:
+    """
+    Creates the missing `AssignmentResult` rows of already fetched assignments (e.g. assignments created before
+    results were introduced) and attaches them to the instances.
+    """
+    missing = {
+        assignment.id: assignment
+        for assignment in assignments
+        if not hasattr(assignment, "result")
+    }
+    for result in _store(missing.values()):
+        missing[result.assignment_id].result = result
+
+
+def _store_in_chunks(assignments, chunk_size: int) -> int:
+    count = 0
+    chunk = []
+    for assignment in (
+        assignments.only("id", "quiz_id").order_by("id").iterator(chunk_size=chunk_size)
+    ):
+        chunk.append(assignment)
+        if len(chunk) == chunk_size:
+            count += len(_store(chunk))
+            chunk = []
+    if chunk:
+        count += len(_store(chunk))
+    return count
+
+
+def _store(assignments: Iterable[models.Assignment]) -> List[models.AssignmentResult]:
+    assignments = list(assignments)
+    grades = scoring.grade_assignments(assignments)
+    now = timezone.now()
+    results = [
+        models.AssignmentResult(
+            assignment_id=assignment.id,
+            quiz_id=assignment.quiz_id,
+            question_count=grades[assignment.id].question_count,
+            answered_count=grades[assignment.id].answered_count,
+            correct_count=grades[assignment.id].correct_count,
+            score=grades[assignment.id].score,
+            progress=grades[assignment.id].progress,
+            updated_at=now,
+        )
+        for assignment in assignments
+    ]
+    if results:
+        models.AssignmentResult.objects.bulk_create(
+            results,
+            update_conflicts=True,
+            unique_fields=["assignment"],
+            update_fields=RESULT_FIELDS,
+        )
+        if transaction.get_connection().in_atomic_block:
+            _stamp_on_commit([result.assignment_id for result in results])
+    return results
+
+
+def _stamp_on_commit(assignment_ids: List[int]) -> None:
+    """
+    Stamps the results again once the transaction commits, so that `updated_at` follows the commit order: readers only
+    catching up with the results updated since their last read (see `quiz.leaderboards`) would otherwise miss the
+    results of long transactions.
+    """
+    transaction.on_commit(
+        lambda: models.AssignmentResult.objects.filter(
+            assignment_id__in=assignment_ids
+        ).update(updated_at=timezone.now())
+    )
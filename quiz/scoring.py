@@ -0,0 +1,86 @@
+from collections import defaultdict
+from typing import Dict, Iterable, NamedTuple
+
+from django.db.models import Count, Q
+
+from . import answer_keys, models
+
+
+class Grade(NamedTuple):
+    question_count: int
+    answered_count: int
+    correct_count: int
+
+    @property
+    def score(self) -> float:
+        """
+        Same "all or nothing" score as `Assignment.score`, that is, the percentage of questions whose selected choices
+        match the correct choices perfectly.
+        """
+        if not self.question_count:
+            return 0.0
+        return self.correct_count / self.question_count * 100
+
+    @property
+    def progress(self) -> float:
+        """
+        Same progress as `Assignment.progress`, that is, the percentage of answered questions.
+        """
+        if not self.question_count:
+            return 0.0
+        return self.answered_count / self.question_count * 100
+
+
+def grade_assignments(assignments: Iterable[models.Assignment]) -> Dict[int, Grade]:
+    """
+    Grades a whole batch of assignments with a constant number of aggregate queries (regardless of the number of
+    assignments or questions), rather than two queries per question and assignment as `Assignment.score` does. The
+    correct choices are read from the (cached) answer keys of the quizzes.
+
+    A question is correct when the number of selected choices and the number of distinct selected correct choices
+    both equal the number of correct choices, which is equivalent to the ordered list comparison in `Assignment.score`.
+    """
+    assignments = list(assignments)
+    if not assignments:
+        return {}
+
+    keys = answer_keys.get_answer_keys(
+        {assignment.quiz_id for assignment in assignments}
+    )
+
+    selections = {
+        (row["assignment_id"], row["choice__question_id"]): (
+            row["selected"],
+            row["selected_correct"],
+        )
+        for row in models.Answer.objects.filter(
+            assignment_id__in=[assignment.id for assignment in assignments]
+        )
+        .values("assignment_id", "choice__question_id")
+        .annotate(
+            selected=Count("id"),
+            selected_correct=Count(
+                "choice_id", distinct=True, filter=Q(choice__is_correct=True)
+            ),
+        )
+    }
+
+    answered_counts: Dict[int, int] = defaultdict(int)
+    for assignment_id, _ in selections:
+        answered_counts[assignment_id] += 1
+
+    grades = {}
+    for assignment in assignments:
+        answer_key = keys.get(assignment.quiz_id, {})
+        correct = 0
+        for question_id, correct_choices in answer_key.items():
+            selected, selected_correct = selections.get(
+                (assignment.id, question_id), (0, 0)
+            )
+            if selected == selected_correct == len(correct_choices):
+                correct += 1
+        grades[assignment.id] = Grade(
+            len(answer_key), answered_counts[assignment.id], correct
+        )
+
+    return grades
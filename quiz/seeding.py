@@ -0,0 +1,311 @@
+"""
+Deterministic generation of production-scale datasets (see the `seed_load` command), e.g. for benchmarks and capacity
+planning.
+
+Every value is drawn from a random number generator seeded with `Options.seed`, and rows get explicit primary keys
+following the existing rows, so that the same seed and options generate the same dataset on an empty database. Rows
+are inserted with raw `executemany` statements (bypassing the ORM and its signals), one transaction per batch of
+assignments (with their answers and results). The popularity of the quizzes follows a Zipf distribution: the quiz of
+rank `r` is assigned in proportion to `1 / r ** skew`.
+
+The `AssignmentResult` rows are computed while the answers are generated, exactly as `results.reconcile` would.
+"""
+
+import random
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from itertools import accumulate
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple, Type
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection
+from django.db import models as db_models
+from django.db import transaction
+from django.db.models import Max
+
+from . import models
+
+START = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+
+# Window (from `START`) over which the assignments are submitted.
+SUBMISSION_WINDOW = timedelta(days=30)
+
+# Probability that a question has two correct choices rather than one.
+MULTIPLE_CORRECT_RATE = 0.25
+
+# Probability that a submitted assignment answers every question.
+COMPLETION_RATE = 0.9
+
+
+class Options(NamedTuple):
+    seed: int = 0
+    quizzers: int = 50
+    quizzees: int = 100_000
+    quizzes: int = 500
+    questions: int = 20
+    choices: int = 4
+    assignments: int = 300_000
+    submitted: float = 0.6
+    skew: float = 1.1
+    batch_size: int = 10_000
+    password: str = "password"
+
+
+class Report(NamedTuple):
+    users: int
+    quizzes: int
+    questions: int
+    choices: int
+    assignments: int
+    answers: int
+
+
+class QuizKey(NamedTuple):
+    id: int
+    # (question ID, correct choice ID's, wrong choice ID's) of each question.
+    questions: List[Tuple[int, List[int], List[int]]]
+
+
+def seed(options: Options) -> Report:
+    rng = random.Random(options.seed)
+    ids = _next_ids()
+    # The same salt makes the same hash, hashed once for every user.
+    password = make_password(options.password, salt=f"seed{options.seed}")
+
+    quizzer_ids = _insert_users(
+        ids, password, options.quizzers, "load_quizzer", is_quizzer=True
+    )
+    quizzee_ids = _insert_users(
+        ids, password, options.quizzees, "load_quizzee", is_quizzer=False
+    )
+    keys = _insert_quizzes(rng, ids, options, quizzer_ids)
+    answer_count = _insert_assignments(rng, ids, options, keys, quizzee_ids)
+    _reset_sequences()
+
+    return Report(
+        users=len(quizzer_ids) + len(quizzee_ids),
+        quizzes=len(keys),
+        questions=options.quizzes * options.questions,
+        choices=options.quizzes * options.questions * options.choices,
+        assignments=options.assignments,
+        answers=answer_count,
+    )
+
+
+def _insert_users(
+    ids: Dict[str, int], password: str, count: int, prefix: str, is_quizzer: bool
+) -> List[int]:
+    user_ids = _take_ids(ids, models.User, count)
+    joined = _timestamp(START)
+    with transaction.atomic():
+        _insert(
+            models.User,
+            ["id", "password", "is_superuser", "username", "first_name", "last_name"]
+            + ["email", "is_staff", "is_active", "date_joined", "is_quizzer"],
+            [
+                (user_id, password, False, f"{prefix}_{user_id}", "", "")
+                + (f"{prefix}_{user_id}@example.com", False, True, joined, is_quizzer)
+                for user_id in user_ids
+            ],
+        )
+    return user_ids
+
+
+def _insert_quizzes(
+    rng: random.Random, ids: Dict[str, int], options: Options, quizzer_ids: List[int]
+) -> List[QuizKey]:
+    created = _timestamp(START)
+    quizzes, questions, choices, links = [], [], [], []
+    keys = []
+    for quiz_id in _take_ids(ids, models.Quiz, options.quizzes):
+        quizzer_id = rng.choice(quizzer_ids)
+        quizzes.append((quiz_id, created, created, quizzer_id, f"Quiz {quiz_id}", 1))
+        key = QuizKey(quiz_id, [])
+        for question_id in _take_ids(ids, models.Question, options.questions):
+            questions.append(
+                (question_id, created, created, f"Question {question_id}", quizzer_id)
+            )
+            links.append(
+                (
+                    _take_ids(ids, models.Quiz.questions.through, 1)[0],
+                    quiz_id,
+                    question_id,
+                )
+            )
+            key.questions.append(
+                (question_id,) + _add_choices(rng, ids, options, question_id, choices)
+            )
+        keys.append(key)
+
+    timestamps = ["id", "created_at", "updated_at"]
+    with transaction.atomic():
+        _insert(
+            models.Quiz, timestamps + ["user_id", "description", "version"], quizzes
+        )
+        _insert(models.Question, timestamps + ["text", "user_id"], questions)
+        _insert(
+            models.Choice, timestamps + ["text", "question_id", "is_correct"], choices
+        )
+        _insert(models.Quiz.questions.through, ["id", "quiz_id", "question_id"], links)
+    return keys
+
+
+def _add_choices(
+    rng: random.Random,
+    ids: Dict[str, int],
+    options: Options,
+    question_id: int,
+    choices: List[Tuple[Any, ...]],
+) -> Tuple[List[int], List[int]]:
+    """
+    Appends the rows of the choices of the question to `choices`, returning the ID's of its correct and wrong choices.
+    """
+    created = _timestamp(START)
+    choice_ids = _take_ids(ids, models.Choice, options.choices)
+    correct_count = 2 if rng.random() < MULTIPLE_CORRECT_RATE else 1
+    correct = rng.sample(choice_ids, min(correct_count, len(choice_ids)))
+    for choice_id in choice_ids:
+        choices.append(
+            (choice_id, created, created, f"Choice {choice_id}", question_id)
+            + (choice_id in correct,)
+        )
+    return sorted(correct), [choice for choice in choice_ids if choice not in correct]
+
+
+def _insert_assignments(
+    rng: random.Random,
+    ids: Dict[str, int],
+    options: Options,
+    keys: Sequence[QuizKey],
+    quizzee_ids: List[int],
+) -> int:
+    # pylint: disable=too-many-locals
+    cumulative_weights = list(
+        accumulate(1 / rank**options.skew for rank in range(1, len(keys) + 1))
+    )
+    answer_count = 0
+    remaining = options.assignments
+    while remaining > 0:
+        batch_size = min(options.batch_size, remaining)
+        remaining -= batch_size
+        assignments, assignment_results, answers = [], [], []
+        for assignment_id in _take_ids(ids, models.Assignment, batch_size):
+            key = rng.choices(keys, cum_weights=cumulative_weights)[0]
+            submitted = rng.random() < options.submitted
+            submited_at = (
+                _timestamp(START + SUBMISSION_WINDOW * rng.random())
+                if submitted
+                else None
+            )
+            assignments.append(
+                (assignment_id, rng.choice(quizzee_ids), key.id, submited_at)
+            )
+
+            question_count = len(key.questions)
+            answered_count = (
+                question_count
+                if submitted and rng.random() < COMPLETION_RATE
+                else rng.randint(0, question_count)
+            )
+            ability = rng.random()
+            correct_count = 0
+            for _, correct, wrong in rng.sample(key.questions, answered_count):
+                if not wrong or rng.random() < ability:
+                    selected = correct
+                    correct_count += 1
+                else:
+                    selected = [rng.choice(wrong)]
+                answers.extend(
+                    (answer_id, assignment_id, choice_id)
+                    for answer_id, choice_id in zip(
+                        _take_ids(ids, models.Answer, len(selected)), selected
+                    )
+                )
+            assignment_results.append(
+                (assignment_id, key.id, question_count, answered_count, correct_count)
+                + (
+                    _percentage(correct_count, question_count),
+                    _percentage(answered_count, question_count),
+                    submited_at or _timestamp(START),
+                )
+            )
+
+        with transaction.atomic():
+            _insert(
+                models.Assignment,
+                ["id", "user_id", "quiz_id", "submited_at"],
+                assignments,
+            )
+            _insert(
+                models.AssignmentResult,
+                ["assignment_id", "quiz_id", "question_count", "answered_count"]
+                + ["correct_count", "score", "progress", "updated_at"],
+                assignment_results,
+            )
+            _insert(models.Answer, ["id", "assignment_id", "choice_id"], answers)
+        answer_count += len(answers)
+    return answer_count
+
+
+def _insert(
+    model: Type[db_models.Model], columns: List[str], rows: List[Tuple[Any, ...]]
+) -> None:
+    # pylint: disable=protected-access
+    if not rows:
+        return
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {quote(model._meta.db_table)} "
+            f"({', '.join(quote(column) for column in columns)}) "
+            f"VALUES ({', '.join(['%s'] * len(columns))})",
+            rows,
+        )
+
+
+def _next_ids() -> Dict[str, int]:
+    # pylint: disable=protected-access
+    return {
+        model._meta.label: (model.objects.aggregate(last=Max("pk"))["last"] or 0) + 1
+        for model in _models()
+    }
+
+
+def _take_ids(
+    ids: Dict[str, int], model: Type[db_models.Model], count: int
+) -> List[int]:
+    # pylint: disable=protected-access
+    first = ids[model._meta.label]
+    ids[model._meta.label] = first + count
+    return list(range(first, first + count))
+
+
+def _reset_sequences() -> None:
+    """
+    Moves the sequences past the explicit primary keys (PostgreSQL, SQLite's `AUTOINCREMENT` does it by itself).
+    """
+    statements = connection.ops.sequence_reset_sql(no_style(), _models())
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def _models() -> List[Type[db_models.Model]]:
+    return [
+        models.User,
+        models.Quiz,
+        models.Question,
+        models.Choice,
+        models.Quiz.questions.through,
+        models.Assignment,
+        models.Answer,
+    ]
+
+
+def _timestamp(value: datetime):
+    return connection.ops.adapt_datetimefield_value(value)
+
+
+def _percentage(count: int, total: int) -> float:
+    return count / total * 100 if total else 0.0
@@ -1,8 +1,10 @@
 import logging
 
+from django.db import transaction
+from django.db.models import Exists, OuterRef
 from rest_framework import serializers
 
-from . import models
+from . import answer_buffer, importers, models, results
 
 logger = logging.getLogger(__name__)
 
@@ -49,10 +51,10 @@ class AssignmentListQuizzeeSerializer(serializers.ModelSerializer):
         fields = ["id", "submited_at", "quiz", "progress", "score"]
 
     def get_progress(self, instance):
-        return instance.progress
+        return instance.result.progress
 
     def get_score(self, instance):
-        return instance.score
+        return instance.result.score
 
 
 class AssignmentListQuizzerSerializer(serializers.ModelSerializer):
@@ -67,10 +69,10 @@ class AssignmentListQuizzerSerializer(serializers.ModelSerializer):
         fields = ["id", "user", "submited_at", "quiz", "progress", "score"]
 
     def get_progress(self, instance):
-        return instance.progress
+        return instance.result.progress
 
     def get_score(self, instance):
-        return instance.score
+        return instance.result.score
 
 
 class AnswerListSerializer(serializers.ModelSerializer):
@@ -82,7 +84,7 @@ class AnswerListSerializer(serializers.ModelSerializer):
         fields = ["id", "assignment", "question", "choice"]
 
     def get_question(self, instance):
-        return instance.choice.question.id
+        return instance.choice.question_id
 
 
 # Detail serializers
@@ -142,6 +144,13 @@ class AssignmentQuizzerDetailSerializer(serializers.ModelSerializer):
         fields = ["id", "user", "submited_at", "quiz"]
 
 
+class AssignmentStateSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = models.Assignment
+        fields = ["id", "submited_at"]
+
+
 class AssignmentQuizzeeDetailSerializer(serializers.ModelSerializer):
 
     quiz = QuizQuizzeeDetailSerializer()
@@ -241,29 +250,365 @@ class AnswerCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = models.Answer
         fields = ["id", "assignment", "choice"]
+        # Retries are not an error (see `create`), so the validator derived from the unique constraint is dropped.
+        validators = []  # type: ignore
 
     def create(self, validated_data):
-        assignment = models.Assignment.objects.get(pk=validated_data["assignment"])
-        choice = models.Choice.objects.get(pk=validated_data["choice"])
-        answer = models.Answer.objects.create(assignment=assignment, choice=choice)
+        """
+        Inserts the answer unless it already exists (e.g. when a client retries after a timeout), in a single
+        statement, which is why the result of the assignment is refreshed explicitly. Retries of answers which were
+        already inserted cost nothing more than the validation query. With `ANSWER_BUFFER` enabled, the answer is
+        buffered instead (see `answer_buffer`).
+        """
+        answer = models.Answer(
+            assignment_id=validated_data["assignment"],
+            choice_id=validated_data["choice"],
+        )
+        if self.context["answered"]:
+            return answer
+        if answer_buffer.enabled():
+            answer_buffer.append(self.context["request"].user.id, answer)
+            return answer
+        models.Answer.objects.bulk_create([answer], ignore_conflicts=True)
+        results.refresh_results([answer.assignment_id])
         return answer
 
+    def validate(self, attrs):
+        """
+        Validates the assignment (of the user and not submitted) and the choice (of the assignment's quiz) with a
+        single query, which also tells whether the answer already exists.
+        """
+        assignment = (
+            models.Assignment.objects.filter(
+                pk=attrs["assignment"], user=self.context["request"].user
+            )
+            .annotate(
+                valid_choice=Exists(
+                    models.Choice.objects.filter(
+                        pk=attrs["choice"], question__quizzes=OuterRef("quiz_id")
+                    )
+                ),
+                answered=Exists(
+                    models.Answer.objects.filter(
+                        assignment=OuterRef("pk"), choice=attrs["choice"]
+                    )
+                ),
+            )
+            .values("submited_at", "valid_choice", "answered")
+            .first()
+        )
+        if assignment is None:
+            raise serializers.ValidationError(
+                {"assignment": ["The assignment does not exist."]}
+            )
+
+        errors = {}
+        if assignment["submited_at"] is not None:
+            errors["assignment"] = ["The assigment has already been submitted."]
+        if not assignment["valid_choice"]:
+            errors["choice"] = [
+                "The choice is not an valid answer to the assignment's quiz."
+            ]
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        self.context["answered"] = assignment["answered"]
+        return attrs
+
+    def to_representation(self, instance):
+        return {"assignment": instance.assignment_id, "choice": instance.choice_id}
+
+
+# Bulk serializers
+
+
+class AnswerSheetQuestionSerializer(serializers.Serializer):
+    # pylint: disable=abstract-method
+
+    question = serializers.IntegerField()
+    choices = serializers.ListField(child=serializers.IntegerField(), allow_empty=True)
+
+
+class AnswerSheetSerializer(serializers.Serializer):
+    """
+    Replaces the answers of an assignment to the given questions by the given choices (an empty list of choices
+    clears the answers to the question). Questions not in the sheet are left untouched.
+    """
+
+    # pylint: disable=abstract-method
+
+    assignment = serializers.IntegerField()
+    answers = AnswerSheetQuestionSerializer(many=True)
+
     def validate_assignment(self, value):
-        assignment = models.Assignment.objects.get(pk=value)
-        if assignment and assignment.submited_at is not None:
+        assignment = (
+            models.Assignment.objects.filter(
+                pk=value, user=self.context["request"].user
+            )
+            .only("id", "quiz_id", "submited_at")
+            .first()
+        )
+        if assignment is None:
+            raise serializers.ValidationError("The assignment does not exist.")
+        if assignment.submited_at is not None:
             raise serializers.ValidationError(
                 "The assigment has already been submitted."
             )
+        self.context["assignment"] = assignment
         return value
 
-    def validate_choice(self, value):
-        assignment = models.Assignment.objects.get(pk=self.initial_data["assignment"])
-        choice = models.Choice.objects.get(pk=value)
-        if not assignment.quiz.questions.contains(choice.question):
+    def validate(self, attrs):
+        assignment = self.context["assignment"]
+        questions = [answer["question"] for answer in attrs["answers"]]
+        if len(questions) != len(set(questions)):
             raise serializers.ValidationError(
-                "The choice is not an valid answer to the assignment's quiz."
+                {"answers": ["Each question may only appear once in the sheet."]}
             )
-        return value
+
+        quiz_choices = dict(
+            models.Choice.objects.filter(
+                question_id__in=questions, question__quizzes=assignment.quiz_id
+            ).values_list("id", "question_id")
+        )
+        quiz_questions = set(quiz_choices.values())
+
+        errors = []
+        for answer in attrs["answers"]:
+            error = {}
+            if answer["question"] not in quiz_questions:
+                error["question"] = [
+                    "The question is not part of the assignment's quiz."
+                ]
+            elif any(
+                quiz_choices.get(choice) != answer["question"]
+                for choice in answer["choices"]
+            ):
+                error["choices"] = [
+                    "The choice is not an valid answer to the assignment's quiz."
+                ]
+            errors.append(error)
+        if any(errors):
+            raise serializers.ValidationError({"answers": errors})
+
+        return attrs
+
+    def create(self, validated_data):
+        assignment = self.context["assignment"]
+        selected = {
+            choice
+            for answer in validated_data["answers"]
+            for choice in answer["choices"]
+        }
+
+        with transaction.atomic(), results.deferred():
+            existing = dict(
+                models.Answer.objects.filter(
+                    assignment=assignment,
+                    choice__question_id__in=[
+                        answer["question"] for answer in validated_data["answers"]
+                    ],
+                ).values_list("choice_id", "id")
+            )
+            models.Answer.objects.filter(
+                pk__in=[
+                    answer_id
+                    for choice, answer_id in existing.items()
+                    if choice not in selected
+                ]
+            ).delete()
+            models.Answer.objects.bulk_create(
+                [
+                    models.Answer(assignment=assignment, choice_id=choice)
+                    for choice in sorted(selected - existing.keys())
+                ],
+                ignore_conflicts=True,
+            )
+            results.refresh_results([assignment.id])
+
+        return validated_data
+
+
+class QuestionImportSerializer(serializers.Serializer):
+    # pylint: disable=abstract-method
+
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=importers.FORMATS, required=False)
+    quiz = serializers.IntegerField(required=False)
+
+    def validate_quiz(self, value):
+        quiz = models.Quiz.objects.filter(
+            pk=value, user=self.context["request"].user
+        ).first()
+        if quiz is None:
+            raise serializers.ValidationError("The quiz does not exist.")
+        return quiz
+
+    def validate(self, attrs):
+        if "format" not in attrs:
+            extension = attrs["file"].name.rsplit(".", 1)[-1].lower()
+            if extension not in importers.FORMATS:
+                raise serializers.ValidationError(
+                    {"format": ["The format could not be inferred from the file name."]}
+                )
+            attrs["format"] = extension
+        return attrs
+
+
+class AssignmentBulkCreateSerializer(serializers.Serializer):
+    """
+    Assigns a quiz to a list of users or to the users of a group (cohort), skipping users who already have an
+    assignment for the quiz, and summarizes the outcome rather than returning every assignment.
+    """
+
+    # pylint: disable=abstract-method
+
+    CHUNK_SIZE = 1000
+
+    quiz = serializers.IntegerField()
+    users = serializers.ListField(child=serializers.IntegerField(), required=False)
+    group = serializers.CharField(required=False)
+
+    def validate_quiz(self, value):
+        quiz = models.Quiz.objects.filter(
+            pk=value, user=self.context["request"].user
+        ).first()
+        if quiz is None:
+            raise serializers.ValidationError("The quiz does not exist.")
+        return quiz
+
+    def validate(self, attrs):
+        if ("users" in attrs) == ("group" in attrs):
+            raise serializers.ValidationError(
+                "Either a list of users or a group must be given."
+            )
+        return attrs
+
+    def create(self, validated_data):
+        quiz = validated_data["quiz"]
+        quizzees = models.User.objects.filter(is_quizzer=False)
+        if "users" in validated_data:
+            requested = list(dict.fromkeys(validated_data["users"]))
+            quizzees = quizzees.filter(pk__in=requested)
+        else:
+            quizzees = quizzees.filter(groups__name=validated_data["group"])
+
+        candidates = set(quizzees.values_list("id", flat=True))
+        if "group" in validated_data:
+            requested = sorted(candidates)
+        existing = set(
+            models.Assignment.objects.filter(
+                quiz=quiz, user_id__in=quizzees.values("id")
+            ).values_list("user_id", flat=True)
+        )
+        users = sorted(candidates - existing)
+
+        with transaction.atomic():
+            for start in range(0, len(users), self.CHUNK_SIZE):
+                assignments = models.Assignment.objects.bulk_create(
+                    [
+                        models.Assignment(quiz=quiz, user_id=user)
+                        for user in users[start : start + self.CHUNK_SIZE]
+                    ]
+                )
+                results.refresh_results([assignment.id for assignment in assignments])
+
+        return {
+            "quiz": quiz.id,
+            "requested": len(requested),
+            "created": len(users),
+            "existing": len(existing),
+            "invalid_users": [user for user in requested if user not in candidates],
+        }
 
     def to_representation(self, instance):
-        return {"assignment": instance.assignment.id, "choice": instance.choice.id}
+        return instance
+
+
+# Analytics serializers
+
+
+class ChoiceAnalyticsSerializer(serializers.Serializer):
+    # pylint: disable=abstract-method
+
+    id = serializers.IntegerField()
+    text = serializers.CharField()
+    is_correct = serializers.BooleanField()
+    count = serializers.IntegerField(
+        help_text="Submitted assignments which selected the choice."
+    )
+
+
+class QuestionAnalyticsSerializer(serializers.Serializer):
+    # pylint: disable=abstract-method
+
+    id = serializers.IntegerField()
+    text = serializers.CharField()
+    correct_count = serializers.IntegerField(
+        help_text="Submitted assignments which got the question fully right."
+    )
+    correct_rate = serializers.FloatField()
+    choices = ChoiceAnalyticsSerializer(many=True)
+
+
+class QuizAnalyticsSerializer(serializers.Serializer):
+    # pylint: disable=abstract-method
+
+    id = serializers.IntegerField()
+    submitted = serializers.IntegerField(help_text="Number of submitted assignments.")
+    questions = QuestionAnalyticsSerializer(many=True)
+
+
+class ChoiceItemAnalysisSerializer(serializers.Serializer):
+    # pylint: disable=abstract-method
+
+    id = serializers.IntegerField()
+    is_correct = serializers.BooleanField()
+    selection_rate = serializers.FloatField(allow_null=True)
+    upper_rate = serializers.FloatField(allow_null=True)
+    lower_rate = serializers.FloatField(allow_null=True)
+    discrimination = serializers.FloatField(
+        allow_null=True, help_text="Upper rate minus lower rate."
+    )
+
+
+class QuestionItemAnalysisSerializer(serializers.Serializer):
+    # pylint: disable=abstract-method
+
+    id = serializers.IntegerField()
+    difficulty = serializers.FloatField(
+        allow_null=True, help_text="Proportion of assignments which got it right."
+    )
+    discrimination = serializers.FloatField(
+        allow_null=True, help_text="Point-biserial correlation with the total score."
+    )
+    choices = ChoiceItemAnalysisSerializer(many=True)
+
+
+class QuizItemAnalysisSerializer(serializers.Serializer):
+    # pylint: disable=abstract-method
+
+    id = serializers.IntegerField()
+    submitted = serializers.IntegerField(help_text="Number of submitted assignments.")
+    questions = QuestionItemAnalysisSerializer(many=True)
+
+
+class LeaderboardEntrySerializer(serializers.Serializer):
+    # pylint: disable=abstract-method
+
+    rank = serializers.IntegerField(help_text="Tied scores share the same rank.")
+    assignment = serializers.IntegerField()
+    user = serializers.IntegerField()
+    username = serializers.CharField()
+    score = serializers.FloatField()
+
+
+class QuizLeaderboardSerializer(serializers.Serializer):
+    # pylint: disable=abstract-method
+
+    id = serializers.IntegerField()
+    count = serializers.IntegerField(help_text="Number of ranked assignments.")
+    top = LeaderboardEntrySerializer(many=True)
+    user = LeaderboardEntrySerializer(
+        allow_null=True,
+        help_text="Best ranked assignment of the user given by `user_id`, if any.",
+    )
@@ -0,0 +1,149 @@
+from django.db.models import F
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from . import authentication, importers, models, payloads, results
+
+
+@receiver(post_save, sender=models.User)
+def forget_user_credentials(sender, instance, **kwargs):
+    # pylint: disable=unused-argument
+    authentication.forget(instance.pk)
+
+
+@receiver(post_save, sender=models.Assignment)
+def create_assignment_result(sender, instance, created, **kwargs):
+    # pylint: disable=unused-argument
+    if created:
+        results.refresh_results([instance.id])
+
+
+@receiver(post_save, sender=models.Answer)
+@receiver(post_delete, sender=models.Answer)
+def update_assignment_result(sender, instance, **kwargs):
+    # pylint: disable=unused-argument
+    results.refresh_results([instance.assignment_id])
+
+
+@receiver(pre_save, sender=models.Quiz)
+def bump_quiz_version(sender, instance, **kwargs):
+    # pylint: disable=unused-argument
+    if not instance._state.adding:  # pylint: disable=protected-access
+        # Bumped in the database: the instance's version may be stale.
+        instance.version = F("version") + 1
+
+
+@receiver(post_save, sender=models.Quiz)
+def refresh_quiz_version(sender, instance, created, **kwargs):
+    # pylint: disable=unused-argument
+    if not created:
+        instance.refresh_from_db(fields=["version"])
+
+
+@receiver(pre_delete, sender=models.Quiz)
+def touch_quiz_questions(sender, instance, **kwargs):
+    # pylint: disable=unused-argument
+    # The questions' representations list the quizzes they belong to (the links are deleted without `m2m_changed`).
+    models.Question.objects.filter(quizzes=instance.id).update(
+        updated_at=timezone.now()
+    )
+
+
+@receiver(post_save, sender=models.Question)
+def update_question_quizzes_payload(sender, instance, created, **kwargs):
+    # pylint: disable=unused-argument
+    if not created:
+        models.Quiz.objects.filter(questions=instance.id).bump_version()
+
+
+@receiver(pre_delete, sender=models.Question)
+def remember_question_quizzes(sender, instance, **kwargs):
+    # pylint: disable=unused-argument
+    # The links to the quizzes are deleted without `m2m_changed`, and before the question's `post_delete`.
+    instance._quiz_ids = list(  # pylint: disable=protected-access
+        models.Quiz.objects.filter(questions=instance.id).values_list("id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=models.Question)
+def update_deleted_question_quizzes(sender, instance, **kwargs):
+    # pylint: disable=unused-argument
+    quiz_changed(instance.__dict__.pop("_quiz_ids", []))
+
+
+@receiver(pre_save, sender=models.Choice)
+def remember_choice_regrade(sender, instance, **kwargs):
+    # pylint: disable=unused-argument
+    # Only added or deleted choices and changes of `is_correct` change the answer keys (and hence the results).
+    instance._regrade = (  # pylint: disable=protected-access
+        instance._state.adding  # pylint: disable=protected-access
+        or not models.Choice.objects.filter(
+            pk=instance.pk, is_correct=instance.is_correct
+        ).exists()
+    )
+
+
+@receiver(post_save, sender=models.Choice)
+@receiver(post_delete, sender=models.Choice)
+def update_question_quizzes(sender, instance, **kwargs):
+    # pylint: disable=unused-argument
+    models.Question.objects.filter(pk=instance.question_id).update(
+        updated_at=timezone.now()
+    )
+    quiz_ids = models.Quiz.objects.filter(questions=instance.question_id).values_list(
+        "id", flat=True
+    )
+    if instance.__dict__.pop("_regrade", True):
+        quiz_changed(quiz_ids)
+    else:
+        models.Quiz.objects.filter(pk__in=list(quiz_ids)).bump_version()
+
+
+@receiver(m2m_changed, sender=models.Quiz.questions.through)
+def update_quiz(sender, instance, action, reverse, pk_set, **kwargs):
+    # pylint: disable=unused-argument,too-many-arguments
+    if action == "pre_clear":
+        related = instance.quizzes if reverse else instance.questions
+        instance._cleared_pks = list(  # pylint: disable=protected-access
+            related.values_list("id", flat=True)
+        )
+        return
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+
+    pks = (
+        instance.__dict__.pop("_cleared_pks", [])
+        if action == "post_clear"
+        else list(pk_set)
+    )
+    quiz_ids, question_ids = (pks, [instance.id]) if reverse else ([instance.id], pks)
+
+    # The questions' (and hence their other quizzes') representations list the quizzes they belong to.
+    now = timezone.now()
+    models.Question.objects.filter(pk__in=question_ids).update(updated_at=now)
+    models.Quiz.objects.filter(questions__in=question_ids).update(updated_at=now)
+    quiz_changed(quiz_ids)
+
+
+@receiver(importers.questions_imported)
+def update_imported_quiz(sender, quiz, **kwargs):
+    # pylint: disable=unused-argument
+    quiz_changed([quiz.id])
+
+
+def quiz_changed(quiz_ids):
+    """
+    Invalidates the cached answer keys and payloads of the quizzes, recomputes their results and renders their
+    payloads.
+    """
+    quiz_ids = list(quiz_ids)
+    models.Quiz.objects.filter(pk__in=quiz_ids).bump_version()
+    results.refresh_quiz_results(quiz_ids)
+    payloads.refresh_quizzee_payloads(quiz_ids)
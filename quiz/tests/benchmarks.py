@@ -0,0 +1,219 @@
+"""
+Datasets and measurements of the benchmark suite (see `test_benchmarks.py`).
+"""
+
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import django
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from quiz import leaderboards, models, results
+
+from . import factories
+
+CHOICES_PER_QUESTION = 4
+
+# Number of questions answered by the assignments of other quizzees (the benchmark quizzee answers all of them).
+ANSWERED_QUESTIONS = 10
+
+# Users and assignments (of the benchmark quizzee) set aside at each size for the actions which need new ones (e.g.
+# creating or submitting assignments).
+SPARE_USERS = 20
+
+SPARE_ASSIGNMENTS = 2
+
+
+class Size(NamedTuple):
+    questions: int
+    assignments: int
+
+    def __str__(self):
+        return f"{self.questions}x{self.assignments}"
+
+
+class Measurement(NamedTuple):
+    queries: int
+    wall_ms: float
+    peak_kib: float
+
+
+def parse_sizes(value: str) -> List[Size]:
+    """
+    Parses sizes like `10x10,100x1000` (questions per quiz x assignments), sorted from the smallest to the largest.
+    """
+    sizes = []
+    for size in value.split(","):
+        questions, assignments = size.strip().lower().split("x")
+        sizes.append(Size(int(questions), int(assignments)))
+    return sorted(sizes)
+
+
+def measure(request: Callable[[], Any]):
+    """
+    Sends the request with cold caches (the in-memory leaderboards included) and returns the response with its query
+    count, wall time and peak memory (traced by `tracemalloc`, whose overhead is included in the wall time). Streaming
+    responses are consumed.
+    """
+    cache.clear()
+    leaderboards.clear()
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            response = request()
+            if response.streaming:
+                for _ in response.streaming_content:
+                    pass
+        wall_time = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return response, Measurement(
+        queries=len(queries.captured_queries),
+        wall_ms=round(wall_time * 1000, 3),
+        peak_kib=round(peak / 1024, 1),
+    )
+
+
+def write_results(path: str, rows: List[Dict[str, Any]]) -> None:
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(
+            {
+                "commit": _commit(),
+                "created_at": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "results": rows,
+            },
+            output,
+            indent=2,
+        )
+
+
+class Dataset:
+    """
+    A quiz of a benchmark quizzer and its assignments, grown in place from one size to the next (rows are inserted
+    with `bulk_create`, from instances built by the factories). The benchmark quizzee has one assignment answering
+    every question, the other assignments answer `ANSWERED_QUESTIONS` questions each and half of them are submitted.
+    """
+
+    def __init__(self):
+        self.quizzer = factories.UserFactory(username="bench_quizzer", is_quizzer=True)
+        self.quizzee = factories.UserFactory(username="bench_quizzee")
+        self.quiz = factories.QuizFactory(
+            user=self.quizzer, description="Benchmark quiz"
+        )
+        self.assignment = factories.AssignmentFactory(user=self.quizzee, quiz=self.quiz)
+        self.questions: List[models.Question] = []
+        self.choices: Dict[int, List[models.Choice]] = {}
+        self.answer: Optional[models.Answer] = None
+        self.spare_users: List[models.User] = []
+        self.spare_assignments: List[models.Assignment] = []
+        self._users = 0
+        self._assignments = 1
+
+    def grow(self, size: Size) -> None:
+        self._add_questions(size.questions - len(self.questions))
+        self._add_assignments(size.assignments - self._assignments)
+        self.spare_users = self._create_users(SPARE_USERS)
+        self.spare_assignments = [
+            factories.AssignmentFactory(user=self.quizzee, quiz=self.quiz)
+            for _ in range(SPARE_ASSIGNMENTS)
+        ]
+        self._assignments += SPARE_ASSIGNMENTS
+        results.refresh_quiz_results([self.quiz.id])
+
+    def _add_questions(self, count: int) -> None:
+        if count <= 0:
+            return
+        questions = models.Question.objects.bulk_create(
+            [
+                factories.QuestionFactory.build(
+                    user=self.quizzer, text=f"Question {len(self.questions) + index}"
+                )
+                for index in range(count)
+            ]
+        )
+        choices = models.Choice.objects.bulk_create(
+            [
+                factories.Choice.build(
+                    question=question, text=f"Choice {index}", is_correct=index == 0
+                )
+                for question in questions
+                for index in range(CHOICES_PER_QUESTION)
+            ]
+        )
+        for choice in choices:
+            self.choices.setdefault(choice.question_id, []).append(choice)
+        self.quiz.questions.add(*questions)
+        answers = models.Answer.objects.bulk_create(
+            [
+                factories.AnswerFactory.build(
+                    assignment=self.assignment, choice=self.choices[question.id][0]
+                )
+                for question in questions
+            ]
+        )
+        self.answer = self.answer or answers[0]
+        self.questions.extend(questions)
+
+    def _add_assignments(self, count: int) -> None:
+        if count <= 0:
+            return
+        now = timezone.now()
+        assignments = models.Assignment.objects.bulk_create(
+            [
+                factories.AssignmentFactory.build(
+                    user=user,
+                    quiz=self.quiz,
+                    submited_at=now if index % 2 == 0 else None,
+                )
+                for index, user in enumerate(self._create_users(count))
+            ]
+        )
+        models.Answer.objects.bulk_create(
+            [
+                factories.AnswerFactory.build(
+                    assignment=assignment,
+                    choice=self.choices[question.id][
+                        (index + position) % CHOICES_PER_QUESTION
+                    ],
+                )
+                for index, assignment in enumerate(assignments)
+                for position, question in enumerate(self.questions[:ANSWERED_QUESTIONS])
+            ]
+        )
+        self._assignments += count
+
+    def _create_users(self, count: int) -> List[models.User]:
+        users = models.User.objects.bulk_create(
+            [
+                factories.UserFactory.build(
+                    username=f"bench_user_{self._users + index}"
+                )
+                for index in range(count)
+            ]
+        )
+        self._users += count
+        return users
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
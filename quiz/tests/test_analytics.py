@@ -0,0 +1,208 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+
+from quiz import analytics, item_analysis, models
+
+from . import factories
+from .utils import BaseTestCase
+
+
+class AnalyticsTest(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        for choices in [
+            [self.brussels, self.belgium, self.switzerland],
+            [self.brussels, self.belgium],
+            [self.amsterdam],
+        ]:
+            assignment = factories.AssignmentFactory(
+                user=self.bob_quizzee,
+                quiz=self.geography_quiz,
+                submited_at=timezone.now(),
+            )
+            for choice in choices:
+                factories.AnswerFactory(assignment=assignment, choice=choice)
+
+    def test_get_quiz_analytics(self):
+        response = self._get_analytics(self.geography_quiz.id, self.geography_quizzer)
+        self._assert_response(
+            response,
+            status.HTTP_200_OK,
+            {
+                "id": self.geography_quiz.id,
+                "submitted": 3,
+                "questions": [
+                    {
+                        "id": self.whats_the_capital_of_belgium.id,
+                        "text": "What's the capital of Belgium?",
+                        "correct_count": 2,
+                        "correct_rate": 2 / 3,
+                        "choices": [
+                            {
+                                "id": self.brussels.id,
+                                "text": "Brussels",
+                                "is_correct": True,
+                                "count": 2,
+                            },
+                            {
+                                "id": self.zurich.id,
+                                "text": "Zurich",
+                                "is_correct": False,
+                                "count": 0,
+                            },
+                            {
+                                "id": self.amsterdam.id,
+                                "text": "Amsterdam",
+                                "is_correct": False,
+                                "count": 1,
+                            },
+                        ],
+                    },
+                    {
+                        "id": self.which_are_european_countries.id,
+                        "text": "Which are european countries?",
+                        "correct_count": 1,
+                        "correct_rate": 1 / 3,
+                        "choices": [
+                            {
+                                "id": self.belgium.id,
+                                "text": "Belgium",
+                                "is_correct": True,
+                                "count": 2,
+                            },
+                            {
+                                "id": self.switzerland.id,
+                                "text": "Switzerland",
+                                "is_correct": True,
+                                "count": 1,
+                            },
+                            {
+                                "id": self.japan.id,
+                                "text": "Japan",
+                                "is_correct": False,
+                                "count": 0,
+                            },
+                        ],
+                    },
+                ],
+            },
+        )
+
+    def test_cached_until_next_submission(self):
+        analytics.choice_distribution(self.geography_quiz)
+        with self.assertNumQueries(1):
+            analytics.choice_distribution(self.geography_quiz)
+
+        self.bob_geography_assignment.submited_at = timezone.now()
+        self.bob_geography_assignment.save()
+
+        self.assertEqual(
+            analytics.choice_distribution(self.geography_quiz)["submitted"], 4
+        )
+
+    def test_analytics_of_rolled_back_transaction_not_cached(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.japan.is_correct = True
+            self.japan.save()
+            analytics.choice_distribution(
+                models.Quiz.objects.get(pk=self.geography_quiz.id)
+            )
+            raise RuntimeError()
+
+        # Bumps the version to the one of the rolled back transaction.
+        models.Quiz.objects.filter(pk=self.geography_quiz.id).bump_version()
+
+        distribution = analytics.choice_distribution(
+            models.Quiz.objects.get(pk=self.geography_quiz.id)
+        )
+        self.assertEqual(
+            [
+                choice["is_correct"]
+                for choice in distribution["questions"][1]["choices"]
+            ],
+            [True, True, False],
+        )
+
+    def test_analytics_without_correct_choices(self):
+        quiz = factories.QuizFactory(description="Opinions", user=self.biology_quizzer)
+        question = factories.QuestionFactory(
+            text="Which do you like?", user=self.biology_quizzer
+        )
+        choice = factories.Choice(question=question, text="Whales")
+        quiz.questions.add(question)
+        assignment = factories.AssignmentFactory(
+            user=self.bob_quizzee, quiz=quiz, submited_at=timezone.now()
+        )
+        factories.AnswerFactory(assignment=assignment, choice=choice)
+
+        distribution = analytics.choice_distribution(quiz)
+
+        self.assertEqual(distribution["questions"][0]["correct_count"], 0)
+
+    def test_item_analysis(self):
+        analysis = item_analysis.item_analysis(self.geography_quiz)
+
+        capital, countries = analysis["questions"]
+        self.assertAlmostEqual(capital["difficulty"], 2 / 3)
+        self.assertAlmostEqual(countries["difficulty"], 1 / 3)
+        self.assertAlmostEqual(capital["discrimination"], 0.8660254)
+        self.assertAlmostEqual(countries["discrimination"], 0.8660254)
+        self.assertEqual(
+            [
+                (
+                    choice["id"],
+                    round(choice["selection_rate"], 2),
+                    choice["upper_rate"],
+                    choice["lower_rate"],
+                    choice["discrimination"],
+                )
+                for choice in capital["choices"]
+            ],
+            [
+                (self.brussels.id, 0.67, 1.0, 0.0, 1.0),
+                (self.zurich.id, 0.0, 0.0, 0.0, 0.0),
+                (self.amsterdam.id, 0.33, 0.0, 1.0, -1.0),
+            ],
+        )
+
+    def test_item_analysis_without_submissions(self):
+        analysis = item_analysis.item_analysis(self.biology_quiz)
+        self.assertEqual(analysis["submitted"], 1)
+        self.assertIsNone(analysis["questions"][0]["discrimination"])
+
+        analysis = item_analysis.item_analysis(
+            factories.QuizFactory(description="Empty", user=self.biology_quizzer)
+        )
+        self.assertEqual(analysis["questions"], [])
+
+    def test_get_quiz_item_analysis(self):
+        response = self._get(
+            "quizzes-item-analysis",
+            kwargs={"pk": self.geography_quiz.id},
+            user=self.geography_quizzer,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertAlmostEqual(
+            self._get_content(response)["questions"][0]["difficulty"], 2 / 3
+        )
+
+    def test_item_analysis_command(self):
+        output = StringIO()
+        call_command("item_analysis", self.geography_quiz.id, stdout=output)
+        self.assertIn("difficulty=0.67 discrimination=0.87", output.getvalue())
+
+    def test_other_quizzer_attempt_get_quiz_analytics(self):
+        response = self._get_analytics(self.geography_quiz.id, self.biology_quizzer)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_quizzee_attempt_get_quiz_analytics(self):
+        response = self._get_analytics(self.geography_quiz.id, self.bob_quizzee)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def _get_analytics(self, quiz_id, user):
+        return self._get("quizzes-analytics", kwargs={"pk": quiz_id}, user=user)
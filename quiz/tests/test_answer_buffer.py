@@ -0,0 +1,207 @@
+import fcntl
+import os
+import shutil
+import tempfile
+import threading
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError, connections
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from quiz import answer_buffer, models
+
+from .utils import BaseTestCase
+
+
+@override_settings(ANSWER_BUFFER=True, ANSWER_BUFFER_SIZE=3, ANSWER_BUFFER_INTERVAL=0)
+class AnswerBufferTest(BaseTestCase):
+
+    def test_answers_are_buffered(self):
+        response = self._create_answer(self.belgium, user=self.bob_quizzee)
+
+        self._assert_response(
+            response,
+            status.HTTP_201_CREATED,
+            {"assignment": self.bob_geography_assignment.id, "choice": self.belgium.id},
+        )
+        self.assertFalse(self._answered(self.belgium))
+        self.assertTrue(answer_buffer.has_pending(self.bob_quizzee.id))
+
+        self.assertEqual(answer_buffer.flush(), 1)
+        self.assertTrue(self._answered(self.belgium))
+        self.assertEqual(self.bob_geography_assignment.result.progress, 100.0)
+
+    def test_answers_are_flushed_in_batches(self):
+        self._create_answer(self.belgium, user=self.bob_quizzee)
+        self._create_answer(self.switzerland, user=self.bob_quizzee)
+        self.assertFalse(self._answered(self.belgium))
+
+        self._create_answer(self.japan, user=self.bob_quizzee)
+
+        self.assertTrue(self._answered(self.belgium))
+        self.assertTrue(self._answered(self.switzerland))
+        self.assertTrue(self._answered(self.japan))
+        self.assertFalse(answer_buffer.has_pending(self.bob_quizzee.id))
+
+    def test_users_read_their_own_writes(self):
+        self._create_answer(self.belgium, user=self.bob_quizzee)
+
+        response = self._get(
+            "assignments-detail",
+            kwargs={"pk": self.bob_geography_assignment.id},
+            user=self.bob_quizzee,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.bob_geography_assignment.result.progress, 100.0)
+        self.assertTrue(self._answered(self.belgium))
+
+    def test_answers_of_other_users_stay_buffered(self):
+        self._create_answer(self.belgium, user=self.bob_quizzee)
+
+        self._get("assignments-list", user=self.alice_quizzee)
+
+        self.assertFalse(self._answered(self.belgium))
+
+    def test_answers_are_flushed_on_submit(self):
+        self._create_answer(self.belgium, user=self.bob_quizzee)
+
+        response = self._post(
+            "assignments-submit",
+            kwargs={"pk": self.bob_geography_assignment.id},
+            user=self.bob_quizzee,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.bob_geography_assignment.result.progress, 100.0)
+        self.assertTrue(self._answered(self.belgium))
+
+    def test_answers_of_submitted_assignments_are_dropped(self):
+        self._create_answer(self.belgium, user=self.bob_quizzee)
+        self.bob_geography_assignment.submited_at = (
+            self.alice_submitted_assignment.submited_at
+        )
+        self.bob_geography_assignment.save()
+
+        with self.assertLogs("quiz.answer_buffer", "WARNING") as logs:
+            self.assertEqual(answer_buffer.flush(), 0)
+
+        self.assertFalse(self._answered(self.belgium))
+        self.assertIn("Dropped 1 buffered answers", logs.output[0])
+
+    def test_failed_flush_keeps_answers(self):
+        self._create_answer(self.belgium, user=self.bob_quizzee)
+
+        with mock.patch.object(
+            models.Answer.objects, "bulk_create", side_effect=DatabaseError
+        ):
+            with self.assertRaises(DatabaseError):
+                answer_buffer.flush()
+
+        self.assertTrue(answer_buffer.has_pending(self.bob_quizzee.id))
+        self.assertEqual(answer_buffer.flush(), 1)
+        self.assertTrue(self._answered(self.belgium))
+
+    def test_submit_waits_for_flush_in_progress(self):
+        # pylint: disable=protected-access
+        self._create_answer(self.belgium, user=self.bob_quizzee)
+        writing, waiting = threading.Event(), threading.Event()
+        flushed, dropped = [], answer_buffer._buffer.dropped
+        bulk_create = models.Answer.objects.bulk_create
+        wait_for = answer_buffer._buffer._flushed.wait_for
+
+        def write_when_waited_for(*args, **kwargs):
+            writing.set()
+            waiting.wait(timeout=5)
+            return bulk_create(*args, **kwargs)
+
+        def wait_for_write(*args, **kwargs):
+            waiting.set()
+            return wait_for(*args, **kwargs)
+
+        def flush():
+            # The test's data is only visible in its transaction, so the thread shares its connection.
+            connections["default"] = test_connection
+            flushed.append(answer_buffer.flush())
+
+        test_connection = connections["default"]
+        test_connection.inc_thread_sharing()
+        self.addCleanup(test_connection.dec_thread_sharing)
+        flusher = threading.Thread(target=flush)
+        with mock.patch.object(
+            models.Answer.objects, "bulk_create", side_effect=write_when_waited_for
+        ):
+            flusher.start()
+            writing.wait(timeout=5)
+            # The answer is taken by the flusher, but not written yet.
+            self.assertFalse(self._answered(self.belgium))
+            self.assertTrue(answer_buffer.has_pending(self.bob_quizzee.id))
+
+            with mock.patch.object(
+                answer_buffer._buffer._flushed, "wait_for", side_effect=wait_for_write
+            ):
+                response = self._post(
+                    "assignments-submit",
+                    kwargs={"pk": self.bob_geography_assignment.id},
+                    user=self.bob_quizzee,
+                )
+            flusher.join(timeout=5)
+
+        # The answer was written by the flusher, which the submission waited for.
+        self.assertEqual(flushed, [1])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(self._answered(self.belgium))
+        self.assertEqual(answer_buffer._buffer.dropped, dropped)
+        self.assertEqual(self.bob_geography_assignment.result.progress, 100.0)
+
+    def test_refused_in_other_processes(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "answer-buffer.lock")
+        # As locked by another process.
+        with open(path, "a", encoding="utf-8") as lock_file, override_settings(
+            ANSWER_BUFFER_LOCK=path
+        ):
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+            with self.assertRaises(ImproperlyConfigured):
+                answer_buffer.AnswerBuffer().append(
+                    self.bob_quizzee.id,
+                    models.Answer(
+                        assignment=self.bob_geography_assignment, choice=self.belgium
+                    ),
+                )
+
+    def test_async_answers_are_buffered(self):
+        self.client.force_login(user=self.bob_quizzee)
+        response = self.client.post(
+            reverse("async-answers-list"),
+            {"assignment": self.bob_geography_assignment.id, "choice": self.belgium.id},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(self._answered(self.belgium))
+
+        url = reverse(
+            "async-assignments-detail", args=[self.bob_geography_assignment.id]
+        )
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.bob_geography_assignment.result.progress, 100.0)
+        self.assertTrue(self._answered(self.belgium))
+
+    def _create_answer(self, choice, user):
+        return self._post(
+            "answers-list",
+            {"assignment": self.bob_geography_assignment.id, "choice": choice.id},
+            user=user,
+        )
+
+    def _answered(self, choice) -> bool:
+        return models.Answer.objects.filter(
+            assignment=self.bob_geography_assignment, choice=choice
+        ).exists()
@@ -0,0 +1,113 @@
+from django.core.cache import cache
+from django.db import transaction
+
+from quiz import answer_keys, models
+
+from .utils import BaseTestCase
+
+
+class AnswerKeysTest(BaseTestCase):
+
+    def test_answer_key(self):
+        self.assertEqual(
+            answer_keys.get_answer_key(self.geography_quiz.id),
+            {
+                self.whats_the_capital_of_belgium.id: frozenset([self.brussels.id]),
+                self.which_are_european_countries.id: frozenset(
+                    [self.belgium.id, self.switzerland.id]
+                ),
+            },
+        )
+
+    def test_answer_key_cached_in_process(self):
+        answer_keys.get_answer_key(self.geography_quiz.id)
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            answer_keys.get_answer_key(self.geography_quiz.id)
+
+    def test_answer_key_cached_in_shared_cache(self):
+        answer_keys.get_answer_key(self.geography_quiz.id)
+        answer_keys.clear()
+
+        with self.assertNumQueries(1):
+            answer_keys.get_answer_key(self.geography_quiz.id)
+
+    def test_answer_key_invalidated_on_choice_change(self):
+        answer_keys.get_answer_key(self.geography_quiz.id)
+
+        self.japan.is_correct = True
+        self.japan.save()
+
+        self.assertEqual(
+            answer_keys.get_answer_key(self.geography_quiz.id)[
+                self.which_are_european_countries.id
+            ],
+            frozenset([self.belgium.id, self.switzerland.id, self.japan.id]),
+        )
+
+    def test_answer_key_invalidated_on_quiz_questions_change(self):
+        answer_keys.get_answer_key(self.biology_quiz.id)
+
+        self.biology_quiz.questions.add(self.which_numbers_are_prime)
+
+        self.assertIn(
+            self.which_numbers_are_prime.id,
+            answer_keys.get_answer_key(self.biology_quiz.id),
+        )
+
+    def test_answer_key_invalidated_on_question_delete(self):
+        answer_keys.get_answer_key(self.geography_quiz.id)
+        version = models.Quiz.objects.get(pk=self.geography_quiz.id).version
+
+        self.which_are_european_countries.delete()
+
+        self.assertEqual(
+            models.Quiz.objects.get(pk=self.geography_quiz.id).version, version + 1
+        )
+        self.assertEqual(
+            answer_keys.get_answer_key(self.geography_quiz.id),
+            {self.whats_the_capital_of_belgium.id: frozenset([self.brussels.id])},
+        )
+        result = models.AssignmentResult.objects.get(
+            assignment=self.bob_geography_assignment
+        )
+        self.assertEqual((result.question_count, result.correct_count), (1, 1))
+
+    def test_answer_key_of_rolled_back_transaction_not_cached(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.japan.is_correct = True
+            self.japan.save()
+            answer_keys.get_answer_key(self.geography_quiz.id)
+            raise RuntimeError()
+
+        # Bumps the version to the one of the rolled back transaction.
+        models.Quiz.objects.filter(pk=self.geography_quiz.id).bump_version()
+
+        self.assertEqual(
+            answer_keys.get_answer_key(self.geography_quiz.id)[
+                self.which_are_european_countries.id
+            ],
+            frozenset([self.belgium.id, self.switzerland.id]),
+        )
+
+    def test_answer_key_invalidated_on_stale_quiz_save(self):
+        stale_quiz = models.Quiz.objects.get(pk=self.geography_quiz.id)
+        self.japan.is_correct = True
+        self.japan.save()
+        answer_keys.get_answer_key(self.geography_quiz.id)
+        self.japan.is_correct = False
+        self.japan.save()
+
+        version = models.Quiz.objects.get(pk=self.geography_quiz.id).version
+
+        stale_quiz.description = "Geography"
+        stale_quiz.save()
+
+        self.assertEqual(stale_quiz.version, version + 1)
+        self.assertEqual(
+            answer_keys.get_answer_key(self.geography_quiz.id)[
+                self.which_are_european_countries.id
+            ],
+            frozenset([self.belgium.id, self.switzerland.id]),
+        )
@@ -0,0 +1,178 @@
+import base64
+from urllib.parse import urlencode
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from .utils import BaseTestCase
+
+
+class AsyncViewsTest(BaseTestCase):
+
+    def test_create_answer(self):
+        self.client.force_login(user=self.bob_quizzee)
+        answer = {
+            "assignment": self.bob_geography_assignment.id,
+            "choice": self.belgium.id,
+        }
+        for _ in range(2):
+            response = self.client.post(
+                reverse("async-answers-list"), answer, content_type="application/json"
+            )
+            self._assert_response(response, status.HTTP_201_CREATED, answer)
+
+        answers = self.bob_geography_assignment.answers.filter(choice=self.belgium)
+        self.assertEqual(answers.count(), 1)
+        self.assertEqual(self.bob_geography_assignment.result.progress, 100.0)
+
+    def test_create_answer_with_form_bodies(self):
+        self.client.force_login(user=self.bob_quizzee)
+        url = reverse("async-answers-list")
+        assignment = self.bob_geography_assignment
+        for choice, kwargs in [
+            (
+                self.belgium,
+                {
+                    "data": urlencode(
+                        {"assignment": assignment.id, "choice": self.belgium.id}
+                    ),
+                    "content_type": "application/x-www-form-urlencoded",
+                },
+            ),
+            # Multipart, as encoded by the test client by default.
+            (
+                self.switzerland,
+                {"data": {"assignment": assignment.id, "choice": self.switzerland.id}},
+            ),
+        ]:
+            with self.subTest(choice=choice.text):
+                response = self.client.post(url, **kwargs)
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+                self.assertTrue(assignment.answers.filter(choice=choice).exists())
+
+    def test_attempt_create_answer_with_unsupported_body(self):
+        self.client.force_login(user=self.bob_quizzee)
+        for data, content_type, status_code in [
+            ("{", "application/json", status.HTTP_400_BAD_REQUEST),
+            ("assignment=1", "text/plain", status.HTTP_415_UNSUPPORTED_MEDIA_TYPE),
+        ]:
+            with self.subTest(content_type=content_type):
+                expected = self.client.post(
+                    reverse("answers-list"), data, content_type=content_type
+                )
+                response = self.client.post(
+                    reverse("async-answers-list"), data, content_type=content_type
+                )
+                self.assertEqual(response.status_code, status_code)
+                self.assertEqual(response.json(), expected.json())
+
+    def test_attempt_create_answer_for_submitted_assignment(self):
+        response = self._create_answer(
+            self.alice_submitted_assignment.id, self.whale.id, self.alice_quizzee
+        )
+        self._assert_response(
+            response,
+            status.HTTP_400_BAD_REQUEST,
+            {"assignment": ["The assigment has already been submitted."]},
+        )
+
+    def test_attempt_create_answer_with_invalid_choice(self):
+        response = self._create_answer(
+            self.bob_geography_assignment.id, self.whale.id, self.bob_quizzee
+        )
+        self._assert_response(
+            response,
+            status.HTTP_400_BAD_REQUEST,
+            {"choice": ["The choice is not an valid answer to the assignment's quiz."]},
+        )
+
+    def test_attempt_create_answer_for_other_quizzee_assignment(self):
+        response = self._create_answer(
+            self.alice_geography_assignment.id, self.brussels.id, self.bob_quizzee
+        )
+        self._assert_response(
+            response,
+            status.HTTP_400_BAD_REQUEST,
+            {"assignment": ["The assignment does not exist."]},
+        )
+
+    def test_quizzer_attempt_create_answer(self):
+        response = self._create_answer(
+            self.bob_geography_assignment.id, self.brussels.id, self.geography_quizzer
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_anonymous_attempt_create_answer(self):
+        response = self._create_answer(
+            self.bob_geography_assignment.id, self.brussels.id
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_get_assignment_matches_sync_view(self):
+        for user, assignment in [
+            (self.bob_quizzee, self.bob_geography_assignment),
+            (self.geography_quizzer, self.alice_geography_assignment),
+        ]:
+            self.client.force_login(user=user)
+            expected = self.client.get(
+                reverse("assignments-detail", kwargs={"pk": assignment.id})
+            )
+            response = self.client.get(
+                reverse("async-assignments-detail", kwargs={"pk": assignment.id})
+            )
+            self._assert_response(
+                response, status.HTTP_200_OK, self._get_content(expected)
+            )
+
+    def test_get_other_quizzee_assignment(self):
+        self.client.force_login(user=self.bob_quizzee)
+        response = self.client.get(
+            reverse(
+                "async-assignments-detail",
+                kwargs={"pk": self.alice_geography_assignment.id},
+            )
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_submit_assignment(self):
+        self.client.force_login(user=self.bob_quizzee)
+        response = self.client.post(
+            reverse(
+                "async-assignments-submit",
+                kwargs={"pk": self.bob_geography_assignment.id},
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(self._get_content(response)["submited_at"])
+        self.bob_geography_assignment.refresh_from_db()
+        self.assertIsNotNone(self.bob_geography_assignment.submited_at)
+
+    @override_settings(
+        ROOT_URLCONF="oper.async_urls",
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    )
+    def test_async_only_mode_with_basic_auth(self):
+        self.bob_quizzee.set_password("secret")
+        self.bob_quizzee.save()
+        credentials = base64.b64encode(b"bob_quizzee:secret").decode()
+
+        for _ in range(2):
+            response = self.client.get(
+                f"/quizzes/assignments/{self.bob_geography_assignment.id}/",
+                HTTP_AUTHORIZATION=f"Basic {credentials}",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get("/quizzes/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def _create_answer(self, assignment_id, choice_id, user=None):
+        if user:
+            self.client.force_login(user=user)
+        return self.client.post(
+            reverse("async-answers-list"),
+            {"assignment": assignment_id, "choice": choice_id},
+            content_type="application/json",
+        )
@@ -0,0 +1,100 @@
+import base64
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from .utils import BaseTestCase
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class AuthenticationTest(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.bob_quizzee.set_password("secret")
+        self.bob_quizzee.save()
+
+    def test_basic_credentials_verified_once(self):
+        self._get_with_basic("bob_quizzee", "secret")
+        with CaptureQueriesContext(connection) as queries:
+            response = self._get_with_basic("bob_quizzee", "secret")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            any(
+                'FROM "quiz_user"' in query["sql"] for query in queries.captured_queries
+            )
+        )
+
+    def test_basic_credentials_not_cached_when_wrong(self):
+        self._get_with_basic("bob_quizzee", "secret")
+
+        response = self._get_with_basic("bob_quizzee", "wrong")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_basic_credentials_forgotten_on_password_change(self):
+        self._get_with_basic("bob_quizzee", "secret")
+
+        self.bob_quizzee.set_password("new secret")
+        self.bob_quizzee.save()
+
+        response = self._get_with_basic("bob_quizzee", "secret")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token(self):
+        response = self._issue_token()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self._get_with_token(response.json()["token"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    def test_tampered_token(self):
+        token = self._issue_token().json()["token"]
+        user_id, rest = token.split(":", 1)
+
+        response = self._get_with_token(f"{int(user_id) + 1}:{rest}")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_expired_token(self):
+        with freeze_time("2030-01-01 12:00:00"):
+            token = self._issue_token().json()["token"]
+
+        with freeze_time("2030-01-03 12:00:00"):
+            response = self._get_with_token(token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token_invalidated_on_password_change(self):
+        token = self._issue_token().json()["token"]
+        self._get_with_token(token)
+
+        self.bob_quizzee.set_password("new secret")
+        self.bob_quizzee.save()
+
+        response = self._get_with_token(token)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def _issue_token(self):
+        credentials = base64.b64encode(b"bob_quizzee:secret").decode()
+        return self.client.post(
+            reverse("auth-token"), HTTP_AUTHORIZATION=f"Basic {credentials}"
+        )
+
+    def _get_with_basic(self, username, password):
+        credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+        return self.client.get(
+            reverse("assignments-list"), HTTP_AUTHORIZATION=f"Basic {credentials}"
+        )
+
+    def _get_with_token(self, token):
+        return self.client.get(
+            reverse("assignments-list"), HTTP_AUTHORIZATION=f"Token {token}"
+        )
@@ -0,0 +1,246 @@
+import os
+from typing import Any, Callable, Dict, List, NamedTuple
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from . import benchmarks
+
+# Small sizes by default, so that the query count regressions are caught by the regular test runs. E.g.
+# `BENCHMARK_SIZES=10x10,100x1000,1000x10000 BENCHMARK_OUTPUT=benchmarks.json pytest quiz/tests/test_benchmarks.py`
+# benchmarks production-like sizes and writes the results (see `make benchmarks`).
+SIZES = benchmarks.parse_sizes(os.getenv("BENCHMARK_SIZES", "3x3,12x24"))
+
+OUTPUT = os.getenv("BENCHMARK_OUTPUT")
+
+QUESTION_BANK = (
+    b'{"text": "Which is mammal?", "choices": [{"text": "Whale", "is_correct": true}, '
+    b'{"text": "Crocodile", "is_correct": false}]}\n'
+)
+
+
+class Action(NamedTuple):
+    name: str
+    user: str
+    request: Callable[[Any, benchmarks.Dataset], Any]
+    # Whether the number of queries must not depend on the size of the dataset.
+    constant_queries: bool = True
+
+
+ACTIONS = [
+    Action(
+        "QuestionViewSet.list", "quizzer", lambda c, d: c.get(reverse("questions-list"))
+    ),
+    Action(
+        "QuestionViewSet.retrieve",
+        "quizzer",
+        lambda c, d: c.get(
+            reverse("questions-detail", kwargs={"pk": d.questions[-1].id})
+        ),
+    ),
+    Action(
+        "QuestionViewSet.create",
+        "quizzer",
+        lambda c, d: c.post(
+            reverse("questions-list"),
+            {
+                "text": "Which is mammal?",
+                "choices": [
+                    {"text": "Whale", "is_correct": True},
+                    {"text": "Crocodile", "is_correct": False},
+                ],
+            },
+            format="json",
+        ),
+    ),
+    Action(
+        "QuestionViewSet.import_questions",
+        "quizzer",
+        lambda c, d: c.post(
+            reverse("questions-import-questions"),
+            {"file": SimpleUploadedFile("bank.ndjson", QUESTION_BANK)},
+            format="multipart",
+        ),
+    ),
+    Action("QuizViewSet.list", "quizzer", lambda c, d: c.get(reverse("quizzes-list"))),
+    Action("QuizViewSet.list", "quizzee", lambda c, d: c.get(reverse("quizzes-list"))),
+    Action(
+        "QuizViewSet.retrieve",
+        "quizzer",
+        lambda c, d: c.get(reverse("quizzes-detail", kwargs={"pk": d.quiz.id})),
+    ),
+    Action(
+        "QuizViewSet.retrieve",
+        "quizzee",
+        lambda c, d: c.get(reverse("quizzes-detail", kwargs={"pk": d.quiz.id})),
+    ),
+    Action(
+        "QuizViewSet.create",
+        "quizzer",
+        lambda c, d: c.post(
+            reverse("quizzes-list"),
+            {
+                "description": "Benchmark quiz",
+                "questions": [question.id for question in d.questions[:3]],
+            },
+            format="json",
+        ),
+    ),
+    Action(
+        "QuizViewSet.analytics",
+        "quizzer",
+        lambda c, d: c.get(reverse("quizzes-analytics", kwargs={"pk": d.quiz.id})),
+    ),
+    Action(
+        "QuizViewSet.item_analysis",
+        "quizzer",
+        lambda c, d: c.get(reverse("quizzes-item-analysis", kwargs={"pk": d.quiz.id})),
+    ),
+    Action(
+        "QuizViewSet.leaderboard",
+        "quizzer",
+        lambda c, d: c.get(
+            reverse("quizzes-leaderboard", kwargs={"pk": d.quiz.id}),
+            {"user_id": d.quizzee.id},
+        ),
+    ),
+    # Answers are fetched one chunk of assignments at a time.
+    Action(
+        "QuizViewSet.export",
+        "quizzer",
+        lambda c, d: c.get(reverse("quizzes-export", kwargs={"pk": d.quiz.id})),
+        constant_queries=False,
+    ),
+    Action(
+        "AssignmentViewSet.list",
+        "quizzer",
+        lambda c, d: c.get(reverse("assignments-list")),
+    ),
+    Action(
+        "AssignmentViewSet.list",
+        "quizzee",
+        lambda c, d: c.get(reverse("assignments-list")),
+    ),
+    Action(
+        "AssignmentViewSet.retrieve",
+        "quizzer",
+        lambda c, d: c.get(
+            reverse("assignments-detail", kwargs={"pk": d.assignment.id})
+        ),
+    ),
+    Action(
+        "AssignmentViewSet.retrieve",
+        "quizzee",
+        lambda c, d: c.get(
+            reverse("assignments-detail", kwargs={"pk": d.assignment.id})
+        ),
+    ),
+    Action(
+        "AssignmentViewSet.create",
+        "quizzer",
+        lambda c, d: c.post(
+            reverse("assignments-list"),
+            {"quiz": d.quiz.id, "user": d.spare_users.pop().id},
+            format="json",
+        ),
+    ),
+    Action(
+        "AssignmentViewSet.bulk",
+        "quizzer",
+        lambda c, d: c.post(
+            reverse("assignments-bulk"),
+            {"quiz": d.quiz.id, "users": [d.spare_users.pop().id for _ in range(10)]},
+            format="json",
+        ),
+    ),
+    Action(
+        "AssignmentViewSet.submit",
+        "quizzee",
+        lambda c, d: c.post(
+            reverse("assignments-submit", kwargs={"pk": d.spare_assignments.pop().id})
+        ),
+    ),
+    Action(
+        "AnswerViewSet.list", "quizzee", lambda c, d: c.get(reverse("answers-list"))
+    ),
+    Action(
+        "AnswerViewSet.retrieve",
+        "quizzee",
+        lambda c, d: c.get(reverse("answers-detail", kwargs={"pk": d.answer.id})),
+    ),
+    Action(
+        "AnswerViewSet.create",
+        "quizzee",
+        lambda c, d: c.post(
+            reverse("answers-list"),
+            {
+                "assignment": d.assignment.id,
+                "choice": d.choices[d.questions[-1].id][1].id,
+            },
+            format="json",
+        ),
+    ),
+    Action(
+        "AnswerViewSet.bulk",
+        "quizzee",
+        lambda c, d: c.post(
+            reverse("answers-bulk"),
+            {
+                "assignment": d.spare_assignments.pop().id,
+                "answers": [
+                    {"question": question.id, "choices": [d.choices[question.id][1].id]}
+                    for question in d.questions[:3]
+                ],
+            },
+            format="json",
+        ),
+    ),
+]
+
+
+class BenchmarkTest(APITestCase):
+    """
+    Measures every viewset action over datasets of increasing sizes (see `SIZES`), and fails when the number of
+    queries of the actions which should be O(1) in queries grows with the size of the dataset.
+    """
+
+    def test_benchmarks(self):
+        dataset = benchmarks.Dataset()
+        rows: List[Dict[str, Any]] = []
+        # Warms up what the first request loads (e.g. the URL configuration).
+        self.client.force_login(user=dataset.quizzer)
+        self.client.get(reverse("questions-list"))
+
+        for size in SIZES:
+            dataset.grow(size)
+            for action in ACTIONS:
+                self.client.force_login(user=getattr(dataset, action.user))
+                response, measurement = benchmarks.measure(
+                    lambda action=action: action.request(self.client, dataset)
+                )
+                with self.subTest(action=action.name, user=action.user, size=str(size)):
+                    self.assertLess(response.status_code, 400, response)
+                rows.append(
+                    {
+                        "action": action.name,
+                        "user": action.user,
+                        "questions": size.questions,
+                        "assignments": size.assignments,
+                        **measurement._asdict(),
+                    }
+                )
+
+        if OUTPUT:
+            benchmarks.write_results(OUTPUT, rows)
+
+        for action in ACTIONS:
+            if not action.constant_queries:
+                continue
+            queries = {
+                f"{row['questions']}x{row['assignments']}": row["queries"]
+                for row in rows
+                if (row["action"], row["user"]) == (action.name, action.user)
+            }
+            with self.subTest(action=action.name, user=action.user):
+                self.assertEqual(len(set(queries.values())), 1, queries)
@@ -0,0 +1,134 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.http import http_date
+from freezegun import freeze_time
+from rest_framework import status
+
+from quiz import models
+
+from . import factories
+from .utils import BaseTestCase
+
+
+class ConditionalRequestsTest(BaseTestCase):
+
+    def test_get_assignment_not_modified(self):
+        url = reverse(
+            "assignments-detail", kwargs={"pk": self.bob_biology_assignment.id}
+        )
+        self.client.force_login(user=self.bob_quizzee)
+        etag = self.client.get(url)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+        self.assertFalse(
+            any("quiz_choice" in query["sql"] for query in queries.captured_queries)
+        )
+
+    def test_get_assignment_modified_by_answer(self):
+        url = reverse(
+            "assignments-detail", kwargs={"pk": self.bob_biology_assignment.id}
+        )
+        self.client.force_login(user=self.bob_quizzee)
+        etag = self.client.get(url)["ETag"]
+
+        models.Answer.objects.filter(assignment=self.bob_biology_assignment).delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_get_quiz_not_modified_since(self):
+        with freeze_time("2030-01-01 12:00:00"):
+            self.geography_quiz.save()
+
+        url = reverse("quizzes-detail", kwargs={"pk": self.geography_quiz.id})
+        self.client.force_login(user=self.geography_quizzer)
+        response = self.client.get(url)
+        self.assertEqual(response["Last-Modified"], "Tue, 01 Jan 2030 12:00:00 GMT")
+
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with freeze_time("2030-01-01 12:00:05"):
+            self.zurich.delete()
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=http_date(1893499200)  # 2030-01-01 12:00:00
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_answers_modified_by_insert(self):
+        url = reverse("answers-list")
+        self.client.force_login(user=self.bob_quizzee)
+        response = self.client.get(url)
+        self.assertNotIn("Last-Modified", response)
+
+        factories.AnswerFactory(
+            assignment=self.bob_geography_assignment, choice=self.belgium
+        )
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=http_date(1893499200)  # 2030-01-01 12:00:00
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self._get_content(response)["results"]), 3)
+
+    def test_get_question_modified_by_quiz_change(self):
+        url = reverse(
+            "questions-detail", kwargs={"pk": self.whats_the_capital_of_belgium.id}
+        )
+        self.client.force_login(user=self.geography_quizzer)
+        etag = self.client.get(url)["ETag"]
+
+        self.geography_quiz.description = "World geography quiz"
+        self.geography_quiz.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self._get_content(response)["quizzes"][0]["description"],
+            "World geography quiz",
+        )
+
+    def test_get_question_modified_by_quiz_deletion(self):
+        quiz = factories.QuizFactory(
+            user=self.geography_quizzer, description="Capitals quiz"
+        )
+        quiz.questions.add(self.whats_the_capital_of_belgium)
+        url = reverse(
+            "questions-detail", kwargs={"pk": self.whats_the_capital_of_belgium.id}
+        )
+        self.client.force_login(user=self.geography_quizzer)
+        etag = self.client.get(url)["ETag"]
+
+        quiz.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self._get_content(response)["quizzes"]), 1)
+
+    def test_etag_depends_on_the_user_and_the_query_string(self):
+        url = reverse("assignments-list")
+        self.client.force_login(user=self.bob_quizzee)
+        etag = self.client.get(url)["ETag"]
+
+        self.assertNotEqual(self.client.get(url, {"page_size": 1})["ETag"], etag)
+        self.client.force_login(user=self.alice_quizzee)
+        self.assertNotEqual(self.client.get(url)["ETag"], etag)
+
+    def test_get_missing_object_not_found(self):
+        self.client.force_login(user=self.bob_quizzee)
+        response = self.client.get(
+            reverse(
+                "assignments-detail", kwargs={"pk": self.alice_geography_assignment.id}
+            ),
+            HTTP_IF_NONE_MATCH="*",
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
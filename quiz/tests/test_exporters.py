@@ -0,0 +1,88 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from quiz import exporters
+
+from .utils import BaseTestCase
+
+
+class ExportersTest(BaseTestCase):
+
+    def test_export_csv(self):
+        self.client.force_login(user=self.geography_quizzer)
+        response = self.client.get(
+            reverse("quizzes-export", kwargs={"pk": self.geography_quiz.id})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(
+            b"".join(response.streaming_content).decode().splitlines(),
+            [
+                "assignment,user,submitted_at,score,progress,"
+                f"question_{self.whats_the_capital_of_belgium.id},"
+                f"question_{self.which_are_european_countries.id}",
+                f"{self.bob_geography_assignment.id},bob_quizzee,,50.0,50.0,{self.brussels.id},",
+                f"{self.alice_geography_assignment.id},alice_quizzee,,0.0,50.0,{self.zurich.id},",
+            ],
+        )
+
+    def test_export_ndjson_in_chunks(self):
+        output = StringIO()
+        call_command(
+            "export_results",
+            self.geography_quiz.id,
+            format="ndjson",
+            chunk_size=1,
+            stdout=output,
+        )
+
+        self.assertEqual(
+            [json.loads(line) for line in output.getvalue().splitlines()],
+            [
+                {
+                    "assignment": self.bob_geography_assignment.id,
+                    "user": "bob_quizzee",
+                    "submitted_at": None,
+                    "score": 50.0,
+                    "progress": 50.0,
+                    "answers": {
+                        str(self.whats_the_capital_of_belgium.id): [self.brussels.id]
+                    },
+                },
+                {
+                    "assignment": self.alice_geography_assignment.id,
+                    "user": "alice_quizzee",
+                    "submitted_at": None,
+                    "score": 0.0,
+                    "progress": 50.0,
+                    "answers": {
+                        str(self.whats_the_capital_of_belgium.id): [self.zurich.id]
+                    },
+                },
+            ],
+        )
+
+    def test_export_queries_per_chunk(self):
+        with self.assertNumQueries(3):
+            list(exporters.rows(self.geography_quiz, chunk_size=1))
+
+    def test_export_invalid_format(self):
+        self.client.force_login(user=self.geography_quizzer)
+        response = self.client.get(
+            reverse("quizzes-export", kwargs={"pk": self.geography_quiz.id}),
+            {"file_format": "xml"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_quizzee_attempt_export(self):
+        self.client.force_login(user=self.bob_quizzee)
+        response = self.client.get(
+            reverse("quizzes-export", kwargs={"pk": self.geography_quiz.id})
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
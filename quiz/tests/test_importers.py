@@ -0,0 +1,187 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework import status
+
+from quiz import importers, models
+
+from .utils import BaseTestCase
+
+NDJSON = """{"text": "Which are birds?", "choices": [{"text": "Canary", "is_correct": true}, {"text": "Platypus"}]}
+not json
+{"text": "", "choices": [{"text": "Whale"}]}
+
+{"text": "Which is mammal?", "choices": [{"text": "Whale", "is_correct": true}]}
+"""
+
+CSV = """text,choice,is_correct
+Which are birds?,Canary,true
+Which are birds?,Bald Eagle,1
+Which are birds?,Platypus,false
+Which is mammal?,Whale,yes
+,Crocodile,no
+"""
+
+GIFT = """// Biology
+::Q1:: Which are birds? {
+=Canary
+~%50%Bald Eagle
+~Platypus # Not a bird
+}
+
+::Q2:: Which is mammal? {=Whale ~Crocodile}
+
+::Q3:: Missing choices
+"""
+
+
+class ImportersTest(BaseTestCase):
+
+    def test_parse_ndjson(self):
+        parsed = list(importers.parse(NDJSON.splitlines(), "ndjson"))
+
+        self.assertEqual(
+            [(result.line, getattr(result, "text", None)) for result in parsed],
+            [(1, "Which are birds?"), (2, None), (3, None), (5, "Which is mammal?")],
+        )
+        self.assertEqual(
+            parsed[0].choices,
+            [
+                {"text": "Canary", "is_correct": True},
+                {"text": "Platypus", "is_correct": False},
+            ],
+        )
+
+    def test_parse_ndjson_is_correct(self):
+        lines = [
+            '{"text": "Which are birds?", "choices": [{"text": "Canary", "is_correct": "true"}, '
+            '{"text": "Bald Eagle", "is_correct": "Yes"}, {"text": "Platypus", "is_correct": "false"}, '
+            '{"text": "Whale", "is_correct": "0"}, {"text": "Crocodile", "is_correct": null}]}',
+            '{"text": "Which is mammal?", "choices": [{"text": "Whale", "is_correct": "maybe"}]}',
+            '{"text": "Which is mammal?", "choices": [{"text": "Whale", "is_correct": 1}]}',
+        ]
+
+        parsed = list(importers.parse(lines, "ndjson"))
+
+        self.assertEqual(
+            [choice["is_correct"] for choice in parsed[0].choices],
+            [True, True, False, False, False],
+        )
+        self.assertEqual(
+            [(error.line, error.message) for error in parsed[1:]],
+            [(2, 'Invalid is_correct: "maybe".'), (3, "Invalid is_correct: 1.")],
+        )
+
+    def test_parse_csv(self):
+        parsed = list(importers.parse(CSV.splitlines(), "csv"))
+
+        self.assertEqual(parsed[0].text, "Which are birds?")
+        self.assertEqual(
+            [choice["is_correct"] for choice in parsed[0].choices], [True, True, False]
+        )
+        self.assertEqual(parsed[1].text, "Which is mammal?")
+        self.assertIsInstance(parsed[2], importers.ParseError)
+        self.assertEqual(parsed[2].line, 6)
+
+    def test_parse_gift(self):
+        parsed = list(importers.parse(GIFT.splitlines(), "gift"))
+
+        self.assertEqual(parsed[0].line, 2)
+        self.assertEqual(parsed[0].text, "Which are birds?")
+        self.assertEqual(
+            parsed[0].choices,
+            [
+                {"text": "Canary", "is_correct": True},
+                {"text": "Bald Eagle", "is_correct": True},
+                {"text": "Platypus", "is_correct": False},
+            ],
+        )
+        self.assertEqual(parsed[1].text, "Which is mammal?")
+        self.assertIsInstance(parsed[2], importers.ParseError)
+        self.assertEqual(parsed[2].line, 10)
+
+    def test_import_questions_in_chunks(self):
+        report = importers.import_questions(
+            NDJSON.splitlines(),
+            "ndjson",
+            self.biology_quizzer,
+            quiz=self.biology_quiz,
+            chunk_size=1,
+        )
+
+        self.assertEqual(report.created, 2)
+        self.assertEqual([error["line"] for error in report.errors], [2, 3])
+        self.assertEqual(self.biology_quiz.questions.count(), 3)
+        self.assertEqual(
+            models.Choice.objects.filter(question__text="Which are birds?").count(), 2
+        )
+        self.assertEqual(
+            models.AssignmentResult.objects.get(
+                assignment=self.bob_biology_assignment
+            ).question_count,
+            3,
+        )
+
+    def test_import_endpoint(self):
+        self.client.force_login(user=self.biology_quizzer)
+        response = self.client.post(
+            reverse("questions-import-questions"),
+            {
+                "file": SimpleUploadedFile("bank.gift", GIFT.encode("utf-8")),
+                "quiz": self.biology_quiz.id,
+            },
+            format="multipart",
+        )
+
+        self._assert_response(
+            response,
+            status.HTTP_201_CREATED,
+            {
+                "created": 2,
+                "error_count": 1,
+                "errors": [
+                    {
+                        "line": 10,
+                        "error": "Expected the choices between '{' and '}'.",
+                    }
+                ],
+            },
+        )
+        self.assertEqual(self.biology_quiz.questions.count(), 3)
+
+    def test_import_endpoint_decodes_utf8(self):
+        lines = CSV.encode("utf-8").splitlines(keepends=True)
+        lines.insert(5, b"Which is mammal?,Platypus \xff,no\n")
+        self.client.force_login(user=self.biology_quizzer)
+        response = self.client.post(
+            reverse("questions-import-questions"),
+            {
+                # With the byte order mark written by Excel.
+                "file": SimpleUploadedFile(
+                    "bank.csv", b"\xef\xbb\xbf" + b"".join(lines)
+                ),
+            },
+            format="multipart",
+        )
+
+        self._assert_response(
+            response,
+            status.HTTP_201_CREATED,
+            {
+                "created": 2,
+                "error_count": 2,
+                "errors": [
+                    {"line": 6, "error": "Invalid UTF-8: invalid start byte."},
+                    {"line": 7, "error": "The question has no text."},
+                ],
+            },
+        )
+
+    def test_quizzee_attempt_import(self):
+        self.client.force_login(user=self.bob_quizzee)
+        response = self.client.post(
+            reverse("questions-import-questions"),
+            {"file": SimpleUploadedFile("bank.ndjson", NDJSON.encode("utf-8"))},
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
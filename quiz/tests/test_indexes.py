@@ -0,0 +1,108 @@
+import re
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .utils import BaseTestCase
+
+TABLE_SCAN = re.compile(r"^SCAN (?!subquery)")
+
+
+class IndexesTest(BaseTestCase):
+    """
+    Asserts (with SQLite's `EXPLAIN QUERY PLAN`) that no query of the list operations scans a whole table.
+    """
+
+    def test_list_queries_use_indexes(self):
+        cases = [
+            ("questions-list", self.geography_quizzer, {}),
+            ("quizzes-list", self.geography_quizzer, {}),
+            ("quizzes-list", self.bob_quizzee, {}),
+            ("assignments-list", self.geography_quizzer, {}),
+            (
+                "assignments-list",
+                self.geography_quizzer,
+                {"quiz_id": self.geography_quiz.id},
+            ),
+            (
+                "assignments-list",
+                self.geography_quizzer,
+                {"user_id": self.bob_quizzee.id},
+            ),
+            ("assignments-list", self.bob_quizzee, {}),
+            ("assignments-list", self.bob_quizzee, {"pending": "true"}),
+            ("answers-list", self.bob_quizzee, {}),
+        ]
+        for resource, user, parameters in cases:
+            with self.subTest(resource=resource, user=user.username, **parameters):
+                self.client.force_login(user=user)
+                with CaptureQueriesContext(connection) as queries:
+                    self.client.get(reverse(resource), parameters)
+
+                for query in queries.captured_queries:
+                    plan = self._explain(query["sql"])
+                    self.assertFalse(
+                        [step for step in plan if TABLE_SCAN.match(step)],
+                        f"{query['sql']}\n{plan}",
+                    )
+
+    def test_pending_assignments_use_partial_index(self):
+        self.client.force_login(user=self.bob_quizzee)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("assignments-list"), {"pending": "true"})
+
+        self.assertTrue(
+            any(
+                "assignment_pending_idx" in step
+                for query in queries.captured_queries
+                for step in self._explain(query["sql"])
+            )
+        )
+
+    def test_leaderboard_catch_up_uses_index(self):
+        url = reverse("quizzes-leaderboard", kwargs={"pk": self.geography_quiz.id})
+        self.client.force_login(user=self.geography_quizzer)
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+
+        self.assertTrue(
+            any(
+                "result_quiz_updated_at_idx" in step
+                for query in queries.captured_queries
+                for step in self._explain(query["sql"])
+            )
+        )
+
+    def test_foreign_keys_not_indexed_twice(self):
+        # The foreign keys leading a composite index don't get an index of their own.
+        for table in [
+            "quiz_question",
+            "quiz_quiz",
+            "quiz_assignment",
+            "quiz_assignmentresult",
+        ]:
+            with connection.cursor() as cursor:
+                constraints = connection.introspection.get_constraints(cursor, table)
+            indexes = [
+                tuple(constraint["columns"])
+                for constraint in constraints.values()
+                if constraint["index"] and not constraint["primary_key"]
+            ]
+            for columns in indexes:
+                with self.subTest(table=table, columns=columns):
+                    self.assertFalse(
+                        [
+                            other
+                            for other in indexes
+                            if len(other) > len(columns)
+                            and other[: len(columns)] == columns
+                        ]
+                    )
+
+    @staticmethod
+    def _explain(sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            return [row[-1] for row in cursor.fetchall()]
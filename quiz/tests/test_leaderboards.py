@@ -0,0 +1,185 @@
+import random
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from freezegun import freeze_time
+from rest_framework import status
+
+from quiz import leaderboards, models
+
+from . import factories
+from .utils import BaseTestCase
+
+
+class LeaderboardTest(BaseTestCase):
+
+    def test_get_leaderboard(self):
+        response = self._get_leaderboard(
+            self.geography_quiz.id,
+            self.geography_quizzer,
+            {"user_id": self.alice_quizzee.id},
+        )
+
+        alice = self._entry(2, self.alice_geography_assignment, 0.0)
+        self._assert_response(
+            response,
+            status.HTTP_200_OK,
+            {
+                "id": self.geography_quiz.id,
+                "count": 2,
+                "top": [self._entry(1, self.bob_geography_assignment, 50.0), alice],
+                "user": alice,
+            },
+        )
+
+    def test_leaderboard_follows_answers(self):
+        self._get_leaderboard(self.geography_quiz.id, self.geography_quizzer)
+        for choice in [self.belgium, self.switzerland]:
+            self._answer(self.bob_geography_assignment, choice, self.bob_quizzee)
+        for choice in [self.belgium, self.switzerland]:
+            self._answer(self.alice_geography_assignment, choice, self.alice_quizzee)
+        carol_assignment = factories.AssignmentFactory(
+            user=factories.UserFactory(username="carol_quizzee"),
+            quiz=self.geography_quiz,
+        )
+        factories.AnswerFactory(assignment=carol_assignment, choice=self.brussels)
+
+        response = self._get_leaderboard(
+            self.geography_quiz.id,
+            self.geography_quizzer,
+            {"user_id": carol_assignment.user_id},
+        )
+
+        carol = self._entry(2, carol_assignment, 50.0)
+        self._assert_response(
+            response,
+            status.HTTP_200_OK,
+            {
+                "id": self.geography_quiz.id,
+                "count": 3,
+                "top": [
+                    self._entry(1, self.bob_geography_assignment, 100.0),
+                    self._entry(2, self.alice_geography_assignment, 50.0),
+                    carol,
+                ],
+                "user": carol,
+            },
+        )
+
+    def test_leaderboard_is_rebuilt(self):
+        carol_assignment = factories.AssignmentFactory(
+            user=factories.UserFactory(username="carol_quizzee"),
+            quiz=self.geography_quiz,
+        )
+        self._get_leaderboard(self.geography_quiz.id, self.geography_quizzer)
+        carol_assignment.delete()
+
+        content = self._get_content(
+            self._get_leaderboard(self.geography_quiz.id, self.geography_quizzer)
+        )
+        self.assertEqual((content["count"], len(content["top"])), (2, 2))
+
+    def test_leaderboard_follows_results_committed_late(self):
+        start = timezone.now()
+        with freeze_time(start):
+            models.AssignmentResult.objects.update(updated_at=start)
+            self._get_leaderboard(self.geography_quiz.id, self.geography_quizzer)
+
+        # Written long before the previous read, but committed after it.
+        with freeze_time(start + timedelta(seconds=1)), self.captureOnCommitCallbacks(
+            execute=True
+        ):
+            with freeze_time(start - timedelta(minutes=1)), transaction.atomic():
+                for choice in [self.belgium, self.switzerland]:
+                    factories.AnswerFactory(
+                        assignment=self.alice_geography_assignment, choice=choice
+                    )
+
+        content = self._get_content(
+            self._get_leaderboard(self.geography_quiz.id, self.geography_quizzer)
+        )
+        self.assertEqual(
+            [entry["score"] for entry in content["top"]],
+            [50.0, 50.0],
+        )
+
+    def test_top(self):
+        response = self._get_leaderboard(
+            self.geography_quiz.id,
+            self.geography_quizzer,
+            {"top": 1, "user_id": self.math_quizzer.id},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        content = self._get_content(response)
+        self.assertEqual(
+            content["top"], [self._entry(1, self.bob_geography_assignment, 50.0)]
+        )
+        self.assertIsNone(content["user"])
+
+    def test_attempt_get_leaderboard_with_invalid_parameters(self):
+        for parameters in [{"top": 0}, {"top": 101}, {"top": "ten"}, {"user_id": "x"}]:
+            with self.subTest(**parameters):
+                response = self._get_leaderboard(
+                    self.geography_quiz.id, self.geography_quizzer, parameters
+                )
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_attempt_get_leaderboard_of_other_quizzer_or_as_quizzee(self):
+        response = self._get_leaderboard(self.geography_quiz.id, self.biology_quizzer)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self._get_leaderboard(self.geography_quiz.id, self.bob_quizzee)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_ranks(self):
+        # pylint: disable=protected-access
+        generator = random.Random(0)
+        leaderboard = leaderboards.Leaderboard(self.geography_quiz.id)
+        scores = {}
+        for _ in range(2000):
+            assignment_id = generator.randrange(300)
+            scores[assignment_id] = float(generator.randrange(10) * 10)
+            leaderboard.update(assignment_id, scores[assignment_id])
+
+        for assignment_id, score in scores.items():
+            self.assertEqual(
+                leaderboard._rank(score),
+                1 + sum(other > score for other in scores.values()),
+            )
+        top = leaderboard._top(len(scores))
+        self.assertEqual(
+            [(entry.assignment_id, entry.score) for entry in top],
+            sorted(scores.items(), key=lambda item: (-item[1], item[0])),
+        )
+        self.assertEqual(
+            [entry.rank for entry in top],
+            [leaderboard._rank(entry.score) for entry in top],
+        )
+
+    def _get_leaderboard(self, quiz_id, user, parameters=None):
+        return self._get(
+            "quizzes-leaderboard",
+            kwargs={"pk": quiz_id},
+            parameters=parameters,
+            user=user,
+        )
+
+    def _answer(self, assignment, choice, user):
+        response = self._post(
+            "answers-list",
+            {"assignment": assignment.id, "choice": choice.id},
+            user=user,
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    @staticmethod
+    def _entry(rank, assignment, score):
+        return {
+            "rank": rank,
+            "assignment": assignment.id,
+            "user": assignment.user_id,
+            "username": assignment.user.username,
+            "score": score,
+        }
@@ -0,0 +1,178 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from quiz import metrics
+
+from .utils import BaseTestCase
+
+ASSIGNMENTS = (("viewset", "AssignmentViewSet"), ("action", "list"))
+
+ASSIGNMENTS_IN_PROGRESS = (
+    'quiz_requests_in_progress{viewset="AssignmentViewSet",action="list"}'
+)
+
+
+class MetricsTest(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.enterContext(override_settings(METRICS_DIR=directory))
+        self.addCleanup(metrics.clear)
+
+    def test_request_metrics(self):
+        self.client.force_login(user=self.geography_quizzer)
+        for _ in range(2):
+            self.client.get(reverse("assignments-list"))
+        self.client.logout()
+        self.client.get(reverse("quizzes-list"))
+
+        samples = self._samples()
+
+        self.assertEqual(
+            samples[
+                'quiz_requests_total{viewset="AssignmentViewSet",action="list",status="200"}'
+            ],
+            "2",
+        )
+        self.assertEqual(
+            samples[
+                'quiz_requests_total{viewset="QuizViewSet",action="list",status="401"}'
+            ],
+            "1",
+        )
+        labels = 'viewset="AssignmentViewSet",action="list"'
+        self.assertEqual(samples[f"quiz_requests_in_progress{{{labels}}}"], "0")
+        self.assertEqual(
+            samples[f'quiz_request_duration_seconds_bucket{{{labels},le="+Inf"}}'], "2"
+        )
+        self.assertEqual(
+            samples[f"quiz_request_duration_seconds_count{{{labels}}}"], "2"
+        )
+        self.assertEqual(
+            samples[f'quiz_request_queries_bucket{{{labels},le="0"}}'], "0"
+        )
+        self.assertEqual(samples[f"quiz_request_queries_count{{{labels}}}"], "2")
+        self.assertGreater(float(samples[f"quiz_request_queries_sum{{{labels}}}"]), 0)
+
+    def test_async_view(self):
+        self.client.force_login(user=self.bob_quizzee)
+        self.client.get(
+            reverse(
+                "async-assignments-detail",
+                kwargs={"pk": self.bob_geography_assignment.id},
+            )
+        )
+
+        samples = self._samples()
+
+        self.assertEqual(
+            samples[
+                'quiz_requests_total{viewset="",action="retrieve_assignment",status="200"}'
+            ],
+            "1",
+        )
+
+    async def test_async_middleware(self):
+        in_progress = []
+
+        async def get_response(request):
+            # As the handler's view middleware does before calling the view.
+            await middleware.process_view(request, None, (), {})
+            in_progress.append(_parse(metrics.exposition())[ASSIGNMENTS_IN_PROGRESS])
+            return HttpResponse()
+
+        middleware = metrics.MetricsMiddleware(get_response)
+        request = RequestFactory().get("/")
+        with mock.patch.object(metrics, "_labels", return_value=ASSIGNMENTS):
+            await middleware(request)
+
+        samples = _parse(metrics.exposition())
+        self.assertEqual(in_progress, ["1"])
+        self.assertEqual(samples[ASSIGNMENTS_IN_PROGRESS], "0")
+        self.assertEqual(
+            samples[
+                'quiz_requests_total{viewset="AssignmentViewSet",action="list",status="200"}'
+            ],
+            "1",
+        )
+
+    def test_aggregated_across_processes(self):
+        metrics.increment(metrics.IN_PROGRESS, ASSIGNMENTS)
+        metrics.observe(metrics.DURATION, ASSIGNMENTS, 0.02)
+        # A worker which exited while handling a request.
+        worker = multiprocessing.get_context("fork").Process(target=_work)
+        worker.start()
+        worker.join()
+
+        samples = self._samples()
+
+        labels = 'viewset="AssignmentViewSet",action="list"'
+        self.assertEqual(samples[f"quiz_requests_in_progress{{{labels}}}"], "1")
+        self.assertEqual(
+            samples[f'quiz_request_duration_seconds_bucket{{{labels},le="0.025"}}'],
+            "2",
+        )
+        self.assertEqual(
+            samples[f'quiz_request_duration_seconds_bucket{{{labels},le="0.25"}}'], "3"
+        )
+        self.assertEqual(
+            samples[f"quiz_request_duration_seconds_count{{{labels}}}"], "3"
+        )
+        self.assertEqual(
+            samples[f"quiz_request_duration_seconds_sum{{{labels}}}"], "0.24"
+        )
+
+    def test_values_file(self):
+        path = os.path.join(settings.METRICS_DIR, "values.db")
+        values = metrics.MmapValues(path)
+        # Enough keys to grow the file.
+        for index in range(5000):
+            values.increment(f"key {index}", index)
+        values.increment("key 1", 0.5)
+        values.close()
+
+        self.assertGreater(os.path.getsize(path), metrics.INITIAL_SIZE)
+        read = dict(metrics.read_values(path))
+        self.assertEqual(len(read), 5000)
+        self.assertEqual((read["key 1"], read["key 4999"]), (1.5, 4999))
+        values = metrics.MmapValues(path)
+        values.increment("key 1")
+        values.close()
+        self.assertEqual(dict(metrics.read_values(path))["key 1"], 2.5)
+
+    @override_settings(METRICS_DIR=None)
+    def test_disabled(self):
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def _samples(self):
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        return _parse(response.content.decode())
+
+
+def _parse(exposition):
+    return dict(
+        line.rsplit(" ", 1)
+        for line in exposition.splitlines()
+        if not line.startswith("#")
+    )
+
+
+def _work():
+    metrics.increment(metrics.IN_PROGRESS, ASSIGNMENTS)
+    metrics.observe(metrics.DURATION, ASSIGNMENTS, 0.02)
+    metrics.observe(metrics.DURATION, ASSIGNMENTS, 0.2)
@@ -1,3 +1,6 @@
+from django.db import IntegrityError, transaction
+from freezegun import freeze_time
+
 from . import factories
 from .utils import BaseTestCase
 
@@ -74,3 +77,40 @@ class ModelsTest(BaseTestCase):
 
         self.assertEqual(assignment.score, 0.0)
         self.assertEqual(assignment.progress, 100.0)
+
+    def test_choice_change_touches_question_and_quizzes(self):
+        with freeze_time("2030-01-01 12:00:00"):
+            self.brussels.text = "Brussels (BE)"
+            self.brussels.save()
+
+        self.whats_the_capital_of_belgium.refresh_from_db()
+        self.geography_quiz.refresh_from_db()
+        self.assertEqual(
+            self.whats_the_capital_of_belgium.updated_at.isoformat(),
+            "2030-01-01T12:00:00+00:00",
+        )
+        self.assertEqual(
+            self.geography_quiz.updated_at.isoformat(), "2030-01-01T12:00:00+00:00"
+        )
+
+    def test_quiz_membership_change_touches_question_and_its_other_quizzes(self):
+        with freeze_time("2030-01-01 12:00:00"):
+            self.biology_quiz.questions.add(self.which_are_european_countries)
+
+        for instance in [
+            self.which_are_european_countries,
+            self.geography_quiz,
+            self.biology_quiz,
+        ]:
+            instance.refresh_from_db()
+            self.assertEqual(instance.updated_at.year, 2030)
+
+    def test_duplicated_answers_are_rejected(self):
+        factories.AnswerFactory(
+            assignment=self.bob_geography_assignment, choice=self.belgium
+        )
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            factories.AnswerFactory(
+                assignment=self.bob_geography_assignment, choice=self.belgium
+            )
@@ -0,0 +1,82 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+
+from quiz import models, results
+
+from . import factories
+from .utils import BaseTestCase
+
+
+class ResultsTest(BaseTestCase):
+
+    def test_result_created_with_assignment(self):
+        assignment = factories.AssignmentFactory(
+            user=self.bob_quizzee, quiz=self.geography_quiz
+        )
+
+        self._assert_result(assignment, score=0.0, progress=0.0)
+
+    def test_result_updated_on_answer(self):
+        assignment = factories.AssignmentFactory(
+            user=self.bob_quizzee, quiz=self.geography_quiz
+        )
+
+        factories.AnswerFactory(assignment=assignment, choice=self.brussels)
+
+        self._assert_result(assignment, score=50.0, progress=50.0)
+
+    def test_result_updated_on_quiz_questions_change(self):
+        self.geography_quiz.questions.remove(self.which_are_european_countries)
+
+        self._assert_result(self.bob_geography_assignment, score=100.0, progress=100.0)
+
+        self.which_are_european_countries.quizzes.add(self.geography_quiz)
+
+        self._assert_result(self.bob_geography_assignment, score=50.0, progress=50.0)
+
+    def test_result_updated_on_choice_change(self):
+        self.zurich.is_correct = True
+        self.zurich.save()
+
+        self._assert_result(self.bob_geography_assignment, score=0.0, progress=50.0)
+
+    def test_result_not_refreshed_on_choice_text_change(self):
+        version = models.Quiz.objects.get(pk=self.geography_quiz.id).version
+
+        with mock.patch.object(results, "refresh_quiz_results") as refresh:
+            self.zurich.text = "Zürich"
+            self.zurich.save()
+
+        refresh.assert_not_called()
+        self.assertEqual(
+            models.Quiz.objects.get(pk=self.geography_quiz.id).version, version + 1
+        )
+
+    def test_reconcile(self):
+        models.AssignmentResult.objects.update(score=0.0, progress=0.0)
+
+        call_command("reconcile_results", stdout=StringIO())
+
+        self._assert_result(self.bob_geography_assignment, score=50.0, progress=50.0)
+        self._assert_result(self.bob_biology_assignment, score=0.0, progress=100.0)
+
+    def test_ensure_missing_results(self):
+        models.AssignmentResult.objects.all().delete()
+        assignments = list(models.Assignment.objects.select_related("result"))
+
+        results.ensure_results(assignments)
+
+        self.assertEqual(
+            {assignment.id: assignment.result.score for assignment in assignments},
+            {assignment.id: assignment.score for assignment in assignments},
+        )
+        self.assertEqual(models.AssignmentResult.objects.count(), len(assignments))
+
+    def _assert_result(self, assignment, score, progress):
+        result = models.AssignmentResult.objects.get(assignment=assignment)
+        self.assertEqual(result.score, score)
+        self.assertEqual(result.progress, progress)
+        self.assertEqual(result.score, assignment.score)
+        self.assertEqual(result.progress, assignment.progress)
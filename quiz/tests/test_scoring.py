@@ -0,0 +1,31 @@
+from quiz import models, scoring
+
+from . import factories
+from .utils import BaseTestCase
+
+
+class ScoringTest(BaseTestCase):
+
+    def test_grades_match_assignment_score(self):
+        assignments = list(models.Assignment.objects.all())
+
+        grades = scoring.grade_assignments(assignments)
+
+        self.assertEqual(
+            {assignment.id: assignment.score for assignment in assignments},
+            {assignment_id: grade.score for assignment_id, grade in grades.items()},
+        )
+
+    def test_constant_number_of_queries(self):
+        for _ in range(10):
+            assignment = factories.AssignmentFactory(
+                user=self.alice_quizzee, quiz=self.geography_quiz
+            )
+            factories.AnswerFactory(assignment=assignment, choice=self.brussels)
+            factories.AnswerFactory(assignment=assignment, choice=self.belgium)
+
+        assignments = list(models.Assignment.objects.all())
+
+        scoring.grade_assignments(assignments)
+        with self.assertNumQueries(2):
+            scoring.grade_assignments(assignments)
@@ -0,0 +1,136 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db.models import Count
+
+from quiz import models, results, seeding
+
+from .utils import BaseTestCase
+
+OPTIONS = seeding.Options(
+    quizzers=2,
+    quizzees=20,
+    quizzes=5,
+    questions=4,
+    choices=3,
+    assignments=200,
+    batch_size=64,
+)
+
+
+class SeedingTest(BaseTestCase):
+
+    def test_seed(self):
+        users, assignments, answers = (
+            models.User.objects.count(),
+            models.Assignment.objects.count(),
+            models.Answer.objects.count(),
+        )
+
+        report = seeding.seed(OPTIONS)
+
+        self.assertEqual(
+            report,
+            seeding.Report(
+                users=22,
+                quizzes=5,
+                questions=20,
+                choices=60,
+                assignments=200,
+                answers=report.answers,
+            ),
+        )
+        self.assertEqual(models.User.objects.count(), users + 22)
+        self.assertEqual(models.Assignment.objects.count(), assignments + 200)
+        self.assertEqual(models.Answer.objects.count(), answers + report.answers)
+        self.assertTrue(
+            models.User.objects.filter(
+                username__startswith="load_quizzer_", is_quizzer=True
+            ).exists()
+        )
+
+    def test_results_match_grading(self):
+        seeding.seed(OPTIONS)
+        generated = self._results()
+
+        results.reconcile()
+
+        self.assertEqual(self._results(), generated)
+
+    def test_same_seed_same_dataset(self):
+        seeding.seed(OPTIONS)
+        first = self._dataset()
+        seeding.seed(OPTIONS)
+        second = self._dataset()
+
+        self.assertEqual(second, first)
+        seeding.seed(OPTIONS._replace(seed=1))
+        self.assertNotEqual(self._dataset(), first)
+
+    def test_skewed_popularity(self):
+        seeding.seed(OPTIONS._replace(assignments=1000, skew=1.5))
+        counts = list(
+            models.Assignment.objects.filter(quiz__description__startswith="Quiz ")
+            .values("quiz")
+            .annotate(count=Count("id"))
+            .order_by("quiz")
+            .values_list("count", flat=True)
+        )
+
+        self.assertGreater(counts[0], 2 * counts[-1])
+
+    def test_command(self):
+        output = StringIO()
+        call_command(
+            "seed_load",
+            "--quizzes=2",
+            "--quizzees=5",
+            "--assignments=10",
+            stdout=output,
+        )
+
+        self.assertIn("10 assignments", output.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("seed_load", "--choices=1")
+
+    @staticmethod
+    def _results():
+        return list(
+            models.AssignmentResult.objects.order_by("assignment_id").values_list(
+                # Seeded results are updated when their assignment was submitted.
+                "assignment_id",
+                *(field for field in results.RESULT_FIELDS if field != "updated_at"),
+            )
+        )
+
+    @staticmethod
+    def _dataset():
+        """
+        The last generated quizzes, assignments and answers, with ID's relative to the first generated ones.
+        """
+        quiz = models.Quiz.objects.order_by("-id")[OPTIONS.quizzes - 1]
+        assignment = (
+            models.Assignment.objects.filter(quiz__gte=quiz).order_by("id").first()
+        )
+        choice = (
+            models.Choice.objects.filter(question__quizzes=quiz).order_by("id").first()
+        )
+        return (
+            [
+                (row[0] - assignment.id, row[1] - quiz.id, row[2])
+                for row in models.Assignment.objects.filter(id__gte=assignment.id)
+                .order_by("id")
+                .values_list("id", "quiz_id", "submited_at")
+            ],
+            [
+                (row[0] - assignment.id, row[1] - choice.id)
+                for row in models.Answer.objects.filter(assignment__gte=assignment)
+                .order_by("id")
+                .values_list("assignment_id", "choice_id")
+            ],
+            list(
+                models.Choice.objects.filter(question__quizzes__gte=quiz)
+                .order_by("id")
+                .values_list("is_correct", flat=True)
+            ),
+        )
@@ -0,0 +1,88 @@
+import json
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from quiz import timing
+
+from .utils import BaseTestCase
+
+
+@override_settings(SERVER_TIMING=True)
+class ServerTimingTest(BaseTestCase):
+
+    def test_header(self):
+        self.client.force_login(user=self.geography_quizzer)
+        response = self.client.get(reverse("assignments-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        metrics = self._metrics(response)
+        self.assertEqual(
+            list(metrics), ["auth", "perm", "serialize", "render", "db", "total"]
+        )
+        self.assertRegex(metrics["db"], r'^db;dur=[\d.]+;desc="[1-9]\d* queries"$')
+        self.assertRegex(metrics["serialize"], r"^serialize;dur=[\d.]+")
+
+    def test_log(self):
+        self.client.force_login(user=self.geography_quizzer)
+        with self.assertLogs("quiz.timing", "INFO") as logs:
+            self.client.get(
+                reverse(
+                    "assignments-detail",
+                    kwargs={"pk": self.bob_geography_assignment.id},
+                )
+            )
+
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(logs.records[-1].timing, record)
+        self.assertEqual(record["viewset"], "AssignmentViewSet")
+        self.assertEqual(record["action"], "retrieve")
+        self.assertEqual(record["status"], 200)
+        self.assertGreater(record["queries"], 0)
+        self.assertLessEqual(record["auth_queries"], record["queries"])
+        self.assertGreaterEqual(record["total_ms"], record["render_ms"])
+
+    def test_error_response(self):
+        with self.assertLogs("quiz.timing", "INFO") as logs:
+            response = self.client.get(reverse("quizzes-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("total;dur=", response["Server-Timing"])
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(
+            (record["viewset"], record["action"], record["status"]),
+            ("QuizViewSet", "list", 401),
+        )
+
+    def test_async_view(self):
+        self.client.force_login(user=self.bob_quizzee)
+        with self.assertLogs("quiz.timing", "INFO") as logs:
+            response = self.client.get(
+                reverse(
+                    "async-assignments-detail",
+                    kwargs={"pk": self.bob_geography_assignment.id},
+                )
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("auth", self._metrics(response))
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(record["action"], "retrieve_assignment")
+        self.assertGreater(record["queries"], 0)
+
+    @override_settings(SERVER_TIMING=False)
+    def test_disabled(self):
+        self.client.force_login(user=self.geography_quizzer)
+        response = self.client.get(reverse("assignments-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("Server-Timing", response)
+        self.assertFalse(timing.active())
+
+    @staticmethod
+    def _metrics(response):
+        return {
+            metric.split(";")[0]: metric
+            for metric in response["Server-Timing"].split(", ")
+        }
@@ -1,7 +1,17 @@
+import gzip
+import json
+
+from django.contrib.auth.models import Group
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from freezegun import freeze_time
 from rest_framework import status
 
-from .utils import BaseTestCase
+from quiz import models
+
+from . import factories
+from .utils import BaseTestCase, add_questions
 
 
 class QuestionViewSetTests(BaseTestCase):
@@ -11,18 +21,20 @@ class QuestionViewSetTests(BaseTestCase):
         self._assert_response(
             response,
             status.HTTP_200_OK,
-            [
-                {
-                    "id": self.whats_the_capital_of_belgium.id,
-                    "text": "What's the capital of Belgium?",
-                    "quizzes": [self.geography_quiz.id],
-                },
-                {
-                    "id": self.which_are_european_countries.id,
-                    "text": "Which are european countries?",
-                    "quizzes": [self.geography_quiz.id],
-                },
-            ],
+            self._page(
+                [
+                    {
+                        "id": self.whats_the_capital_of_belgium.id,
+                        "text": "What's the capital of Belgium?",
+                        "quizzes": [self.geography_quiz.id],
+                    },
+                    {
+                        "id": self.which_are_european_countries.id,
+                        "text": "Which are european countries?",
+                        "quizzes": [self.geography_quiz.id],
+                    },
+                ]
+            ),
         )
 
     def test_get_question(self):
@@ -99,12 +111,14 @@ class QuizViewSetTests(BaseTestCase):
         self._assert_response(
             response,
             status.HTTP_200_OK,
-            [
-                {
-                    "id": self.geography_quiz.id,
-                    "description": "Geography quiz",
-                }
-            ],
+            self._page(
+                [
+                    {
+                        "id": self.geography_quiz.id,
+                        "description": "Geography quiz",
+                    }
+                ]
+            ),
         )
 
     def test_get_specifc_quiz(self):
@@ -170,10 +184,89 @@ class QuizViewSetTests(BaseTestCase):
         self._assert_response(
             response,
             status.HTTP_200_OK,
-            [
-                {"id": self.geography_quiz.id, "description": "Geography quiz"},
-                {"id": self.biology_quiz.id, "description": "Biology quiz"},
-            ],
+            self._page(
+                [
+                    {"id": self.geography_quiz.id, "description": "Geography quiz"},
+                    {"id": self.biology_quiz.id, "description": "Biology quiz"},
+                ]
+            ),
+        )
+
+    def test_get_specific_quiz_constant_number_of_queries(self):
+        self._get_quiz(self.geography_quiz.id, user=self.geography_quizzer)
+        with CaptureQueriesContext(connection) as before:
+            self._get_quiz(self.geography_quiz.id, user=self.geography_quizzer)
+
+        add_questions(self.geography_quiz, self.geography_quizzer, 200)
+
+        with CaptureQueriesContext(connection) as after:
+            response = self._get_quiz(
+                self.geography_quiz.id, user=self.geography_quizzer
+            )
+
+        self.assertEqual(len(self._get_content(response)["questions"]), 202)
+        self.assertEqual(len(after), len(before))
+
+    def test_get_quizzee_quiz(self):
+        response = self._get_quiz(self.biology_quiz.id, user=self.bob_quizzee)
+        self._assert_response(
+            response,
+            status.HTTP_200_OK,
+            {
+                "id": self.biology_quiz.id,
+                "description": "Biology quiz",
+                "questions": [
+                    {
+                        "id": self.which_is_mammal.id,
+                        "text": "Which is mammal?",
+                        "choices": [
+                            {"id": self.whale.id, "text": "Whale"},
+                            {"id": self.platypus.id, "text": "Platypus"},
+                            {"id": self.crocodile.id, "text": "Crocodile"},
+                        ],
+                    }
+                ],
+            },
+        )
+
+    def test_get_quizzee_quiz_gzipped(self):
+        self.client.force_login(user=self.bob_quizzee)
+        response = self.client.get(
+            reverse("quizzes-detail", kwargs={"pk": self.biology_quiz.id}),
+            HTTP_ACCEPT_ENCODING="gzip, deflate",
+        )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(
+            json.loads(gzip.decompress(response.content))["description"],
+            "Biology quiz",
+        )
+
+    def test_get_quizzee_quiz_invalidated_on_choice_change(self):
+        self._get_quiz(self.biology_quiz.id, user=self.bob_quizzee)
+
+        self.whale.text = "Blue Whale"
+        self.whale.save()
+
+        response = self._get_quiz(self.biology_quiz.id, user=self.bob_quizzee)
+        self.assertEqual(
+            self._get_content(response)["questions"][0]["choices"][0]["text"],
+            "Blue Whale",
+        )
+
+    def test_get_quizzee_quiz_of_rolled_back_transaction_not_cached(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.whale.text = "Blue Whale"
+            self.whale.save()
+            raise RuntimeError()
+
+        # Bumps the version to the one of the rolled back transaction.
+        models.Quiz.objects.filter(pk=self.biology_quiz.id).bump_version()
+
+        response = self._get_quiz(self.biology_quiz.id, user=self.bob_quizzee)
+        self.assertEqual(
+            self._get_content(response)["questions"][0]["choices"][0]["text"],
+            "Whale",
         )
 
     def _get_quizzes(self, parameters=None, user=None):
@@ -198,25 +291,30 @@ class AssignmentViewSetTests(BaseTestCase):
         self._assert_response(
             response,
             status.HTTP_200_OK,
-            [
-                {
-                    "id": self.bob_geography_assignment.id,
-                    "submited_at": None,
-                    "quiz": {
-                        "id": self.geography_quiz.id,
-                        "description": "Geography quiz",
+            self._page(
+                [
+                    {
+                        "id": self.bob_geography_assignment.id,
+                        "submited_at": None,
+                        "quiz": {
+                            "id": self.geography_quiz.id,
+                            "description": "Geography quiz",
+                        },
+                        "progress": 50.0,
+                        "score": 50.0,
                     },
-                    "progress": 50.0,
-                    "score": 50.0,
-                },
-                {
-                    "id": self.bob_biology_assignment.id,
-                    "submited_at": None,
-                    "quiz": {"id": self.biology_quiz.id, "description": "Biology quiz"},
-                    "progress": 100.0,
-                    "score": 0.0,
-                },
-            ],
+                    {
+                        "id": self.bob_biology_assignment.id,
+                        "submited_at": None,
+                        "quiz": {
+                            "id": self.biology_quiz.id,
+                            "description": "Biology quiz",
+                        },
+                        "progress": 100.0,
+                        "score": 0.0,
+                    },
+                ]
+            ),
         )
 
     def test_get_quizzee_assignments_filtered_by_quiz(self):
@@ -226,18 +324,29 @@ class AssignmentViewSetTests(BaseTestCase):
         self._assert_response(
             response,
             status.HTTP_200_OK,
-            [
-                {
-                    "id": self.bob_geography_assignment.id,
-                    "submited_at": None,
-                    "quiz": {
-                        "id": self.geography_quiz.id,
-                        "description": "Geography quiz",
-                    },
-                    "progress": 50.0,
-                    "score": 50.0,
-                }
-            ],
+            self._page(
+                [
+                    {
+                        "id": self.bob_geography_assignment.id,
+                        "submited_at": None,
+                        "quiz": {
+                            "id": self.geography_quiz.id,
+                            "description": "Geography quiz",
+                        },
+                        "progress": 50.0,
+                        "score": 50.0,
+                    }
+                ]
+            ),
+        )
+
+    def test_get_quizzee_pending_assignments(self):
+        response = self._get_assignments(
+            user=self.alice_quizzee, parameters={"pending": "true"}
+        )
+        self.assertEqual(
+            [assignment["id"] for assignment in self._get_content(response)["results"]],
+            [self.alice_geography_assignment.id, self.alice_biology_assignment.id],
         )
 
     def test_get_quizzer_assignments(self):
@@ -245,30 +354,35 @@ class AssignmentViewSetTests(BaseTestCase):
         self._assert_response(
             response,
             status.HTTP_200_OK,
-            [
-                {
-                    "id": self.bob_geography_assignment.id,
-                    "user": {"id": self.bob_quizzee.id, "username": "bob_quizzee"},
-                    "submited_at": None,
-                    "quiz": {
-                        "id": self.geography_quiz.id,
-                        "description": "Geography quiz",
+            self._page(
+                [
+                    {
+                        "id": self.bob_geography_assignment.id,
+                        "user": {"id": self.bob_quizzee.id, "username": "bob_quizzee"},
+                        "submited_at": None,
+                        "quiz": {
+                            "id": self.geography_quiz.id,
+                            "description": "Geography quiz",
+                        },
+                        "progress": 50.0,
+                        "score": 50.0,
                     },
-                    "progress": 50.0,
-                    "score": 50.0,
-                },
-                {
-                    "id": self.alice_geography_assignment.id,
-                    "user": {"id": self.alice_quizzee.id, "username": "alice_quizzee"},
-                    "submited_at": None,
-                    "quiz": {
-                        "id": self.geography_quiz.id,
-                        "description": "Geography quiz",
+                    {
+                        "id": self.alice_geography_assignment.id,
+                        "user": {
+                            "id": self.alice_quizzee.id,
+                            "username": "alice_quizzee",
+                        },
+                        "submited_at": None,
+                        "quiz": {
+                            "id": self.geography_quiz.id,
+                            "description": "Geography quiz",
+                        },
+                        "progress": 50.0,
+                        "score": 0.0,
                     },
-                    "progress": 50.0,
-                    "score": 0.0,
-                },
-            ],
+                ]
+            ),
         )
 
     def test_get_quizzer_assignments_filtered_by_user(self):
@@ -278,21 +392,63 @@ class AssignmentViewSetTests(BaseTestCase):
         self._assert_response(
             response,
             status.HTTP_200_OK,
-            [
-                {
-                    "id": self.bob_geography_assignment.id,
-                    "user": {"id": self.bob_quizzee.id, "username": "bob_quizzee"},
-                    "submited_at": None,
-                    "quiz": {
-                        "id": self.geography_quiz.id,
-                        "description": "Geography quiz",
-                    },
-                    "progress": 50.0,
-                    "score": 50.0,
-                }
-            ],
+            self._page(
+                [
+                    {
+                        "id": self.bob_geography_assignment.id,
+                        "user": {"id": self.bob_quizzee.id, "username": "bob_quizzee"},
+                        "submited_at": None,
+                        "quiz": {
+                            "id": self.geography_quiz.id,
+                            "description": "Geography quiz",
+                        },
+                        "progress": 50.0,
+                        "score": 50.0,
+                    }
+                ]
+            ),
         )
 
+    def test_get_quizzer_assignments_constant_number_of_queries(self):
+        parameters = {"quiz_id": self.geography_quiz.id}
+        self._get_assignments(user=self.geography_quizzer, parameters=parameters)
+        with CaptureQueriesContext(connection) as before:
+            self._get_assignments(user=self.geography_quizzer, parameters=parameters)
+
+        for index in range(20):
+            user = factories.UserFactory(username=f"quizzee_{index}")
+            assignment = factories.AssignmentFactory(
+                user=user, quiz=self.geography_quiz
+            )
+            factories.AnswerFactory(assignment=assignment, choice=self.brussels)
+
+        with CaptureQueriesContext(connection) as after:
+            response = self._get_assignments(
+                user=self.geography_quizzer, parameters=parameters
+            )
+
+        self.assertEqual(len(self._get_content(response)["results"]), 22)
+        self.assertEqual(len(after), len(before))
+
+    def test_get_quizzer_assignments_paginated(self):
+        response = self._get_assignments(
+            user=self.geography_quizzer, parameters={"page_size": 1}
+        )
+        first_page = self._get_content(response)
+
+        self.client.force_login(user=self.geography_quizzer)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(first_page["next"], format="json")
+        second_page = self._get_content(response)
+
+        self.assertEqual(
+            [assignment["id"] for assignment in first_page["results"]]
+            + [assignment["id"] for assignment in second_page["results"]],
+            [self.bob_geography_assignment.id, self.alice_geography_assignment.id],
+        )
+        self.assertIsNone(second_page["next"])
+        self.assertFalse(any("OFFSET" in query["sql"] for query in queries))
+
     def test_get_assignment(self):
         response = self._get_assignment(
             self.bob_geography_assignment.id, user=self.bob_quizzee
@@ -330,6 +486,51 @@ class AssignmentViewSetTests(BaseTestCase):
             },
         )
 
+    def test_get_assignment_constant_number_of_queries(self):
+        self._get_assignment(self.bob_geography_assignment.id, user=self.bob_quizzee)
+        with CaptureQueriesContext(connection) as before:
+            self._get_assignment(
+                self.bob_geography_assignment.id, user=self.bob_quizzee
+            )
+
+        add_questions(self.geography_quiz, self.geography_quizzer, 200)
+
+        with CaptureQueriesContext(connection) as after:
+            self._get_assignment(
+                self.bob_geography_assignment.id, user=self.bob_quizzee
+            )
+
+        self.assertEqual(len(after), len(before))
+
+    def test_get_assignment_as_quizzer_constant_number_of_queries(self):
+        self._get_assignment(
+            self.bob_geography_assignment.id, user=self.geography_quizzer
+        )
+        with CaptureQueriesContext(connection) as before:
+            self._get_assignment(
+                self.bob_geography_assignment.id, user=self.geography_quizzer
+            )
+
+        add_questions(self.geography_quiz, self.geography_quizzer, 200)
+
+        with CaptureQueriesContext(connection) as after:
+            self._get_assignment(
+                self.bob_geography_assignment.id, user=self.geography_quizzer
+            )
+
+        self.assertEqual(len(after), len(before))
+
+    def test_get_assignment_splices_cached_quiz_payload(self):
+        self._get_assignment(self.bob_geography_assignment.id, user=self.bob_quizzee)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._get_assignment(
+                self.bob_geography_assignment.id, user=self.bob_quizzee
+            )
+
+        self.assertEqual(len(self._get_content(response)["quiz"]["questions"]), 2)
+        self.assertFalse(any("quiz_choice" in query["sql"] for query in queries))
+
     def test_create_assigment(self):
         response = self._create_assignment(
             {
@@ -345,6 +546,86 @@ class AssignmentViewSetTests(BaseTestCase):
             exclude_regex_paths=[r"root\['id'\]"],
         )
 
+    def test_create_assignments_in_bulk(self):
+        carol = factories.UserFactory(username="carol_quizzee")
+        response = self._create_assignments(
+            {
+                "quiz": self.geography_quiz.id,
+                "users": [
+                    self.bob_quizzee.id,
+                    carol.id,
+                    carol.id,
+                    self.biology_quizzer.id,
+                    999,
+                ],
+            },
+            user=self.geography_quizzer,
+        )
+        self._assert_response(
+            response,
+            status.HTTP_201_CREATED,
+            {
+                "quiz": self.geography_quiz.id,
+                "requested": 4,
+                "created": 1,
+                "existing": 1,
+                "invalid_users": [self.biology_quizzer.id, 999],
+            },
+        )
+        assignment = models.Assignment.objects.get(user=carol, quiz=self.geography_quiz)
+        self.assertEqual(assignment.result.progress, 0.0)
+
+    def test_create_assignments_for_group(self):
+        cohort = Group.objects.create(name="cohort")
+        for index in range(3):
+            factories.UserFactory(username=f"student_{index}").groups.add(cohort)
+        self.bob_quizzee.groups.add(cohort)
+
+        response = self._create_assignments(
+            {"quiz": self.geography_quiz.id, "group": "cohort"},
+            user=self.geography_quizzer,
+        )
+        self._assert_response(
+            response,
+            status.HTTP_201_CREATED,
+            {
+                "quiz": self.geography_quiz.id,
+                "requested": 4,
+                "created": 3,
+                "existing": 1,
+                "invalid_users": [],
+            },
+        )
+
+    def test_create_assignments_in_bulk_constant_number_of_queries(self):
+        users = [
+            factories.UserFactory(username=f"student_{index}") for index in range(50)
+        ]
+
+        self._create_assignments(
+            {"quiz": self.biology_quiz.id, "users": [users[0].id]},
+            user=self.biology_quizzer,
+        )
+        with CaptureQueriesContext(connection) as before:
+            self._create_assignments(
+                {"quiz": self.biology_quiz.id, "users": [users[1].id]},
+                user=self.biology_quizzer,
+            )
+        with CaptureQueriesContext(connection) as after:
+            self._create_assignments(
+                {"quiz": self.biology_quiz.id, "users": [user.id for user in users]},
+                user=self.biology_quizzer,
+            )
+
+        self.assertEqual(
+            models.Assignment.objects.filter(quiz=self.biology_quiz).count(), 53
+        )
+        self.assertEqual(len(after), len(before))
+
+    def test_quizzee_attempt_create_assigments_in_bulk(self):
+        response = self._create_assignments({}, user=self.bob_quizzee)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
     def test_quizzee_attempt_create_assigment(self):
         response = self._create_assignment(
             {},
@@ -417,6 +698,9 @@ class AssignmentViewSetTests(BaseTestCase):
     def _create_assignment(self, assignment, user=None):
         return self._post("assignments-list", assignment, user=user)
 
+    def _create_assignments(self, assignments, user=None):
+        return self._post("assignments-bulk", assignments, user=user)
+
 
 class AnswerViewSetTests(BaseTestCase):
 
@@ -425,20 +709,22 @@ class AnswerViewSetTests(BaseTestCase):
         self._assert_response(
             response,
             status.HTTP_200_OK,
-            [
-                {
-                    "id": self.bob_geography_answer.id,
-                    "assignment": self.bob_geography_assignment.id,
-                    "choice": self.brussels.id,
-                    "question": self.whats_the_capital_of_belgium.id,
-                },
-                {
-                    "id": self.bob_biology_answer.id,
-                    "assignment": self.bob_biology_assignment.id,
-                    "question": self.which_is_mammal.id,
-                    "choice": self.crocodile.id,
-                },
-            ],
+            self._page(
+                [
+                    {
+                        "id": self.bob_geography_answer.id,
+                        "assignment": self.bob_geography_assignment.id,
+                        "choice": self.brussels.id,
+                        "question": self.whats_the_capital_of_belgium.id,
+                    },
+                    {
+                        "id": self.bob_biology_answer.id,
+                        "assignment": self.bob_biology_assignment.id,
+                        "question": self.which_is_mammal.id,
+                        "choice": self.crocodile.id,
+                    },
+                ]
+            ),
         )
 
     def test_get_answer(self):
@@ -480,6 +766,61 @@ class AnswerViewSetTests(BaseTestCase):
             exclude_regex_paths=[r"root\['id'\]"],
         )
 
+    def test_create_answer_retried(self):
+        answer = {
+            "assignment": self.bob_geography_assignment.id,
+            "choice": self.belgium.id,
+        }
+        self._create_answer(answer, user=self.bob_quizzee)
+        response = self._create_answer(answer, user=self.bob_quizzee)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            models.Answer.objects.filter(
+                assignment=self.bob_geography_assignment, choice=self.belgium
+            ).count(),
+            1,
+        )
+        self.assertEqual(self.bob_geography_assignment.result.progress, 100.0)
+
+    def test_create_answer_retry_costs_one_query(self):
+        answer = {
+            "assignment": self.bob_geography_assignment.id,
+            "choice": self.belgium.id,
+        }
+        self._create_answer(answer, user=self.bob_quizzee)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._create_answer(answer, user=self.bob_quizzee)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        # Beyond the authentication: no insert and no refresh of the result.
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in queries.captured_queries
+                    if "quiz_assignment" in query["sql"]
+                    or "quiz_answer" in query["sql"]
+                ]
+            ),
+            1,
+        )
+
+    def test_attempt_create_answer_for_other_users_assignment(self):
+        response = self._create_answer(
+            {
+                "assignment": self.alice_geography_assignment.id,
+                "choice": self.belgium.id,
+            },
+            user=self.bob_quizzee,
+        )
+        self._assert_response(
+            response,
+            status.HTTP_400_BAD_REQUEST,
+            {"assignment": ["The assignment does not exist."]},
+        )
+
     def test_attempt_create_answer_with_invalid_choice(self):
         response = self._create_answer(
             {"assignment": self.bob_geography_assignment.id, "choice": self.whale.id},
@@ -509,6 +850,118 @@ class AnswerViewSetTests(BaseTestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_create_answer_sheet(self):
+        response = self._create_answer_sheet(
+            {
+                "assignment": self.bob_geography_assignment.id,
+                "answers": [
+                    {
+                        "question": self.whats_the_capital_of_belgium.id,
+                        "choices": [self.amsterdam.id],
+                    },
+                    {
+                        "question": self.which_are_european_countries.id,
+                        "choices": [self.belgium.id, self.switzerland.id],
+                    },
+                ],
+            },
+            user=self.bob_quizzee,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(
+                models.Answer.objects.filter(
+                    assignment=self.bob_geography_assignment
+                ).values_list("choice_id", flat=True)
+            ),
+            {self.amsterdam.id, self.belgium.id, self.switzerland.id},
+        )
+        self.assertEqual(
+            models.AssignmentResult.objects.get(
+                assignment=self.bob_geography_assignment
+            ).score,
+            50.0,
+        )
+
+    def test_create_answer_sheet_constant_number_of_queries(self):
+        questions = add_questions(self.geography_quiz, self.geography_quizzer, 50)
+        choices = {
+            choice.question_id: choice.id
+            for choice in models.Choice.objects.filter(question__in=questions)
+        }
+
+        def sheet(count):
+            return {
+                "assignment": self.alice_geography_assignment.id,
+                "answers": [
+                    {"question": question.id, "choices": [choices[question.id]]}
+                    for question in questions[:count]
+                ],
+            }
+
+        self._create_answer_sheet(sheet(1), user=self.alice_quizzee)
+        with CaptureQueriesContext(connection) as before:
+            self._create_answer_sheet(sheet(2), user=self.alice_quizzee)
+        with CaptureQueriesContext(connection) as after:
+            response = self._create_answer_sheet(sheet(50), user=self.alice_quizzee)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            models.Answer.objects.filter(
+                assignment=self.alice_geography_assignment
+            ).count(),
+            51,
+        )
+        self.assertEqual(len(after), len(before))
+
+    def test_attempt_create_answer_sheet_with_invalid_choice(self):
+        response = self._create_answer_sheet(
+            {
+                "assignment": self.bob_geography_assignment.id,
+                "answers": [
+                    {
+                        "question": self.whats_the_capital_of_belgium.id,
+                        "choices": [self.brussels.id],
+                    },
+                    {
+                        "question": self.which_are_european_countries.id,
+                        "choices": [self.brussels.id],
+                    },
+                ],
+            },
+            user=self.bob_quizzee,
+        )
+        self._assert_response(
+            response,
+            status.HTTP_400_BAD_REQUEST,
+            {
+                "answers": [
+                    {},
+                    {
+                        "choices": [
+                            "The choice is not an valid answer to the assignment's quiz."
+                        ]
+                    },
+                ]
+            },
+        )
+
+    def test_attempt_create_answer_sheet_for_submitted_assignment(self):
+        response = self._create_answer_sheet(
+            {
+                "assignment": self.alice_submitted_assignment.id,
+                "answers": [
+                    {"question": self.which_is_mammal.id, "choices": [self.whale.id]}
+                ],
+            },
+            user=self.alice_quizzee,
+        )
+        self._assert_response(
+            response,
+            status.HTTP_400_BAD_REQUEST,
+            {"assignment": ["The assigment has already been submitted."]},
+        )
+
     def _get_answers(self, parameters=None, user=None):
         return self._get("answers-list", parameters=parameters, user=user)
 
@@ -522,3 +975,6 @@ class AnswerViewSetTests(BaseTestCase):
 
     def _create_answer(self, answer, user=None):
         return self._post("answers-list", answer, user=user)
+
+    def _create_answer_sheet(self, sheet, user=None):
+        return self._post("answers-bulk", sheet, user=user)
@@ -1,25 +1,51 @@
 import json
 import logging
-from typing import List, Union
+from typing import Any, Dict, List, Union
 
 from deepdiff import DeepDiff
+from django.core.cache import cache
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.response import Response
 from rest_framework.test import APITestCase
 
-from quiz import models
+from quiz import answer_buffer, answer_keys, authentication, leaderboards, models
 
 from . import factories
 
 logger = logging.getLogger(__name__)
 
 
+def add_questions(
+    quiz: models.Quiz, user: models.User, count: int, choices: int = 3
+) -> List[models.Question]:
+    questions = models.Question.objects.bulk_create(
+        [models.Question(text=f"Question {index}", user=user) for index in range(count)]
+    )
+    models.Choice.objects.bulk_create(
+        [
+            models.Choice(
+                question=question, text=f"Choice {index}", is_correct=index == 0
+            )
+            for question in questions
+            for index in range(choices)
+        ]
+    )
+    quiz.questions.add(*questions)
+    return questions
+
+
 class BaseTestCase(APITestCase):
 
     maxDiff = None
 
     def setUp(self):
+        answer_keys.clear()
+        answer_buffer.clear()
+        authentication.clear()
+        leaderboards.clear()
+        cache.clear()
+
         self.geography_quizzer = factories.UserFactory(
             username="geography_quizzer", is_quizzer=True
         )
@@ -193,6 +219,10 @@ class BaseTestCase(APITestCase):
     def _get_content(self, response: Response) -> Union[List[dict], dict]:
         return json.loads(response.content.decode("utf-8"))
 
+    @staticmethod
+    def _page(results: List[dict], next_url: Union[str, None] = None) -> Dict[str, Any]:
+        return {"next": next_url, "previous": None, "results": results}
+
     @staticmethod
     def _log_response(response: Response) -> None:
         logger.debug(
@@ -0,0 +1,199 @@
+"""
+Per-request timing breakdown, sent as a `Server-Timing` header and logged as a JSON line (logger `quiz.timing`).
+
+`ServerTimingMiddleware` counts and times every query (with `execute_wrapper`) and `BaseViewSet` times its phases
+with `measure()`: authentication (`auth`), permission checks (`perm`), serialization (`serialize`) and rendering
+(`render`). The database time spent inside each phase is reported along with it, e.g.
+
+    Server-Timing: auth;dur=0.9, perm;dur=0.1, serialize;dur=14.2;desc="3 queries in 11.8ms",
+        render;dur=2.4, db;dur=13.5;desc="6 queries", total;dur=21.7
+"""
+
+import json
+import logging
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+PHASES = ["auth", "perm", "serialize", "render"]
+
+
+class Timings:
+
+    def __init__(self):
+        self.durations: Dict[str, float] = defaultdict(float)
+        self.db_durations: Dict[str, float] = defaultdict(float)
+        self.query_counts: Dict[str, int] = defaultdict(int)
+        self._phases: List[str] = []
+        self._wrappers = ExitStack()
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        self._phases.append(phase)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[phase] += time.perf_counter() - started
+            self._phases.pop()
+
+    def capture_queries(self) -> None:
+        """
+        Wraps the queries of the connections of the current thread until `release_queries` is called.
+        """
+        for connection in connections.all():
+            self._wrappers.enter_context(connection.execute_wrapper(self._execute))
+
+    def release_queries(self) -> None:
+        self._wrappers.close()
+
+    def _execute(self, execute, sql, params, many, context):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            for phase in ["db"] + self._phases[-1:]:
+                self.db_durations[phase] += duration
+                self.query_counts[phase] += 1
+
+    def header(self, total: float) -> str:
+        metrics = []
+        for phase in PHASES:
+            if phase not in self.durations:
+                continue
+            metric = f"{phase};dur={_ms(self.durations[phase])}"
+            if self.query_counts[phase]:
+                metric += (
+                    f';desc="{self.query_counts[phase]} queries in '
+                    f'{_ms(self.db_durations[phase])}ms"'
+                )
+            metrics.append(metric)
+        metrics.append(
+            f'db;dur={_ms(self.db_durations["db"])};desc="{self.query_counts["db"]} queries"'
+        )
+        metrics.append(f"total;dur={_ms(total)}")
+        return ", ".join(metrics)
+
+    def record(self, total: float) -> Dict[str, Any]:
+        record: Dict[str, Any] = {"total_ms": _ms(total)}
+        for phase in PHASES:
+            if phase in self.durations:
+                record[f"{phase}_ms"] = _ms(self.durations[phase])
+                record[f"{phase}_db_ms"] = _ms(self.db_durations[phase])
+                record[f"{phase}_queries"] = self.query_counts[phase]
+        record["db_ms"] = _ms(self.db_durations["db"])
+        record["queries"] = self.query_counts["db"]
+        return record
+
+
+_current: ContextVar[Optional[Timings]] = ContextVar("timings", default=None)
+
+
+def active() -> bool:
+    return _current.get() is not None
+
+
+def measure(phase: str) -> ContextManager[None]:
+    """
+    Times the block as the given phase of the current request (a no-op outside of `ServerTimingMiddleware`).
+    """
+    timings = _current.get()
+    return nullcontext() if timings is None else timings.measure(phase)
+
+
+def timed(phase: str, function: Callable) -> Callable:
+    def wrapper(*args, **kwargs):
+        with measure(phase):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+class ServerTimingMiddleware:
+    """
+    Enabled with `SERVER_TIMING`, or with `METRICS_DIR` only to count the queries of `quiz.metrics` (as
+    `request.timings`). Also serves the async views, whose queries run in a thread (the one running the request's
+    thread-sensitive code), where their wrapper is installed.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.SERVER_TIMING and not settings.METRICS_DIR:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings = request.timings = Timings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        timings.capture_queries()
+        try:
+            response = self.get_response(request)
+        finally:
+            timings.release_queries()
+            _current.reset(token)
+        return self._finish(request, response, timings, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        timings = request.timings = Timings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        await sync_to_async(timings.capture_queries)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(timings.release_queries)()
+            _current.reset(token)
+        return self._finish(request, response, timings, time.perf_counter() - started)
+
+    @staticmethod
+    def _finish(request, response, timings: Timings, total: float):
+        if not settings.SERVER_TIMING:
+            return response
+        response["Server-Timing"] = timings.header(total)
+        record = {
+            **view_tags(request),
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            **timings.record(total),
+        }
+        logger.info(json.dumps(record), extra={"timing": record})
+        return response
+
+
+def view_tags(request) -> Dict[str, Optional[str]]:
+    """
+    The viewset and action (or the view function) which handled the request.
+    """
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return {"viewset": None, "action": None}
+    view = match.func
+    if hasattr(view, "cls") and getattr(view, "actions", None):
+        return {
+            "viewset": view.cls.__name__,
+            "action": view.actions.get(request.method.lower()),
+        }
+    return {"viewset": None, "action": getattr(view, "__name__", None)}
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
@@ -9,4 +9,7 @@ router.register(r"assignments", views.AssignmentViewSet, basename="assignments")
 router.register(r"answers", views.AnswerViewSet, basename="answers")
 router.register(r"", views.QuizViewSet, basename="quizzes")
 
-urlpatterns = [path("", include(router.urls))]
+urlpatterns = [
+    path("auth/token/", views.TokenView.as_view(), name="auth-token"),
+    path("", include(router.urls)),
+]
@@ -1,13 +1,65 @@
+import hashlib
+from contextvars import Token
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.http import StreamingHttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework import mixins
+from rest_framework import exceptions, mixins
 from rest_framework import permissions as drf_permissions
-from rest_framework import viewsets
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from . import (
+    analytics,
+    answer_buffer,
+    authentication,
+    db_routers,
+    exporters,
+    importers,
+    item_analysis,
+    leaderboards,
+    models,
+    pagination,
+    payloads,
+    permissions,
+    results,
+    serializers,
+    timing,
+)
+
+DEFAULT_LEADERBOARD_TOP = 10
+
+MAX_LEADERBOARD_TOP = 100
+
+
+class QueryPlan(NamedTuple):
+    select_related: Tuple[str, ...] = ()
+    prefetch_related: Tuple[str, ...] = ()
+
+
+class CacheValidators(NamedTuple):
+    etag: str
+    last_modified: Optional[int]
+
+
+class NotModified(Exception):
+    """
+    Short-circuits the handler of a conditional GET whose validators match (see `BaseViewSet.initial`).
+    """
 
-from . import models, permissions, serializers
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
 
 
 class BaseViewSet(
@@ -20,7 +72,153 @@ class BaseViewSet(
     TODO: Add implementations for update and delete.
     """
 
-    pass
+    pagination_class = pagination.CursorPagination
+    query_plans: Dict[type, QueryPlan] = {}
+    last_modified_fields: Tuple[str, ...] = ("updated_at",)
+    # Actions which don't need the user's buffered answers to be flushed first (see `answer_buffer`).
+    buffered_actions: Tuple[str, ...] = ()
+    # Actions whose queries are served by the replica database, if any (see `db_routers`).
+    read_only_actions: Tuple[str, ...] = ("list", "retrieve")
+    cache_validators: Optional[CacheValidators] = None
+    read_only_token: Optional[Token] = None
+
+    def initial(self, request, *args, **kwargs):
+        """
+        Answers conditional GETs (`If-None-Match`/`If-Modified-Since`) of the list and retrieve actions with a 304
+        before anything is serialized, once the request has been authenticated and authorized. The user's buffered
+        answers, if any, are flushed beforehand so that they read their own writes, and the queries of read-only
+        actions are routed to the replica database from then on (until the response is finalized).
+        """
+        super().initial(request, *args, **kwargs)
+        if answer_buffer.enabled() and self.action not in self.buffered_actions:
+            answer_buffer.flush_user(request.user.id)
+        if self.action in self.read_only_actions:
+            self.read_only_token = db_routers.start_read_only()
+        if request.method not in ["GET", "HEAD"] or self.action not in [
+            "list",
+            "retrieve",
+        ]:
+            return
+        self.cache_validators = self.get_cache_validators()
+        if self.cache_validators is None:
+            return
+        response = get_conditional_response(
+            request,
+            etag=self.cache_validators.etag,
+            last_modified=self.cache_validators.last_modified,
+        )
+        if response is not None:
+            raise NotModified(response)
+
+    def perform_authentication(self, request):
+        with timing.measure("auth"):
+            super().perform_authentication(request)
+
+    def check_permissions(self, request):
+        with timing.measure("perm"):
+            super().check_permissions(request)
+
+    def check_object_permissions(self, request, obj):
+        with timing.measure("perm"):
+            super().check_object_permissions(request, obj)
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if timing.active():
+            # Times the representation only (`data` is built lazily, often by the handler or the paginator).
+            serializer.to_representation = timing.timed(
+                "serialize", serializer.to_representation
+            )
+        return serializer
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if self.read_only_token is not None:
+            db_routers.end_read_only(self.read_only_token)
+            self.read_only_token = None
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if isinstance(response, Response) and timing.active():
+            # Rendered here rather than by the response middleware, to be timed.
+            with timing.measure("render"):
+                response.render()
+        if self.cache_validators is not None and response.status_code in [200, 304]:
+            response["ETag"] = self.cache_validators.etag
+            if self.cache_validators.last_modified is not None:
+                response["Last-Modified"] = http_date(
+                    self.cache_validators.last_modified
+                )
+        return response
+
+    def get_cache_validators(self) -> Optional[CacheValidators]:
+        """
+        Computes the validators of the current list/retrieve response with a single aggregate query: the number of
+        rows, the highest ID (which catches deletions and insertions) and the latest of `last_modified_fields` (which
+        is also the `Last-Modified` of retrieve responses).
+        Returns `None` when the object to retrieve doesn't exist, letting the handler answer with a 404.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            try:
+                queryset = queryset.filter(
+                    **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+                )
+            except (TypeError, ValueError, ValidationError):
+                return None
+
+        state = queryset.aggregate(
+            count=Count("pk", distinct=True),
+            last_id=Max("pk"),
+            **{
+                f"last_modified_{index}": Max(field)
+                for index, field in enumerate(self.last_modified_fields)
+            },
+        )
+        if self.action == "retrieve" and not state["count"]:
+            return None
+
+        timestamps = [
+            state[f"last_modified_{index}"]
+            for index in range(len(self.last_modified_fields))
+            if state[f"last_modified_{index}"] is not None
+        ]
+        # Lists only get an ETag: rows inserted into a list (e.g. answers, or quizzes assigned to the user) don't
+        # advance its latest timestamp.
+        last_modified = (
+            int(max(timestamps).timestamp())
+            if timestamps and self.action == "retrieve"
+            else None
+        )
+
+        # The representation also depends on who is asking (quizzers and quizzees get different serializers), on the
+        # query string (pagination cursors, filters) and on the negotiated renderer/encoding.
+        representation = [
+            type(self).__name__,
+            self.get_serializer_class().__name__,
+            str(self.request.user.pk),
+            self.request.get_full_path(),
+            self.request.META.get("HTTP_ACCEPT", ""),
+            self.request.META.get("HTTP_ACCEPT_ENCODING", ""),
+            *(str(value) for value in state.values()),
+        ]
+        digest = hashlib.sha256("|".join(representation).encode("utf-8")).hexdigest()
+        return CacheValidators(f'"{digest[:32]}"', last_modified)
+
+    def plan_queryset(self, queryset):
+        """
+        Applies the select/prefetch plan declared for the serializer of the current action, so that nested
+        serializers don't hit the database once per row.
+        """
+        plan = self.query_plans.get(self.get_serializer_class())
+        if plan is None:
+            return queryset
+        return queryset.select_related(*plan.select_related).prefetch_related(
+            *plan.prefetch_related
+        )
 
 
 class QuestionViewSet(BaseViewSet):
@@ -30,17 +228,52 @@ class QuestionViewSet(BaseViewSet):
         permissions.IsQuizzer | permissions.IsQuizzeeReader,  # type: ignore
     ]
 
+    # The detail representation embeds the question's quizzes.
+    last_modified_fields = ("updated_at", "quizzes__updated_at")
+
+    query_plans = {
+        serializers.QuestionListSerializer: QueryPlan(prefetch_related=("quizzes",)),
+        serializers.QuestionQuizzerDetailSerializer: QueryPlan(
+            prefetch_related=("choices", "quizzes")
+        ),
+    }
+
     def get_queryset(self):
         user = self.request.user
-        return models.Question.objects.filter(user=user)
+        return self.plan_queryset(models.Question.objects.filter(user=user))
 
     def get_serializer_class(self):
         if self.action == "create":
             return serializers.QuestionCreateSerializer
+        if self.action == "import_questions":
+            return serializers.QuestionImportSerializer
         if self.action == "list":
             return serializers.QuestionListSerializer
         return serializers.QuestionQuizzerDetailSerializer
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+    )
+    def import_questions(self, request):
+        """
+        Imports a question bank (NDJSON, CSV or GIFT file), optionally adding the questions to a quiz.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        report = importers.import_questions(
+            serializer.validated_data["file"],
+            serializer.validated_data["format"],
+            request.user,
+            quiz=serializer.validated_data.get("quiz"),
+        )
+        return Response(
+            report._asdict(),
+            status=status.HTTP_201_CREATED if report.created else status.HTTP_200_OK,
+        )
+
 
 class QuizViewSet(BaseViewSet):
 
@@ -49,21 +282,143 @@ class QuizViewSet(BaseViewSet):
         permissions.IsQuizzer | permissions.IsQuizzeeReader,  # type: ignore
     ]
 
+    read_only_actions = (
+        "list",
+        "retrieve",
+        "analytics",
+        "item_analysis",
+        "leaderboard",
+    )
+
+    query_plans = {
+        serializers.QuizQuizzerDetailSerializer: QueryPlan(
+            prefetch_related=("questions__choices", "questions__quizzes")
+        ),
+    }
+
+    # The serializers of the actions which serialize the same way for quizzers and quizzees.
+    action_serializers = {
+        "create": serializers.QuizCreateSerializer,
+        "list": serializers.QuizListSerializer,
+        "analytics": serializers.QuizAnalyticsSerializer,
+        "item_analysis": serializers.QuizItemAnalysisSerializer,
+        "leaderboard": serializers.QuizLeaderboardSerializer,
+    }
+
     def get_queryset(self):
         user = self.request.user
         if user.is_quizzer:
-            return models.Quiz.objects.filter(user=user)
-        return models.Quiz.objects.filter(assignments__user=user)
+            return self.plan_queryset(models.Quiz.objects.filter(user=user))
+        return self.plan_queryset(
+            models.Quiz.objects.filter(assignments__user=user).distinct()
+        )
 
     def get_serializer_class(self):
-        if self.action == "create":
-            return serializers.QuizCreateSerializer
-        if self.action == "list":
-            return serializers.QuizListSerializer
+        if self.action in self.action_serializers:
+            return self.action_serializers[self.action]
         if self.request.user.is_quizzer:
             return serializers.QuizQuizzerDetailSerializer
         return serializers.QuizQuizzeeDetailSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        if request.user.is_quizzer:
+            return super().retrieve(request, *args, **kwargs)
+        return payloads.quiz_response(request, self.get_object())
+
+    @action(detail=True, methods=["get"])
+    def analytics(self, request, pk=None):
+        """
+        How many submitted assignments selected each choice of each question, and how many got each question fully
+        right.
+        """
+        # pylint: disable=unused-argument
+        serializer = self.get_serializer(
+            analytics.choice_distribution(self.get_object())
+        )
+        return Response(serializer.data)
+
+    @action(detail=True, methods=["get"], url_path="item-analysis")
+    def item_analysis(self, request, pk=None):
+        """
+        Difficulty index, discrimination (point-biserial) and distractor analysis of each question, computed over
+        the submitted assignments.
+        """
+        # pylint: disable=unused-argument
+        serializer = self.get_serializer(item_analysis.item_analysis(self.get_object()))
+        return Response(serializer.data)
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "top",
+                openapi.IN_QUERY,
+                description=f"Number of entries (up to {MAX_LEADERBOARD_TOP})",
+                type=openapi.TYPE_INTEGER,
+                default=DEFAULT_LEADERBOARD_TOP,
+            ),
+            openapi.Parameter(
+                "user_id",
+                openapi.IN_QUERY,
+                description="User whose rank to return",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+    )
+    @action(detail=True, methods=["get"])
+    def leaderboard(self, request, pk=None):
+        """
+        The best scores of the quiz's assignments (submitted or not) and the rank of a user's best assignment, as of
+        now.
+        """
+        # pylint: disable=unused-argument
+        top = _integer_param(request, "top")
+        if top is None:
+            top = DEFAULT_LEADERBOARD_TOP
+        if not 1 <= top <= MAX_LEADERBOARD_TOP:
+            raise exceptions.ValidationError(
+                {"top": f"Expected a number between 1 and {MAX_LEADERBOARD_TOP}."}
+            )
+        user_id = _integer_param(request, "user_id")
+        serializer = self.get_serializer(
+            leaderboards.leaderboard(self.get_object(), top, user_id)
+        )
+        return Response(serializer.data)
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "file_format",
+                openapi.IN_QUERY,
+                description="Format of the export",
+                type=openapi.TYPE_STRING,
+                enum=exporters.FORMATS,
+                default="csv",
+            ),
+        ],
+        responses={200: "The results, one row per assignment."},
+    )
+    @action(detail=True, methods=["get"])
+    def export(self, request, pk=None):
+        """
+        Streams the results of the quiz (user, submission, score, progress and selected choices per question of each
+        assignment) as CSV or NDJSON.
+        """
+        # pylint: disable=unused-argument
+        file_format = request.query_params.get("file_format", "csv")
+        if file_format not in exporters.FORMATS:
+            raise exceptions.ValidationError(
+                {"file_format": f"Expected one of: {', '.join(exporters.FORMATS)}."}
+            )
+        quiz = self.get_object()
+        response = StreamingHttpResponse(
+            exporters.export_results(quiz, file_format),
+            content_type=exporters.CONTENT_TYPES[file_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="quiz-{quiz.id}-results.{file_format}"'
+        )
+        return response
+
 
 class AssignmentViewSet(BaseViewSet):
     # pylint: disable=unused-argument
@@ -75,6 +430,24 @@ class AssignmentViewSet(BaseViewSet):
         | permissions.IsQuizzeeSubmiter,  # type: ignore
     ]
 
+    last_modified_fields = ("submited_at", "result__updated_at", "quiz__updated_at")
+
+    query_plans = {
+        serializers.AssignmentListQuizzerSerializer: QueryPlan(
+            select_related=("user", "quiz", "result")
+        ),
+        serializers.AssignmentListQuizzeeSerializer: QueryPlan(
+            select_related=("quiz", "result")
+        ),
+        serializers.AssignmentQuizzerDetailSerializer: QueryPlan(
+            select_related=("user", "quiz"),
+            prefetch_related=("quiz__questions__choices", "quiz__questions__quizzes"),
+        ),
+        serializers.AssignmentQuizzeeDetailSerializer: QueryPlan(
+            select_related=("quiz",)
+        ),
+    }
+
     def get_queryset(self):
         user = self.request.user
         assignments = (
@@ -82,11 +455,13 @@ class AssignmentViewSet(BaseViewSet):
             if user.is_quizzer
             else models.Assignment.objects.filter(user=user)
         )
-        return self._filter_by_query_params(assignments)
+        return self._filter_by_query_params(self.plan_queryset(assignments))
 
     def get_serializer_class(self):
         if self.action == "create":
             return serializers.AssignmentCreateSerializer
+        if self.action == "bulk":
+            return serializers.AssignmentBulkCreateSerializer
         if self.action == "list":
             if self.request.user.is_quizzer:
                 return serializers.AssignmentListQuizzerSerializer
@@ -102,6 +477,8 @@ class AssignmentViewSet(BaseViewSet):
             for key in ["quiz_id", "user_id"]
             if key in self.request.query_params
         }
+        if self.request.query_params.get("pending") in ["1", "true"]:
+            filters["submited_at__isnull"] = True
         return assignments.filter(**filters)
 
     @swagger_auto_schema(
@@ -118,17 +495,47 @@ class AssignmentViewSet(BaseViewSet):
                 description="Filter by Quiz's ID ",
                 type=openapi.TYPE_STRING,
             ),
+            openapi.Parameter(
+                "pending",
+                openapi.IN_QUERY,
+                description="Only assignments which haven't been submitted yet",
+                type=openapi.TYPE_BOOLEAN,
+            ),
         ]
     )
     def list(self, request, *args, **kwargs):
-        return super().list(request, args, kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        assignments = list(queryset if page is None else page)
+        results.ensure_results(assignments)
+        serializer = self.get_serializer(assignments, many=True)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
+
+    def retrieve(self, request, *args, **kwargs):
+        if request.user.is_quizzer:
+            return super().retrieve(request, *args, **kwargs)
+        return payloads.assignment_response(self.get_object())
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """
+        Assigns a quiz to many quizzees (a list of user ID's or a group name) at once.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @action(detail=True, methods=["post"])
     def submit(self, request, pk=None):
         assignment = self.get_object()
+        answer_buffer.flush(assignment_ids=[assignment.id])
         assignment.submited_at = timezone.now()
         assignment.save(update_fields=["submited_at"])
-        return Response(serializers.AssignmentQuizzeeDetailSerializer(assignment).data)
+        results.refresh_results([assignment.id])
+        return payloads.assignment_response(assignment)
 
 
 class AnswerViewSet(BaseViewSet):
@@ -138,13 +545,77 @@ class AnswerViewSet(BaseViewSet):
         permissions.IsQuizzee | permissions.IsQuizzerReader,  # type: ignore
     ]
 
+    # Answers are never updated (only created or deleted, which the row count and highest ID already capture), but
+    # their detail representation embeds the question.
+    last_modified_fields = ("choice__question__updated_at",)
+
+    buffered_actions = ("create",)
+
+    query_plans = {
+        serializers.AnswerListSerializer: QueryPlan(select_related=("choice",)),
+        serializers.AnswerDetailSerializer: QueryPlan(
+            select_related=("choice__question",),
+            prefetch_related=("choice__question__choices",),
+        ),
+    }
+
     def get_queryset(self):
         user = self.request.user
-        return models.Answer.objects.filter(assignment__user=user)
+        return self.plan_queryset(models.Answer.objects.filter(assignment__user=user))
 
     def get_serializer_class(self):
         if self.action == "create":
             return serializers.AnswerCreateSerializer
+        if self.action == "bulk":
+            return serializers.AnswerSheetSerializer
         if self.action == "list":
             return serializers.AnswerListSerializer
         return serializers.AnswerDetailSerializer
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """
+        Creates/replaces the answers to multiple questions of an assignment at once.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+
+class TokenView(APIView):
+
+    permission_classes = [drf_permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={
+            200: openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "token": openapi.Schema(type=openapi.TYPE_STRING),
+                    "expires_in": openapi.Schema(type=openapi.TYPE_INTEGER),
+                },
+            )
+        }
+    )
+    def post(self, request):
+        """
+        Issues a signed token for the authenticated user, to be sent as `Authorization: Token <token>`. Tokens expire
+        after `AUTH_TOKEN_MAX_AGE` seconds or as soon as the user's password changes.
+        """
+        return Response(
+            {
+                "token": authentication.issue_token(request.user),
+                "expires_in": settings.AUTH_TOKEN_MAX_AGE,
+            }
+        )
+
+
+def _integer_param(request, name: str) -> Optional[int]:
+    value = request.query_params.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError as error:
+        raise exceptions.ValidationError({name: "Expected an integer."}) from error